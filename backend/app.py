@@ -9,39 +9,102 @@ This is the entry point that:
 
 import os
 import sys
+import logging
 import subprocess
 import platform
+import shutil
+import stat
+import threading
+import time
+import zlib
 import mimetypes
-import urllib.parse
+from urllib.parse import quote_from_bytes
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Optional
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI, File, Form, HTTPException, Query, UploadFile
+from fastapi import FastAPI, File, Form, HTTPException, Query, Request, UploadFile
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import (
+    FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse,
+)
 from pydantic import BaseModel
-
-from backend.file_browser import FileBrowser
-from backend.archive_inspector import ArchiveInspector
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import Receive, Scope, Send
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from backend.file_browser import FileBrowser, BrowseResult
+from backend.archive_inspector import (
+    EXTRACT_TEMP_ROOT, MEMBER_OPEN_ERRORS, ArchiveInspector,
+    close_archive_handles,
+)
 from backend.export_manager import ExportManager
 from backend.fbx_converter import get_fbx_version, convert_fbx_to_obj
 
+logger = logging.getLogger(__name__)
+
 
 # --- Configuration ---
 
 # Default browse root: user's home directory
 DEFAULT_ROOT = str(Path.home())
 
-# Register additional MIME types for 3D files
-mimetypes.add_type("model/obj", ".obj")
-mimetypes.add_type("model/fbx", ".fbx")
-mimetypes.add_type("model/mtl", ".mtl")
-mimetypes.add_type("model/gltf+json", ".gltf")
-mimetypes.add_type("model/gltf-binary", ".glb")
-mimetypes.add_type("model/stl", ".stl")
-mimetypes.add_type("model/gltf-binary", ".glb")
+# Optional allow-list for file-serving endpoints. MESHVAULT_ROOTS is an
+# os.pathsep-separated list of directories; when set, only files under
+# those roots (plus the directory used for archive extraction) are served.
+# Resolved once at startup so each request costs one realpath + prefix test.
+_roots_env = os.environ.get("MESHVAULT_ROOTS", "")
+ALLOWED_ROOTS: Optional[tuple[str, ...]] = (
+    tuple(
+        os.path.join(os.path.realpath(p), "")
+        for p in [
+            *_roots_env.split(os.pathsep),
+            EXTRACT_TEMP_ROOT,
+        ]
+        if p
+    )
+    if _roots_env.strip()
+    else None
+)
+
+# Content types for the files the viewer actually requests (3D models,
+# materials, textures). A flat dict lookup avoids mimetypes.guess_type on
+# every file response; anything else falls back to the mimetypes table.
+CONTENT_TYPES = {
+    ".obj": "model/obj",
+    ".fbx": "model/fbx",
+    ".mtl": "model/mtl",
+    ".gltf": "model/gltf+json",
+    ".glb": "model/gltf-binary",
+    ".stl": "model/stl",
+    ".bin": "application/octet-stream",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".tga": "image/x-tga",
+    ".bmp": "image/bmp",
+    ".tif": "image/tiff",
+    ".tiff": "image/tiff",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
+
+def _content_type(file_path: Path) -> str:
+    """Return the Content-Type for a served file."""
+    content_type = CONTENT_TYPES.get(file_path.suffix.lower())
+    if content_type is None:
+        content_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+    return content_type
 
 
 # --- Pydantic models for API ---
@@ -78,32 +141,239 @@ archive_inspector = ArchiveInspector()
 file_browser = FileBrowser()
 export_manager = ExportManager()
 
+# Memoized FBX conversion results, an LRU of FBX_CACHE_MAXSIZE entries:
+# (path, mtime_ns, size) -> (serve_path, ext)
+FBX_CACHE_MAXSIZE = 1024
+_fbx_cache: "OrderedDict[tuple[str, int, int], tuple[Path, str]]" = OrderedDict()
+_fbx_cache_lock = threading.Lock()
+
+# FBX header versions, same LRU bound:
+# (path, mtime_ns) -> version (None if not a valid FBX).
+# Survives obj_path being deleted, so re-conversion skips the header read.
+_fbx_version_cache: "OrderedDict[tuple[str, int], Optional[int]]" = OrderedDict()
+
+# Short-lived directory listing cache: path -> (timestamp, dir mtime_ns, result).
+# The directory mtime catches entries being added/removed/renamed; the TTL
+# bounds staleness for in-place file changes that don't touch the directory.
+BROWSE_CACHE_TTL = 2.0
+BROWSE_CACHE_MAXSIZE = 256
+_browse_cache: "OrderedDict[str, tuple[float, int, BrowseResult]]" = OrderedDict()
+_browse_cache_lock = threading.Lock()
+
+
+def _cached_browse(path: str) -> BrowseResult:
+    """Return file_browser.browse(path), reusing a recent unchanged listing."""
+    # Surface stat failures as the errors browse() itself raises, so the
+    # endpoint answers 404/403 instead of a 500
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Directory not found: {path}") from None
+    except PermissionError:
+        raise ValueError(f"Access denied: {path}") from None
+    now = time.monotonic()
+    with _browse_cache_lock:
+        cached = _browse_cache.get(path)
+        if (
+            cached is not None
+            and cached[1] == st.st_mtime_ns
+            and now - cached[0] < BROWSE_CACHE_TTL
+        ):
+            _browse_cache.move_to_end(path)
+            return cached[2]
+
+    result = file_browser.browse(path)
+
+    with _browse_cache_lock:
+        _browse_cache[path] = (now, st.st_mtime_ns, result)
+        _browse_cache.move_to_end(path)
+        while len(_browse_cache) > BROWSE_CACHE_MAXSIZE:
+            _browse_cache.popitem(last=False)
+    return result
+
+
+class ZeroCopyFileResponse(FileResponse):
+    """
+    FileResponse that hands the file descriptor to the ASGI server.
+
+    When the server advertises the ``http.response.zerocopysend`` extension,
+    the body (or a single requested byte range) is sent with one zero-copy
+    message so the kernel streams the file straight to the socket
+    (``sendfile(2)`` with an offset) instead of copying 64 KiB chunks
+    through Python. HEAD, multi-range and conditional-range requests, and
+    servers without the extension, fall back to Starlette's send, which
+    handles ranges with seek + bounded reads.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or "http.response.zerocopysend" not in scope.get("extensions", {})
+            or scope["method"].upper() == "HEAD"
+            or self.status_code != 200
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        if self.stat_result is None:
+            self.stat_result = await run_in_threadpool(os.stat, self.path)
+            self.set_stat_headers(self.stat_result)
+        file_size = self.stat_result.st_size
+
+        request_headers = Headers(scope=scope)
+        http_range = request_headers.get("range")
+        status = self.status_code
+        headers = self.raw_headers
+        offset, count = 0, file_size
+
+        if http_range is not None:
+            if request_headers.get("if-range") is not None:
+                await super().__call__(scope, receive, send)
+                return
+            try:
+                ranges = self._parse_range_header(http_range, file_size)
+            except Exception:
+                # Malformed/unsatisfiable: let Starlette build the 400/416
+                ranges = None
+            if ranges is None or len(ranges) != 1:
+                await super().__call__(scope, receive, send)
+                return
+            start, end = ranges[0]
+            offset, count = start, end - start
+            range_headers = MutableHeaders(raw=list(self.raw_headers))
+            range_headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
+            range_headers["content-length"] = str(count)
+            status, headers = 206, range_headers.raw
+
+        fd = await run_in_threadpool(os.open, self.path, os.O_RDONLY)
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": status,
+                "headers": headers,
+            })
+            await send({
+                "type": "http.response.zerocopysend",
+                "file": fd,
+                "offset": offset,
+                "count": count,
+                "more_body": False,
+            })
+        finally:
+            os.close(fd)
+
+        if self.background is not None:
+            await self.background()
+
+
+# Files are revalidated on every use ("no-cache") rather than never stored:
+# the ETag changes with mtime/size, so a repaired re-extraction (e.g. a
+# previously 0-byte archive member) is never served stale, while unchanged
+# textures come back as an empty 304.
+FILE_CACHE_HEADERS = {"Cache-Control": "no-cache"}
+
+
+def _make_etag(st: os.stat_result, salt: str = "") -> str:
+    """Build a weak validator from a file's mtime and size."""
+    tag = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+    if salt:
+        tag += f"-{zlib.crc32(salt.encode('utf-8')):x}"
+    return f'W/"{tag}"'
+
+
+def _is_not_modified(request: Optional[Request], etag: str) -> bool:
+    """True if the client's If-None-Match already covers this ETag."""
+    if request is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == wanted for tag in header.split(",")
+    )
+
+
+def _not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, **FILE_CACHE_HEADERS})
 
-def _build_file_response(file_path: Path) -> FileResponse:
+
+def _build_file_response(
+    file_path: Path,
+    request: Optional[Request] = None,
+    etag: Optional[str] = None,
+    st: Optional[os.stat_result] = None,
+) -> Response:
     """
-    Serve files with explicit no-cache headers.
+    Serve a file with a validator for conditional requests.
 
-    This prevents stale browser caching when an extracted temp file is repaired
-    (e.g., previously 0-byte archive extraction, then re-extracted correctly).
+    Returns 304 Not Modified when the client's If-None-Match matches the
+    ETag — by default derived from the file's current (mtime, size).
+    Pass ``st`` when the caller already stat'ed the file.
     """
-    content_type = mimetypes.guess_type(str(file_path))[0] or "application/octet-stream"
-    return FileResponse(
+    if st is None:
+        st = os.stat(file_path)
+    etag = etag or _make_etag(st)
+    if _is_not_modified(request, etag):
+        return _not_modified_response(etag)
+
+    return ZeroCopyFileResponse(
         path=str(file_path),
-        media_type=content_type,
+        media_type=_content_type(file_path),
         filename=file_path.name,
-        headers={
-            "Cache-Control": "no-store, max-age=0",
-            "Pragma": "no-cache",
-            "Expires": "0",
-        },
+        stat_result=st,
+        headers={"ETag": etag, "Accept-Ranges": "bytes", **FILE_CACHE_HEADERS},
     )
 
 
+def _check_allowed(path: str):
+    """
+    Raise 403 if a path lies outside ALLOWED_ROOTS (symlinks and ".."
+    resolved). A no-op when no allow-list is configured.
+    """
+    if ALLOWED_ROOTS is None:
+        return
+    real = os.path.realpath(path)
+    if not (real + os.sep).startswith(ALLOWED_ROOTS):
+        raise HTTPException(status_code=403, detail=f"Access denied: {path}")
+
+
+def _stat_regular_file(path: str) -> os.stat_result:
+    """Stat a path once; raise 404 unless it is an existing regular file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        raise HTTPException(status_code=404, detail=f"File not found: {path}")
+    if not stat.S_ISREG(st.st_mode):
+        raise HTTPException(status_code=404, detail=f"File not found: {path}")
+    return st
+
+
+def _json_response(content) -> Response:
+    """
+    Serialize JSON-compatible data or dataclasses straight to a response.
+
+    Skips FastAPI's jsonable_encoder pass and uses orjson's C encoder,
+    which serializes (slotted) dataclasses natively. Falls back to the
+    stdlib encoder, via dataclasses.asdict, if orjson is not installed.
+    """
+    if HAS_ORJSON:
+        return Response(content=orjson.dumps(content), media_type="application/json")
+    if is_dataclass(content):
+        content = asdict(content)
+    return JSONResponse(content=content)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle — clean up temp files on shutdown."""
     yield
     archive_inspector.cleanup()
+    clear_fbx_cache()
+    with _browse_cache_lock:
+        _browse_cache.clear()
 
 
 # --- FastAPI App ---
@@ -136,15 +406,28 @@ app.mount(
 
 # --- Routes ---
 
+# index.html bytes, re-read only when the file's mtime changes so editing
+# frontend/ still shows up on a browser refresh: (mtime_ns, content)
+_index_cache: Optional[tuple[int, bytes]] = None
+
+
 @app.get("/", response_class=HTMLResponse)
-async def root():
+def root():
     """Serve the main HTML page."""
+    global _index_cache
     index_path = frontend_dir / "index.html"
-    return HTMLResponse(content=index_path.read_text(encoding="utf-8"))
+    mtime_ns = index_path.stat().st_mtime_ns
+    if _index_cache is None or _index_cache[0] != mtime_ns:
+        _index_cache = (mtime_ns, index_path.read_bytes())
+    return Response(
+        content=_index_cache[1],
+        media_type="text/html; charset=utf-8",
+        headers={"Cache-Control": "no-cache"},
+    )
 
 
 @app.get("/api/browse")
-async def browse(path: Optional[str] = Query(default=None)):
+def browse(path: Optional[str] = Query(default=None)):
     """
     Browse a directory and return its contents.
 
@@ -154,51 +437,33 @@ async def browse(path: Optional[str] = Query(default=None)):
     browse_path = path or DEFAULT_ROOT
 
     try:
-        result = file_browser.browse(browse_path)
+        result = _cached_browse(browse_path)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
-    return {
-        "current_path": result.current_path,
-        "parent_path": result.parent_path,
-        "folders": [
-            {
-                "name": f.name,
-                "path": f.path,
-                "has_children": f.has_children,
-            }
-            for f in result.folders
-        ],
-        "assets": [
-            {
-                "name": a.name,
-                "path": a.path,
-                "extension": a.extension,
-                "size": a.size,
-                "is_in_archive": a.is_in_archive,
-                "archive_path": a.archive_path,
-                "inner_path": a.inner_path,
-                "related_files": a.related_files,
-            }
-            for a in result.assets
-        ],
-    }
+    # BrowseResult's fields (and its folders' and assets') are the
+    # response's keys, so the dataclasses are serialized as they are
+    return _json_response(result)
 
 
-def _maybe_convert_asset(file_path: Path) -> tuple[Path, str]:
+def _maybe_convert_asset(
+    file_path: Path, st: Optional[os.stat_result] = None
+) -> tuple[Path, str]:
     """
     Check if a file needs conversion before serving.
     Currently handles old FBX (version < 7000) → OBJ.
     """
     ext = file_path.suffix.lower()
     if ext == ".fbx":
-        return _maybe_convert_fbx(file_path)
+        return _maybe_convert_fbx(file_path, st)
     return file_path, ext
 
 
-def _maybe_convert_fbx(file_path: Path) -> tuple[Path, str]:
+def _maybe_convert_fbx(
+    file_path: Path, st: Optional[os.stat_result] = None
+) -> tuple[Path, str]:
     """
     Check if an FBX file needs conversion (version < 7000) and convert it.
 
@@ -210,22 +475,68 @@ def _maybe_convert_fbx(file_path: Path) -> tuple[Path, str]:
     if ext != ".fbx":
         return file_path, ext
 
-    version = get_fbx_version(str(file_path))
+    if st is None:
+        st = file_path.stat()
+    key = (str(file_path), st.st_mtime_ns, st.st_size)
+    with _fbx_cache_lock:
+        cached = _fbx_cache.get(key)
+        if cached is not None:
+            _fbx_cache.move_to_end(key)
+    # A converted OBJ may have been deleted since; recompute in that case
+    if cached is not None and (cached[0] == file_path or cached[0].exists()):
+        return cached
+
+    result = _convert_fbx_uncached(file_path, ext, st)
+    with _fbx_cache_lock:
+        _fbx_cache[key] = result
+        _fbx_cache.move_to_end(key)
+        while len(_fbx_cache) > FBX_CACHE_MAXSIZE:
+            _fbx_cache.popitem(last=False)
+    return result
+
+
+def _convert_fbx_uncached(
+    file_path: Path, ext: str, st: os.stat_result
+) -> tuple[Path, str]:
+    """Probe the FBX version and convert to OBJ when required."""
+    obj_path = file_path.with_suffix(".converted.obj")
+    if obj_path.exists():
+        # A previous run already converted this file — skip the header probe
+        return obj_path, ".obj"
+
+    version_key = (str(file_path), st.st_mtime_ns)
+    with _fbx_cache_lock:
+        known = version_key in _fbx_version_cache
+        version = _fbx_version_cache.get(version_key)
+        if known:
+            _fbx_version_cache.move_to_end(version_key)
+    if not known:
+        version = get_fbx_version(str(file_path))
+        with _fbx_cache_lock:
+            _fbx_version_cache[version_key] = version
+            _fbx_version_cache.move_to_end(version_key)
+            while len(_fbx_version_cache) > FBX_CACHE_MAXSIZE:
+                _fbx_version_cache.popitem(last=False)
     if version is not None and version < 7000:
         # FBX version too old for Three.js — convert to OBJ
-        obj_path = file_path.with_suffix(".converted.obj")
-        if not obj_path.exists():
-            success = convert_fbx_to_obj(str(file_path), str(obj_path))
-            if not success:
-                # Conversion failed — let the frontend try anyway
-                return file_path, ext
+        success = convert_fbx_to_obj(str(file_path), str(obj_path))
+        if not success:
+            # Conversion failed — let the frontend try anyway
+            return file_path, ext
         return obj_path, ".obj"
 
     return file_path, ext
 
 
+def clear_fbx_cache():
+    """Forget memoized FBX conversion results."""
+    with _fbx_cache_lock:
+        _fbx_cache.clear()
+        _fbx_version_cache.clear()
+
+
 @app.get("/api/asset/file")
-async def serve_asset_file(path: str = Query(...)):
+def serve_asset_file(request: Request, path: str = Query(...)):
     """
     Serve a 3D asset file for the viewer.
 
@@ -233,26 +544,76 @@ async def serve_asset_file(path: str = Query(...)):
     - .blend → .glb via Blender CLI
     - .fbx (version < 7000) → .obj via built-in parser
     """
+    _check_allowed(path)
+    st = _stat_regular_file(path)
     file_path = Path(path)
-    if file_path.exists() and file_path.is_file():
-        # Auto-convert if needed (blend→glb, old fbx→obj)
-        serve_path, _ = _maybe_convert_asset(file_path)
-        return _build_file_response(serve_path)
 
-    raise HTTPException(status_code=404, detail=f"File not found: {path}")
+    # Auto-convert if needed (blend→glb, old fbx→obj)
+    serve_path, _ = _maybe_convert_asset(file_path, st)
+    if serve_path == file_path:
+        return _build_file_response(file_path, request, st=st)
+    return _build_file_response(serve_path, request)
+
+
+ARCHIVE_STREAM_CHUNK = 64 * 1024
+
+# Chunk size for writing uploaded GLB exports to disk
+UPLOAD_COPY_BUFFER = 1024 * 1024
+
+
+def _iter_member(member):
+    """Yield an open archive member in fixed-size chunks, then close it."""
+    with member:
+        while True:
+            chunk = member.read(ARCHIVE_STREAM_CHUNK)
+            if not chunk:
+                break
+            yield chunk
 
 
 @app.get("/api/asset/archive")
-async def serve_archive_asset(
+def serve_archive_asset(
+    request: Request,
     archive_path: str = Query(...),
     inner_path: str = Query(...),
 ):
     """
-    Extract and serve a 3D asset from an archive.
+    Serve a 3D asset from an archive.
 
-    Extracts the asset (and related files) to a temp directory,
-    then serves the main asset file.
+    ZIP and RAR members are decompressed straight into the response body.
+    Other formats are extracted (with related files) to a temp directory
+    and served from there. Use /api/asset/prepare_archive when related
+    files must exist on disk for the Three.js loaders.
     """
+    _check_allowed(archive_path)
+    try:
+        etag = _make_etag(os.stat(archive_path), salt=inner_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail=f"Archive not found: {archive_path}")
+    if _is_not_modified(request, etag):
+        return _not_modified_response(etag)
+
+    try:
+        member = archive_inspector.open_member(archive_path, inner_path)
+    except KeyError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{inner_path} not found in {archive_path}",
+        )
+    except MEMBER_OPEN_ERRORS as e:
+        logger.warning(
+            f"Streaming {inner_path} from {archive_path} failed, "
+            f"extracting instead: {e}"
+        )
+        member = None
+
+    if member is not None:
+        return StreamingResponse(
+            _iter_member(member),
+            media_type=_content_type(Path(inner_path)),
+            headers={"ETag": etag, **FILE_CACHE_HEADERS},
+        )
+
     extracted = archive_inspector.extract_asset(archive_path, inner_path)
     if extracted is None:
         raise HTTPException(
@@ -264,11 +625,11 @@ async def serve_archive_asset(
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Extracted file not found")
 
-    return _build_file_response(file_path)
+    return _build_file_response(file_path, request, etag=etag)
 
 
 @app.get("/api/asset/prepare_archive")
-async def prepare_archive_asset(
+def prepare_archive_asset(
     archive_path: str = Query(...),
     inner_path: str = Query(...),
 ):
@@ -282,7 +643,14 @@ async def prepare_archive_asset(
     This solves the problem of archive-internal paths not being valid
     filesystem paths for the Three.js loaders.
     """
-    extracted = archive_inspector.extract_asset(archive_path, inner_path)
+    _check_allowed(archive_path)
+    # The listing entry supplies the related files for both the extraction
+    # and the path resolution below
+    archived_asset = archive_inspector.get_asset_entry(archive_path, inner_path)
+    related_inner = archived_asset.related_files if archived_asset else None
+    extracted = archive_inspector.extract_asset(
+        archive_path, inner_path, related_inner
+    )
     if extracted is None:
         raise HTTPException(
             status_code=500,
@@ -297,25 +665,16 @@ async def prepare_archive_asset(
     serve_path, actual_ext = _maybe_convert_asset(file_path)
 
     # Build the file URL for the main asset (points to converted file if applicable)
-    stat = serve_path.stat()
-    version = f"{stat.st_size}-{stat.st_mtime_ns}"
+    st = serve_path.stat()
+    version = f"{st.st_size}-{st.st_mtime_ns}"
     file_url = (
-        f"/api/asset/file?path={urllib.parse.quote(str(serve_path))}"
+        f"/api/asset/file?path={quote_from_bytes(os.fsencode(serve_path))}"
         f"&v={version}"
     )
 
     # Resolve related file paths: map archive-internal -> extracted temp paths
-    # First, get all related files from the archive listing
-    result = file_browser.browse(str(Path(archive_path).parent))
-    archived_asset = None
-    for a in result.assets:
-        if (a.archive_path == archive_path and a.inner_path == inner_path):
-            archived_asset = a
-            break
-
-    related_inner = archived_asset.related_files if archived_asset else []
     related_resolved = archive_inspector.get_extracted_related_paths(
-        archive_path, related_inner
+        archive_path, related_inner or []
     )
 
     return {
@@ -328,22 +687,20 @@ async def prepare_archive_asset(
 
 
 @app.get("/api/asset/related")
-async def serve_related_file(path: str = Query(...)):
+def serve_related_file(request: Request, path: str = Query(...)):
     """
     Serve a related file (texture, material) for the 3D viewer.
 
     This endpoint allows the Three.js loaders to fetch .mtl files,
     textures, etc., that are referenced by the main 3D asset.
     """
-    file_path = Path(path)
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail=f"File not found: {path}")
-
-    return _build_file_response(file_path)
+    _check_allowed(path)
+    st = _stat_regular_file(path)
+    return _build_file_response(Path(path), request, st=st)
 
 
 @app.post("/api/export")
-async def export_asset(request: ExportRequest):
+def export_asset(request: ExportRequest):
     """
     Export a 3D asset to a target directory with a new name.
 
@@ -371,7 +728,7 @@ async def export_asset(request: ExportRequest):
 
 
 @app.post("/api/export_modified")
-async def export_modified(request: ExportModifiedRequest):
+def export_modified(request: ExportModifiedRequest):
     """
     Export a modified model (OBJ text generated by the frontend).
 
@@ -395,6 +752,14 @@ async def export_modified(request: ExportModifiedRequest):
     }
 
 
+def _copy_upload_to(source, output_file: Path) -> int:
+    """Copy an uploaded file object to disk; return the bytes written."""
+    source.seek(0)
+    with open(output_file, "wb") as out:
+        shutil.copyfileobj(source, out, UPLOAD_COPY_BUFFER)
+        return out.tell()
+
+
 @app.post("/api/export_glb")
 async def export_glb(
     file: UploadFile = File(...),
@@ -419,8 +784,11 @@ async def export_glb(
     output_file = target_path / safe_name
 
     try:
-        content = await file.read()
-        output_file.write_bytes(content)
+        # Large GLBs: stream the spooled upload to disk in bounded chunks,
+        # off the event loop, instead of loading it into memory first
+        file_size = await run_in_threadpool(
+            _copy_upload_to, file.file, output_file
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to write GLB: {e}")
 
@@ -428,7 +796,7 @@ async def export_glb(
         "success": True,
         "output_path": str(target_path),
         "file_path": str(output_file),
-        "file_size": len(content),
+        "file_size": file_size,
         "message": f"Exported GLB: {safe_name}",
     }
 
@@ -460,7 +828,7 @@ class ScanTexturesRequest(BaseModel):
 
 
 @app.post("/api/reveal")
-async def reveal_in_file_manager(request: RevealRequest):
+def reveal_in_file_manager(request: RevealRequest):
     """
     Open the OS file manager and select/highlight the given file or folder.
 
@@ -491,7 +859,7 @@ async def reveal_in_file_manager(request: RevealRequest):
 
 
 @app.post("/api/rename")
-async def rename_file(request: RenameRequest):
+def rename_file(request: RenameRequest):
     """
     Rename a file or folder. The new_name is just the filename (not a path).
     The file stays in the same directory.
@@ -509,6 +877,7 @@ async def rename_file(request: RenameRequest):
         raise HTTPException(status_code=409, detail=f"Already exists: {new_name}")
 
     try:
+        close_archive_handles(str(file_path))
         file_path.rename(new_path)
         return {"success": True, "new_path": str(new_path)}
     except Exception as e:
@@ -516,7 +885,7 @@ async def rename_file(request: RenameRequest):
 
 
 @app.post("/api/delete")
-async def delete_file(request: DeleteRequest):
+def delete_file(request: DeleteRequest):
     """
     Delete a file or empty folder.
     """
@@ -525,10 +894,10 @@ async def delete_file(request: DeleteRequest):
         raise HTTPException(status_code=404, detail=f"Not found: {request.path}")
 
     try:
+        close_archive_handles(str(file_path))
         if file_path.is_file():
             file_path.unlink()
         elif file_path.is_dir():
-            import shutil
             shutil.rmtree(str(file_path))
         return {"success": True}
     except Exception as e:
@@ -536,12 +905,11 @@ async def delete_file(request: DeleteRequest):
 
 
 @app.post("/api/duplicate")
-async def duplicate_file(request: DuplicateRequest):
+def duplicate_file(request: DuplicateRequest):
     """
     Duplicate a file. Creates a copy named <stem>_copy<ext> in the same directory.
     If that name exists, appends _copy2, _copy3, etc.
     """
-    import shutil
     file_path = Path(request.path)
     if not file_path.exists():
         raise HTTPException(status_code=404, detail=f"Not found: {request.path}")
@@ -565,9 +933,8 @@ async def duplicate_file(request: DuplicateRequest):
         raise HTTPException(status_code=500, detail=f"Duplicate failed: {e}")
 
 
-@app.get("/api/default_path")
 @app.post("/api/scan_textures")
-async def scan_textures(request: ScanTexturesRequest):
+def scan_textures(request: ScanTexturesRequest):
     """
     Scan a folder recursively for texture/image files.
 
@@ -596,15 +963,25 @@ async def scan_textures(request: ScanTexturesRequest):
     return {"folder": str(folder), "count": len(textures), "textures": textures}
 
 
+# DEFAULT_ROOT never changes while the server runs: serialize it once
+_DEFAULT_PATH_BODY = _json_response({"path": DEFAULT_ROOT}).body
+
+
 @app.get("/api/default_path")
 async def get_default_path():
     """Return the default browse path (user home)."""
-    return {"path": DEFAULT_ROOT}
+    return Response(content=_DEFAULT_PATH_BODY, media_type="application/json")
 
 
 def main():
     """Entry point for running the server."""
     port = int(os.environ.get("PORT", 8420))
+    # One process by default: the inspectors' extraction directories and
+    # LRUs are per process, so with several workers an archive can be
+    # extracted twice, or its files evicted by one worker while another
+    # just handed their paths to the viewer. WORKERS opts into more
+    # processes for read-mostly setups that accept this.
+    workers = int(os.environ.get("WORKERS", 1))
     print(f"\n  🎨 MeshVault")
     print(f"  → Open http://localhost:{port} in your browser\n")
     uvicorn.run(
@@ -612,6 +989,11 @@ def main():
         host="0.0.0.0",
         port=port,
         reload=False,
+        workers=workers,
+        # uvloop + httptools when installed (uvicorn[standard]; uvloop is
+        # not available on Windows), asyncio + h11 otherwise
+        loop="auto",
+        http="auto",
     )
 
 
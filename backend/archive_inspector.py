@@ -6,78 +6,200 @@ Responsible for:
 - Identifying 3D assets and their related files within archives
 - Extracting specific files from archives for viewing
 - Fallback extraction via subprocess (bsdtar, unrar, 7z, unar)
+- Persisting archive listings across restarts (SQLite inspection cache)
 """
 
 import os
+import json
 import logging
+import sqlite3
+import struct
 import zipfile
 import tempfile
 import shutil
 import subprocess
-from pathlib import Path, PurePosixPath
-from typing import Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
 try:
     import rarfile
     HAS_RARFILE = True
+except ImportError:
+    HAS_RARFILE = False
 
-    # Configure rarfile with the best available extraction tool.
-    # Use shutil.which() for reliable detection (not subprocess).
-    _rar_candidates = ["bsdtar", "unrar", "7z", "7za", "unar"]
-    _rar_extra_paths = [
-        "/opt/anaconda3/bin/bsdtar",
-        str(Path.home() / "anaconda3/bin/bsdtar"),
-        str(Path.home() / "miniconda3/bin/bsdtar"),
-        "/opt/homebrew/bin/unrar",
-        "/usr/local/bin/unrar",
-        "/opt/homebrew/bin/7z",
-        "/opt/homebrew/bin/unar",
-    ]
-
-    _rar_configured = False
-
-    # Check PATH first
-    for _cmd in _rar_candidates:
-        _found = shutil.which(_cmd)
-        if _found:
-            rarfile.UNRAR_TOOL = _found
-            try:
-                rarfile.tool_setup()
-                _rar_configured = True
-                logger.info(f"RAR extraction configured with: {_found}")
-            except Exception:
-                continue
-            break
+# Candidate RAR tools, probed on first RAR use rather than at import time
+# (tool_setup() may spawn subprocesses)
+_RAR_CANDIDATES = ["bsdtar", "unrar", "7z", "7za", "unar"]
+_RAR_EXTRA_PATHS = [
+    "/opt/anaconda3/bin/bsdtar",
+    str(Path.home() / "anaconda3/bin/bsdtar"),
+    str(Path.home() / "miniconda3/bin/bsdtar"),
+    "/opt/homebrew/bin/unrar",
+    "/usr/local/bin/unrar",
+    "/opt/homebrew/bin/7z",
+    "/opt/homebrew/bin/unar",
+]
+
+_rar_ready: Optional[bool] = None
+_rar_ready_lock = threading.Lock()
+
+
+def _try_rar_tool(tool: str) -> bool:
+    """Point rarfile at one tool; True only if its setup succeeds."""
+    rarfile.UNRAR_TOOL = tool
+    try:
+        rarfile.tool_setup()
+    except Exception:
+        return False
+    logger.info(f"RAR extraction configured with: {tool}")
+    return True
+
+
+def _read_cached_rar_tool() -> Optional[str]:
+    """Return the RAR tool recorded by a previous run, if still present."""
+    try:
+        with open(RAR_TOOL_CACHE_PATH, encoding="utf-8") as f:
+            tool = f.read().strip()
+    except OSError:
+        return None
+    if tool and os.path.isfile(tool) and os.access(tool, os.X_OK):
+        return tool
+    return None
+
+
+def _write_cached_rar_tool(tool: str) -> None:
+    """Record the detected RAR tool for later runs (best effort)."""
+    try:
+        os.makedirs(os.path.dirname(RAR_TOOL_CACHE_PATH), exist_ok=True)
+        with open(RAR_TOOL_CACHE_PATH, "w", encoding="utf-8") as f:
+            f.write(tool)
+    except OSError as e:
+        logger.debug(f"Could not record RAR tool: {e}")
+
+
+def ensure_rar_configured() -> bool:
+    """
+    Configure rarfile with the best available extraction tool, once.
+
+    Detection runs on the first call and the outcome is memoized, so
+    importing this module stays cheap when no RAR is ever opened.
+
+    Returns:
+        True if rarfile is importable (whether or not a tool was found;
+        rarfile can still read uncompressed members without one).
+    """
+    global _rar_ready
+    if _rar_ready is not None:
+        return _rar_ready
+    with _rar_ready_lock:
+        if _rar_ready is not None:
+            return _rar_ready
+        if not HAS_RARFILE:
+            _rar_ready = False
+            return False
 
-    # Check common non-PATH locations
-    if not _rar_configured:
-        for _path in _rar_extra_paths:
-            if os.path.isfile(_path) and os.access(_path, os.X_OK):
-                rarfile.UNRAR_TOOL = _path
-                try:
-                    rarfile.tool_setup()
-                    _rar_configured = True
-                    logger.info(f"RAR extraction configured with: {_path}")
-                except Exception:
-                    continue
-                break
+        # The tool found by a previous run is tried first, so warm starts
+        # skip probing PATH and the common install locations
+        cached_tool = _read_cached_rar_tool()
+        configured = bool(cached_tool) and _try_rar_tool(cached_tool)
 
-    if not _rar_configured:
-        logger.info("No RAR extraction tool found — RAR archives will be skipped")
+        # Check PATH first, then common non-PATH locations. Use
+        # shutil.which() for reliable detection (not subprocess).
+        if not configured:
+            candidates = [shutil.which(cmd) for cmd in _RAR_CANDIDATES]
+            candidates += [
+                path for path in _RAR_EXTRA_PATHS
+                if os.path.isfile(path) and os.access(path, os.X_OK)
+            ]
+            for tool in candidates:
+                if tool and tool != cached_tool and _try_rar_tool(tool):
+                    configured = True
+                    _write_cached_rar_tool(tool)
+                    break
 
-except ImportError:
-    HAS_RARFILE = False
+        if not configured:
+            logger.info("No RAR extraction tool found — RAR archives will be skipped")
+
+        _rar_ready = True
+        return True
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 
 
 # Supported 3D extensions (duplicated here to avoid circular imports)
-SUPPORTED_3D_EXTENSIONS = {".obj", ".fbx", ".gltf", ".glb", ".stl"}
+SUPPORTED_3D_EXTENSIONS = frozenset({".obj", ".fbx", ".gltf", ".glb", ".stl"})
+
+# Maximum threads used to extract related files from one ZIP archive
+ZIP_EXTRACT_WORKERS = 8
+
+# Default thread count for inspecting several archives at once
+INSPECT_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+# Directory for caches that persist across restarts
+CACHE_DIR = (
+    os.environ.get("MESHVAULT_CACHE_DIR")
+    or os.path.join(Path.home(), ".cache", "meshvault")
+)
+
+# On-disk cache of archive listings, reused across restarts while an
+# archive's size and mtime are unchanged. Bump the version whenever the
+# discovery rules change so stale listings are discarded.
+INSPECT_CACHE_PATH = os.path.join(CACHE_DIR, "inspect.sqlite3")
+INSPECT_CACHE_VERSION = 1
+# Most listings kept; the least recently written ones are dropped first
+INSPECT_CACHE_MAX_ROWS = 10000
+
+# Path of the RAR tool detected by ensure_rar_configured()
+RAR_TOOL_CACHE_PATH = os.path.join(CACHE_DIR, "rar_tool")
+
+# Where extracted assets are written. Defaults to a "meshvault" folder in
+# the system temp dir, so the file-serving allow-list can admit extracted
+# files without admitting all of the temp dir; MESHVAULT_TMP can point it
+# at faster storage (a tmpfs/ramdisk or local NVMe), which helps
+# texture-heavy extracts where /tmp is on a slow disk (e.g. /var/folders
+# on macOS).
+EXTRACT_TEMP_ROOT: str = os.environ.get("MESHVAULT_TMP") or os.path.join(
+    tempfile.gettempdir(), "meshvault"
+)
+
+# Archives above this size get a sequential-readahead hint when streamed
+READAHEAD_THRESHOLD = 32 * 1024 * 1024
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Maximum number of ZIP/RAR archives kept open between inspect/extract calls
+ARCHIVE_HANDLE_CACHE_SIZE = 16
+
+# Maximum number of extracted assets remembered before the least recently
+# used one is deleted from disk
+EXTRACT_CACHE_MAXSIZE = 512
+
+# Archives rarfile may fail to extract, with no success, before it is
+# skipped for every later RAR in favor of the direct CLI fallback
+RARFILE_MAX_FAILURES = 3
+
+# Related-file indexes kept for the most recently listed ZIP/RAR archives
+RELATED_INDEX_CACHE_SIZE = 8
+
+# Inner-path asset lookups kept for the most recently used archives
+TOC_CACHE_SIZE = 64
+
+# Header indexes kept for the most recently used .unitypackage archives
+UNITYPACKAGE_INDEX_CACHE_SIZE = 8
+
+# Errors open_member() raises when a member can't be streamed (corrupt
+# archive, unsupported compression method, unreadable file); callers fall
+# back to extract_asset()
+MEMBER_OPEN_ERRORS: tuple[type[Exception], ...] = (
+    zipfile.BadZipFile, NotImplementedError, OSError,
+) + ((rarfile.Error,) if HAS_RARFILE else ())
 
 # Texture and related file extensions
-RELATED_EXTENSIONS = {
+RELATED_EXTENSIONS = frozenset({
     ".mtl",
     ".png",
     ".jpg",
@@ -87,10 +209,20 @@ RELATED_EXTENSIONS = {
     ".tiff",
     ".tif",
     ".webp",
+})
+
+# Common texture folder names for direct matching (nearby files)
+DIRECT_TEXTURE_DIRS = frozenset({
+    "textures", "texture", "tex", "maps", "map",
+    "materials", "material", "mat",
+})
+# Broader fallback directories used only when direct matching finds nothing
+FALLBACK_TEXTURE_DIRS = DIRECT_TEXTURE_DIRS | {
+    "images", "image", "sourceimages", "sourceimage",
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetInfo:
     """Represents a discovered 3D asset (mirrors file_browser.AssetInfo)."""
     name: str
@@ -103,12 +235,389 @@ class AssetInfo:
     related_files: list[str] = field(default_factory=list)
 
 
+@dataclass
+class _RelatedIndex:
+    """
+    Per-archive lookup tables for related-file discovery.
+
+    ``names`` holds the candidate files (RELATED_EXTENSIONS) in listing
+    order; every other field stores positions into it.
+    """
+    names: list[str] = field(default_factory=list)
+    by_dir: dict[str, list[int]] = field(default_factory=dict)
+    by_stem_prefix: dict[str, list[int]] = field(default_factory=dict)
+    # Files whose parent folder's last component is a texture folder name
+    texture_dir_hits: list[int] = field(default_factory=list)
+    # Files directly inside a top-level texture folder (e.g. "Textures/x.png")
+    root_texture_dir_hits: list[int] = field(default_factory=list)
+    fallback_hits: list[int] = field(default_factory=list)
+    # Image files (everything but .mtl), the FBX candidate pool
+    image_hits: list[int] = field(default_factory=list)
+
+
+def _split(name: str) -> tuple[str, str, str]:
+    """
+    Split an archive member name into (parent, stem, lowercase extension).
+
+    A string-only equivalent of PurePosixPath(name).parent/.stem/.suffix for
+    the already-normalized POSIX names found in archive listings, without
+    building path objects in loops over every member. The parent of a
+    top-level name is ".", and dotfiles like ".png" have no extension.
+    """
+    i = name.rfind("/")
+    parent = name[:i] if i >= 0 else "."
+    base = name[i + 1:]
+    j = base.rfind(".")
+    if 0 < j < len(base) - 1:
+        return parent, base[:j], base[j:].lower()
+    return parent, base, ""
+
+
+def _nonempty(path: str) -> bool:
+    """True if path exists and has content (a single stat call)."""
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
+def _remove_if_present(path: str):
+    """Delete a file, ignoring it if it doesn't exist."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# Process-wide LRU of open ZIP handles, shared by every ArchiveInspector so
+# the browser's inspection and the API's extraction parse each central
+# directory once: archive_path -> (mtime_ns, size, ZipFile, per-handle lock)
+_archive_handles: OrderedDict[
+    str, tuple[int, int, object, threading.Lock]
+] = OrderedDict()
+_archive_handles_lock = threading.Lock()
+
+
+def _open_cached(
+    archive_path: str, opener, st: Optional[os.stat_result] = None
+) -> tuple[object, threading.Lock]:
+    """
+    Return a shared, already-open archive handle and its lock.
+
+    Handles are kept in an LRU of ARCHIVE_HANDLE_CACHE_SIZE entries and
+    reopened when the archive's mtime or size changes, so repeated
+    inspect/extract/stream/export calls don't re-parse the archive's
+    directory. Callers that already stat'ed the archive pass ``st``.
+    """
+    if st is None:
+        st = os.stat(archive_path)
+
+    def lookup():
+        cached = _archive_handles.get(archive_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _archive_handles.move_to_end(archive_path)
+            return cached
+        return None
+
+    with _archive_handles_lock:
+        cached = lookup()
+    if cached:
+        return cached[2], cached[3]
+
+    # Parse the directory outside the global lock so opening one large
+    # archive doesn't stall lookups of every other archive
+    handle = opener(archive_path)
+    lock = threading.Lock()
+
+    with _archive_handles_lock:
+        cached = lookup()
+        if cached:
+            # Another thread opened the same archive meanwhile; keep theirs
+            stale = [(handle, lock)]
+            handle, lock = cached[2], cached[3]
+        else:
+            previous = _archive_handles.get(archive_path)
+            _archive_handles[archive_path] = (
+                st.st_mtime_ns, st.st_size, handle, lock
+            )
+            _archive_handles.move_to_end(archive_path)
+            stale = [previous[2:]] if previous else []
+            while len(_archive_handles) > ARCHIVE_HANDLE_CACHE_SIZE:
+                stale.append(_archive_handles.popitem(last=False)[1][2:])
+
+    _close_handles(stale)
+    return handle, lock
+
+
+def _close_handles(handles: list[tuple[object, threading.Lock]]):
+    """
+    Close evicted archive handles, each under its own lock.
+
+    A thread that checked a handle out before its eviction may be inside
+    open()/getinfo()/read() under that lock; waiting for the lock lets it
+    finish first. Open members keep their own reference to the file, so
+    closing doesn't break in-flight streams either.
+    """
+    for handle, lock in handles:
+        with lock:
+            handle.close()
+
+
+def open_zip(
+    archive_path: str, st: Optional[os.stat_result] = None
+) -> tuple[zipfile.ZipFile, threading.Lock]:
+    """
+    Return a shared, already-open ZipFile for an archive and its lock.
+
+    ZipFile reads are not safe to interleave on one handle: hold the
+    returned lock around extract()/open()/read() calls.
+    """
+    return _open_cached(archive_path, lambda p: zipfile.ZipFile(p, "r"), st)
+
+
+def open_rar(
+    archive_path: str, st: Optional[os.stat_result] = None
+) -> "rarfile.RarFile":
+    """
+    Return a shared RarFile for an archive, parsing its headers once.
+
+    RarFile reopens the archive for every member it reads, so the
+    handle can be used from several threads without a lock.
+    """
+    return _open_cached(archive_path, lambda p: rarfile.RarFile(p, "r"), st)[0]
+
+
+def close_archive_handles(path: Optional[str] = None):
+    """
+    Close cached ZIP/RAR handles.
+
+    Args:
+        path: Close only the handle for this archive, or for every archive
+              under this folder; None closes all of them. Call this before
+              renaming or deleting archives (Windows refuses to while a
+              handle is open).
+    """
+    with _archive_handles_lock:
+        if path is None:
+            stale = list(_archive_handles)
+        else:
+            prefix = os.path.join(path, "")
+            stale = [
+                p for p in _archive_handles if p == path or p.startswith(prefix)
+            ]
+        handles = [_archive_handles.pop(p)[2:] for p in stale]
+    _close_handles(handles)
+
+
+# Process-wide LRU of .unitypackage header indexes, shared like the archive
+# handles so an extraction reuses the scan done while browsing:
+# archive_path -> (mtime_ns, size, {guid: TarInfo},
+#                  {pathname: file info}, {parent: [pathname]})
+_unitypackage_indexes: OrderedDict[
+    str, tuple[int, int, dict, dict, dict]
+] = OrderedDict()
+_unitypackage_indexes_lock = threading.Lock()
+
+
+def _open_sequential(archive_path: str) -> IO[bytes]:
+    """
+    Open an archive that will be read front-to-back (e.g. tar.gz).
+
+    Uses a 1 MiB buffer so the decompressor is fed by few large reads, and
+    on Linux, for large archives, tells the kernel the access pattern is
+    sequential so it widens readahead and keeps the disk busy while the
+    current block is being inflated.
+    """
+    f = open(archive_path, "rb", buffering=READ_BUFFER_SIZE)
+    if hasattr(os, "posix_fadvise"):
+        try:
+            if os.fstat(f.fileno()).st_size > READAHEAD_THRESHOLD:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return f
+
+
+# ZIP end-of-central-directory, ZIP64 locator/end record and
+# central-directory record layouts
+_ZIP_EOCD = struct.Struct("<4s4H2LH")
+_ZIP64_LOCATOR = struct.Struct("<4sLQL")
+_ZIP64_EOCD = struct.Struct("<4sQ2H2L4Q")
+_ZIP_CENTRAL = struct.Struct("<4s4B4HL2L5H2L")
+_ZIP_EOCD_SIG = b"PK\x05\x06"
+_ZIP64_LOCATOR_SIG = b"PK\x06\x07"
+_ZIP64_EOCD_SIG = b"PK\x06\x06"
+_ZIP_CENTRAL_SIG = b"PK\x01\x02"
+
+
+def _list_zip_members(archive_path: str) -> Optional[list[tuple[str, int]]]:
+    """
+    List a ZIP archive's member names and sizes straight from its central
+    directory, without building zipfile.ZipInfo objects.
+
+    Listing is all inspection needs, and for archives with hundreds of
+    thousands of entries zipfile's per-entry ZipInfo construction dominates
+    the cost of opening the archive. The directory is read in one go and
+    walked with precompiled structs; names are decoded like zipfile does
+    (UTF-8 when flagged, else cp437, cut at the first NUL). ZIP64 archives
+    and members are supported.
+
+    Returns:
+        (name, uncompressed size) pairs in directory order, or None for
+        anything this reader
+        doesn't handle (multi-disk archives, Info-ZIP Unicode path fields,
+        damaged or unusual archives); callers then fall back to
+        zipfile.ZipFile.
+    """
+    try:
+        with open(archive_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            file_size = f.tell()
+            tail_size = min(
+                file_size,
+                _ZIP64_EOCD.size + _ZIP64_LOCATOR.size + _ZIP_EOCD.size + 0xFFFF,
+            )
+            tail_start = file_size - tail_size
+            f.seek(tail_start)
+            tail = f.read(tail_size)
+            eocd = tail.rfind(_ZIP_EOCD_SIG)
+            if eocd < 0 or eocd + _ZIP_EOCD.size > len(tail):
+                return None
+            (_, disk, cd_disk, _, count, cd_size, cd_offset,
+             _) = _ZIP_EOCD.unpack_from(tail, eocd)
+            # Data prepended to the archive (e.g. self-extractors) shifts
+            # every offset; zipfile accounts for it the same way
+            concat = tail_start + eocd - cd_size - cd_offset
+
+            locator = eocd - _ZIP64_LOCATOR.size
+            if locator >= 0 and tail.startswith(_ZIP64_LOCATOR_SIG, locator):
+                _, disk, _, disks = _ZIP64_LOCATOR.unpack_from(tail, locator)
+                record = locator - _ZIP64_EOCD.size
+                if disk or disks > 1 or record < 0:
+                    return None
+                (sig, _, _, _, disk, cd_disk, _, count, cd_size,
+                 cd_offset) = _ZIP64_EOCD.unpack_from(tail, record)
+                if sig != _ZIP64_EOCD_SIG:
+                    return None
+                concat = tail_start + record - cd_size - cd_offset
+
+            if disk or cd_disk or concat < 0:
+                return None
+            f.seek(cd_offset + concat)
+            cd = f.read(cd_size)
+    except (OSError, struct.error):
+        return None
+    if len(cd) != cd_size:
+        return None
+
+    members = []
+    append = members.append
+    unpack_from = _ZIP_CENTRAL.unpack_from
+    header_size = _ZIP_CENTRAL.size
+    pos = 0
+    try:
+        for _ in range(count):
+            (sig, _, _, _, _, flags, _, _, _, _, _, size,
+             name_len, extra_len, comment_len, _, _, _,
+             _) = unpack_from(cd, pos)
+            if sig != _ZIP_CENTRAL_SIG:
+                return None
+            start = pos + header_size
+            extra_start = start + name_len
+            pos = extra_start + extra_len + comment_len
+            if extra_len:
+                extra = cd[extra_start:extra_start + extra_len]
+                if b"up" in extra:
+                    return None
+                if size == 0xFFFFFFFF:
+                    size = _zip64_file_size(extra)
+                    if size is None:
+                        return None
+            raw = cd[start:extra_start]
+            # ASCII names (the common case) decode the same either way,
+            # through the interpreter's fast ASCII path
+            name = raw.decode(
+                "ascii" if raw.isascii()
+                else "utf-8" if flags & 0x800 else "cp437"
+            )
+            nul = name.find("\0")
+            if nul >= 0:
+                name = name[:nul]
+            if os.sep != "/" and os.sep in name:
+                name = name.replace(os.sep, "/")
+            append((name, size))
+    except (struct.error, UnicodeDecodeError):
+        return None
+    return members
+
+
+def _zip64_file_size(extra: bytes) -> Optional[int]:
+    """Uncompressed size from a member's ZIP64 extra field, if any."""
+    i = 0
+    while i + 4 <= len(extra):
+        tp, ln = struct.unpack_from("<HH", extra, i)
+        if tp == 0x0001:
+            # The original size is the first ZIP64 field when present
+            return struct.unpack_from("<Q", extra, i + 4)[0] if ln >= 8 else None
+        i += 4 + ln
+    return None
+
+
 class ArchiveInspector:
     """Discovers 3D assets inside archives and extracts them for viewing."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_path: Optional[str] = INSPECT_CACHE_PATH,
+        temp_root: Optional[str] = None,
+    ):
+        """
+        Initialize the inspector.
+
+        Args:
+            cache_path: SQLite file persisting archive listings across
+                        restarts, or None to keep listings in memory only.
+            temp_root: Directory to extract into (defaults to
+                       EXTRACT_TEMP_ROOT, i.e. $MESHVAULT_TMP or a
+                       "meshvault" folder in the system temp dir).
+        """
+        self._temp_base = temp_root or EXTRACT_TEMP_ROOT
+        self._disk_cache = self._open_disk_cache(cache_path) if cache_path else None
+        self._disk_cache_lock = threading.Lock()
+        # Single root holding every per-archive extraction directory
+        self._temp_root: Optional[str] = None
         # Cache of temporary extraction directories: archive_path -> temp_dir
         self._temp_dirs: dict[str, str] = {}
+        self._temp_dirs_lock = threading.Lock()
+        # LRU of finished extractions:
+        # (archive_path, inner_path) -> (mtime_ns, size, extracted_path)
+        self._extracted: OrderedDict[
+            tuple[str, str], tuple[int, int, str]
+        ] = OrderedDict()
+        self._extracted_lock = threading.Lock()
+        # LRU of archive listings indexed by inner path:
+        # archive_path -> (mtime_ns, size, {inner_path: AssetInfo})
+        self._toc_cache: OrderedDict[
+            str, tuple[int, int, dict[str, AssetInfo]]
+        ] = OrderedDict()
+        self._toc_cache_lock = threading.Lock()
+        # Related-file indexes of recently listed ZIP/RAR archives:
+        # archive_path -> (mtime_ns, size, _RelatedIndex)
+        self._related_indexes: OrderedDict[
+            str, tuple[int, int, _RelatedIndex]
+        ] = OrderedDict()
+        self._related_indexes_lock = threading.Lock()
+        # RAR archives the rarfile strategy already failed on; their
+        # extractions go straight to the CLI fallback
+        self._rarfile_broken: set[str] = set()
+        # rarfile extraction outcomes, so setups where it never works
+        # (e.g. bsdtar-only) stop trying it after RARFILE_MAX_FAILURES
+        # archives came out as 0-byte files. Updated under _extracted_lock
+        # since extractions run on pool threads.
+        self._rarfile_failures = 0
+        self._rarfile_worked = False
+        # RAR archives whose every member was extracted by the CLI fallback
+        self._rar_fully_extracted: set[str] = set()
 
     # Format preference order: higher index = preferred when duplicates exist.
     # When the same model ships as both FBX and OBJ (common in asset packs),
@@ -129,19 +638,220 @@ class ArchiveInspector:
         Returns:
             List of AssetInfo for each 3D asset found.
         """
-        path = Path(archive_path)
-        ext = path.suffix.lower()
+        ext = os.path.splitext(archive_path)[1].lower()
+
+        if ext not in (".zip", ".rar", ".unitypackage"):
+            return []
+
+        try:
+            st = os.stat(archive_path)
+        except FileNotFoundError:
+            self._forget_cached_listings([archive_path])
+            st = None
+        except OSError:
+            st = None
+        if st is not None:
+            cached = self._load_cached_listing(archive_path, st)
+            if cached is not None:
+                return cached
 
         if ext == ".zip":
-            raw = self._inspect_zip(archive_path)
+            raw = self._inspect_zip(archive_path, st)
         elif ext == ".rar":
-            raw = self._inspect_rar(archive_path)
-        elif ext == ".unitypackage":
-            raw = self._inspect_unitypackage(archive_path)
+            raw = self._inspect_rar(archive_path, st)
         else:
-            return []
+            raw = self._inspect_unitypackage(archive_path, st)
+
+        assets = self._deduplicate_formats(raw)
+        if st is not None:
+            self._store_cached_listing(archive_path, st, assets)
+        return assets
+
+    def inspect_many(
+        self, paths: list[str], max_workers: Optional[int] = None
+    ) -> dict[str, list[AssetInfo]]:
+        """
+        Inspect several archives concurrently.
+
+        Listing an archive is dominated by reading its central directory
+        (or tar headers) and by zipfile/rarfile/zlib work that releases the
+        GIL, so archives are inspected in parallel on a thread pool.
+
+        Args:
+            paths: Archive paths to inspect.
+            max_workers: Thread count (defaults to INSPECT_WORKERS).
+
+        Returns:
+            Mapping of each archive path to its list of AssetInfo, in the
+            order the paths were given. A path listed twice is inspected
+            once.
+        """
+        # Duplicates would list the same archive on two threads at once
+        paths = list(dict.fromkeys(paths))
+
+        # Unchanged archives come from the persistent cache in one query;
+        # only the rest are actually listed
+        results = self._load_cached_listings(paths)
+        misses = [path for path in paths if path not in results]
+
+        if len(misses) <= 1:
+            results.update((path, self.inspect(path)) for path in misses)
+        else:
+            workers = min(max_workers or INSPECT_WORKERS, len(misses))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results.update(zip(misses, pool.map(self.inspect, misses)))
+        return {path: results[path] for path in paths}
+
+    # ==========================================================
+    # Persistent inspection cache
+    # ==========================================================
+
+    @staticmethod
+    def _open_disk_cache(cache_path: str) -> Optional[sqlite3.Connection]:
+        """Open (or create) the SQLite inspection cache; None if unusable."""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            conn = sqlite3.connect(cache_path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # A lost listing is just re-read, so skip the fsync per commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != INSPECT_CACHE_VERSION:
+                conn.execute("DROP TABLE IF EXISTS archive_cache")
+                conn.execute(f"PRAGMA user_version = {INSPECT_CACHE_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS archive_cache ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+                "json BLOB)"
+            )
+            ArchiveInspector._trim_disk_cache(conn)
+            conn.commit()
+            return conn
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Inspection cache disabled ({cache_path}): {e}")
+            return None
 
-        return self._deduplicate_formats(raw)
+    @staticmethod
+    def _trim_disk_cache(conn: sqlite3.Connection):
+        """
+        Keep at most INSPECT_CACHE_MAX_ROWS listings.
+
+        INSERT OR REPLACE gives a rewritten row a fresh, larger rowid, so
+        the rowid orders listings by when they were last stored.
+        """
+        conn.execute(
+            "DELETE FROM archive_cache WHERE rowid <= "
+            "(SELECT MAX(rowid) FROM archive_cache) - ?",
+            (INSPECT_CACHE_MAX_ROWS,),
+        )
+
+    def _load_cached_listing(
+        self, archive_path: str, st: os.stat_result
+    ) -> Optional[list[AssetInfo]]:
+        """Return the persisted listing if the archive is unchanged."""
+        if self._disk_cache is None:
+            return None
+        try:
+            with self._disk_cache_lock:
+                row = self._disk_cache.execute(
+                    "SELECT json FROM archive_cache "
+                    "WHERE path = ? AND size = ? AND mtime_ns = ?",
+                    (archive_path, st.st_size, st.st_mtime_ns),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Inspection cache read failed for {archive_path}: {e}")
+            return None
+        if row is None:
+            return None
+        return [AssetInfo(**item) for item in json.loads(row[0])]
+
+    def _load_cached_listings(
+        self, archive_paths: list[str]
+    ) -> dict[str, list[AssetInfo]]:
+        """
+        Return the persisted listings of every unchanged archive at once.
+
+        Looks all archives up in a few batched queries instead of one
+        query per archive; archives that are missing, changed or not
+        cached yet are simply left out of the result.
+        """
+        if self._disk_cache is None or not archive_paths:
+            return {}
+        stats = {}
+        gone = []
+        for archive_path in archive_paths:
+            try:
+                stats[archive_path] = os.stat(archive_path)
+            except FileNotFoundError:
+                gone.append(archive_path)
+            except OSError:
+                continue
+        self._forget_cached_listings(gone)
+
+        rows = []
+        keys = list(stats)
+        try:
+            with self._disk_cache_lock:
+                # Stay under SQLite's bound-parameter limit
+                for i in range(0, len(keys), 500):
+                    batch = keys[i:i + 500]
+                    rows.extend(self._disk_cache.execute(
+                        "SELECT path, size, mtime_ns, json FROM archive_cache "
+                        f"WHERE path IN ({', '.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall())
+        except sqlite3.Error as e:
+            logger.debug(f"Inspection cache read failed: {e}")
+            return {}
+
+        listings = {}
+        for archive_path, size, mtime_ns, payload in rows:
+            st = stats[archive_path]
+            if size == st.st_size and mtime_ns == st.st_mtime_ns:
+                listings[archive_path] = [
+                    AssetInfo(**item) for item in json.loads(payload)
+                ]
+        return listings
+
+    def _forget_cached_listings(self, archive_paths: list[str]):
+        """
+        Drop the persisted listings of archives found to be missing.
+
+        Rows are pruned only when a lookup stats a missing archive, so
+        opening the cache never stats every archive it remembers (and
+        archives on an unmounted drive aren't forgotten just because the
+        app started); the row cap bounds whatever is never looked up again.
+        """
+        if self._disk_cache is None or not archive_paths:
+            return
+        try:
+            with self._disk_cache_lock:
+                self._disk_cache.executemany(
+                    "DELETE FROM archive_cache WHERE path = ?",
+                    [(path,) for path in archive_paths],
+                )
+                self._disk_cache.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Inspection cache prune failed: {e}")
+
+    def _store_cached_listing(
+        self, archive_path: str, st: os.stat_result, assets: list[AssetInfo]
+    ):
+        """Persist an archive listing (best effort)."""
+        if self._disk_cache is None:
+            return
+        payload = json.dumps([asdict(a) for a in assets])
+        try:
+            with self._disk_cache_lock:
+                self._disk_cache.execute(
+                    "INSERT OR REPLACE INTO archive_cache "
+                    "(path, size, mtime_ns, json) VALUES (?, ?, ?, ?)",
+                    (archive_path, st.st_size, st.st_mtime_ns, payload),
+                )
+                self._trim_disk_cache(self._disk_cache)
+                self._disk_cache.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Inspection cache write failed for {archive_path}: {e}")
 
     @staticmethod
     def _deduplicate_formats(assets: list[AssetInfo]) -> list[AssetInfo]:
@@ -161,7 +871,7 @@ class ArchiveInspector:
 
         for asset in assets:
             inner = getattr(asset, "inner_path", "") or ""
-            parent = str(PurePosixPath(inner).parent)
+            parent = _split(inner)[0]
             key = (parent, asset.name.lower())
 
             if key not in groups:
@@ -176,7 +886,10 @@ class ArchiveInspector:
         return list(groups.values())
 
     def extract_asset(
-        self, archive_path: str, inner_path: str
+        self,
+        archive_path: str,
+        inner_path: str,
+        related_files: Optional[list[str]] = None,
     ) -> Optional[str]:
         """
         Extract a specific asset (and its related files) from an archive.
@@ -184,9 +897,18 @@ class ArchiveInspector:
         Returns the path to the extracted file in a temporary directory.
         Tries multiple extraction methods for maximum compatibility.
 
+        Extractions are remembered per (archive, inner path) while the
+        archive's mtime and size are unchanged, so viewing the same asset
+        again returns immediately. The least recently used entries beyond
+        EXTRACT_CACHE_MAXSIZE have their extracted file deleted.
+
         Args:
             archive_path: Path to the archive.
             inner_path: Path of the asset inside the archive.
+            related_files: The asset's related files, when the caller
+                           already has its AssetInfo; looked up from the
+                           cached listing otherwise. Unitypackages always
+                           extract the asset's whole folder.
 
         Returns:
             Path to the extracted file, or None if extraction fails.
@@ -194,14 +916,108 @@ class ArchiveInspector:
         path = Path(archive_path)
         ext = path.suffix.lower()
 
+        try:
+            st = os.stat(archive_path)
+        except OSError:
+            return None
+
+        key = (archive_path, inner_path)
+        with self._extracted_lock:
+            cached = self._extracted.get(key)
+            if (
+                cached
+                and cached[0] == st.st_mtime_ns
+                and cached[1] == st.st_size
+                and os.path.exists(cached[2])
+            ):
+                self._extracted.move_to_end(key)
+                return cached[2]
+
         if ext == ".zip":
-            return self._extract_from_zip(archive_path, inner_path)
+            extracted = self._extract_from_zip(
+                archive_path, inner_path, related_files
+            )
         elif ext == ".rar":
-            return self._extract_from_rar(archive_path, inner_path)
+            extracted = self._extract_from_rar(
+                archive_path, inner_path, related_files
+            )
         elif ext == ".unitypackage":
-            return self._extract_from_unitypackage(archive_path, inner_path)
+            extracted = self._extract_from_unitypackage(archive_path, inner_path)
+        else:
+            return None
+
+        if extracted:
+            self._remember_extracted(key, st, extracted)
+        return extracted
+
+    def open_member(self, archive_path: str, inner_path: str) -> Optional[IO[bytes]]:
+        """
+        Open a single archive member for streaming reads, without extracting.
+
+        Supported for ZIP and RAR archives. Returns None for formats that
+        cannot be streamed member-by-member (e.g. .unitypackage), so callers
+        can fall back to extract_asset().
+
+        Args:
+            archive_path: Path to the archive.
+            inner_path: Path of the member inside the archive.
+
+        Returns:
+            A readable binary file object (caller closes it), or None.
+
+        Raises:
+            KeyError: If the member does not exist in the archive.
+            MEMBER_OPEN_ERRORS: If the member can't be streamed.
+        """
+        ext = Path(archive_path).suffix.lower()
+
+        if ext == ".zip":
+            zf, lock = open_zip(archive_path)
+            with lock:
+                # The member keeps the underlying file open until it is
+                # closed, even if the handle is evicted meanwhile
+                return zf.open(inner_path)
+        elif ext == ".rar" and ensure_rar_configured():
+            return open_rar(archive_path).open(inner_path)
         return None
 
+    def get_asset_entry(
+        self, archive_path: str, inner_path: str
+    ) -> Optional[AssetInfo]:
+        """
+        Look up one asset of an archive by its inner path.
+
+        The archive's asset listing is built once and indexed by inner
+        path; it is rebuilt only when the archive's mtime or size changes
+        (a single stat per call), so lookups are O(1) dict hits. Indexes
+        of the TOC_CACHE_SIZE most recently used archives are kept.
+
+        Args:
+            archive_path: Path to the archive.
+            inner_path: Path of the asset inside the archive.
+
+        Returns:
+            The AssetInfo for the asset, or None if it is not in the archive.
+        """
+        try:
+            st = os.stat(archive_path)
+        except OSError:
+            return None
+
+        with self._toc_cache_lock:
+            cached = self._toc_cache.get(archive_path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._toc_cache.move_to_end(archive_path)
+                return cached[2].get(inner_path)
+
+        index = {a.inner_path: a for a in self.inspect(archive_path)}
+        with self._toc_cache_lock:
+            self._toc_cache[archive_path] = (st.st_mtime_ns, st.st_size, index)
+            self._toc_cache.move_to_end(archive_path)
+            while len(self._toc_cache) > TOC_CACHE_SIZE:
+                self._toc_cache.popitem(last=False)
+        return index.get(inner_path)
+
     def get_extracted_related_paths(
         self, archive_path: str, inner_related_files: list[str]
     ) -> list[str]:
@@ -232,39 +1048,61 @@ class ArchiveInspector:
 
     def cleanup(self):
         """Remove all temporary extraction directories."""
-        for temp_dir in self._temp_dirs.values():
-            try:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-            except Exception:
-                pass
-        self._temp_dirs.clear()
+        with self._temp_dirs_lock:
+            if self._temp_root:
+                shutil.rmtree(self._temp_root, ignore_errors=True)
+            self._temp_root = None
+            self._temp_dirs.clear()
+        with self._extracted_lock:
+            self._extracted.clear()
+            self._rarfile_broken.clear()
+            self._rarfile_failures = 0
+            self._rarfile_worked = False
+        with self._toc_cache_lock:
+            self._toc_cache.clear()
+        with self._related_indexes_lock:
+            self._related_indexes.clear()
+        with _unitypackage_indexes_lock:
+            _unitypackage_indexes.clear()
+        self._rar_fully_extracted.clear()
+        close_archive_handles()
 
     # ==========================================================
     # Inspection (list contents without extraction)
     # ==========================================================
 
-    def _inspect_zip(self, archive_path: str) -> list[AssetInfo]:
+    def _inspect_zip(
+        self, archive_path: str, st: Optional[os.stat_result] = None
+    ) -> list[AssetInfo]:
         """Inspect a ZIP archive for 3D assets."""
         assets = []
         try:
-            with zipfile.ZipFile(archive_path, "r") as zf:
-                all_names = zf.namelist()
-                for name in all_names:
-                    inner_path = PurePosixPath(name)
-                    ext = inner_path.suffix.lower()
-                    if ext in SUPPORTED_3D_EXTENSIONS:
-                        related = self._find_related_in_list(name, all_names)
-                        info = zf.getinfo(name)
-                        assets.append(AssetInfo(
-                            name=inner_path.stem,
-                            path=archive_path,
-                            extension=ext,
-                            size=info.file_size,
-                            is_in_archive=True,
-                            archive_path=archive_path,
-                            inner_path=name,
-                            related_files=related,
-                        ))
+            # Listing only needs names and sizes: read them straight from
+            # the central directory, via zipfile only for archives the fast
+            # reader leaves to it
+            members = _list_zip_members(archive_path)
+            if members is None:
+                members = [
+                    (info.filename, info.file_size)
+                    for info in open_zip(archive_path, st)[0].infolist()
+                ]
+            # One pass over the members: each name is split once
+            models, candidates = self._classify_members(members)
+            related_index = self._store_related_index(
+                archive_path, candidates, st
+            )
+            for name, size, stem, ext in models:
+                related = self._find_related_indexed(name, related_index)
+                assets.append(AssetInfo(
+                    name=stem,
+                    path=archive_path,
+                    extension=ext,
+                    size=size,
+                    is_in_archive=True,
+                    archive_path=archive_path,
+                    inner_path=name,
+                    related_files=related,
+                ))
         except (zipfile.BadZipFile, Exception) as e:
             logger.warning(f"Failed to inspect ZIP {archive_path}: {e}")
         return assets
@@ -273,7 +1111,9 @@ class ArchiveInspector:
     # Unity Package (.unitypackage) Support
     # ==========================================
 
-    def _inspect_unitypackage(self, archive_path: str) -> list[AssetInfo]:
+    def _inspect_unitypackage(
+        self, archive_path: str, st: Optional[os.stat_result] = None
+    ) -> list[AssetInfo]:
         """
         Inspect a .unitypackage file for 3D assets.
 
@@ -286,75 +1126,125 @@ class ArchiveInspector:
         We scan for 'pathname' entries, check if they reference supported
         3D formats, and build AssetInfo objects.
         """
-        import tarfile
-
         assets = []
         try:
-            with tarfile.open(archive_path, "r:gz") as tar:
-                # First pass: build a map of GUID → pathname
-                guid_to_path = {}
-                guid_to_size = {}
-
-                for member in tar.getmembers():
-                    parts = member.name.split("/")
-                    if len(parts) == 2 and parts[1] == "pathname":
-                        try:
-                            f = tar.extractfile(member)
-                            if f:
-                                pathname = f.read().decode("utf-8").strip()
-                                guid = parts[0]
-                                guid_to_path[guid] = pathname
-                        except Exception:
-                            pass
-                    elif len(parts) == 2 and parts[1] == "asset":
-                        guid = parts[0]
-                        guid_to_size[guid] = member.size
-
-                # Second pass: find 3D assets and their related files
-                # Group by directory for related file detection
-                all_files = {}
-                for guid, pathname in guid_to_path.items():
-                    ext = Path(pathname).suffix.lower()
-                    all_files[pathname] = {
-                        "guid": guid,
-                        "ext": ext,
-                        "size": guid_to_size.get(guid, 0),
-                    }
-
-                # Find related files for each 3D asset
-                for pathname, info in all_files.items():
-                    if info["ext"] not in SUPPORTED_3D_EXTENSIONS:
-                        continue
-
-                    name = Path(pathname).stem
-                    parent = str(Path(pathname).parent)
-
-                    # Find related files in the same directory
-                    related = []
-                    for other_path, other_info in all_files.items():
-                        if other_path == pathname:
-                            continue
-                        if str(Path(other_path).parent) != parent:
-                            continue
-                        if other_info["ext"] in RELATED_EXTENSIONS:
-                            related.append(other_path)
-
-                    assets.append(AssetInfo(
-                        name=name,
-                        path=archive_path,
-                        extension=info["ext"],
-                        size=info["size"],
-                        is_in_archive=True,
-                        archive_path=archive_path,
-                        inner_path=pathname,
-                        related_files=related,
-                    ))
+            # Per-file parent/stem/extension are split once when the
+            # archive is indexed, not again on every inspection
+            _, all_files, by_parent = self._get_unitypackage_index(
+                archive_path, st
+            )
+
+            # Related files by directory, taken from the index's directory
+            # buckets instead of rescanning every file for every 3D asset
+            related_by_dir = {
+                parent: [
+                    name for name in names
+                    if all_files[name]["ext"] in RELATED_EXTENSIONS
+                ]
+                for parent, names in by_parent.items()
+            }
+
+            # Find related files for each 3D asset
+            for pathname, info in all_files.items():
+                if info["ext"] not in SUPPORTED_3D_EXTENSIONS:
+                    continue
+
+                # Related files in the same directory
+                related = list(related_by_dir.get(info["parent"], ()))
+
+                assets.append(AssetInfo(
+                    name=info["stem"],
+                    path=archive_path,
+                    extension=info["ext"],
+                    size=info["size"],
+                    is_in_archive=True,
+                    archive_path=archive_path,
+                    inner_path=pathname,
+                    related_files=related,
+                ))
 
         except Exception as e:
             logger.warning(f"Failed to inspect unitypackage {archive_path}: {e}")
 
         return assets
 
+    def _get_unitypackage_index(
+        self, archive_path: str, st: Optional[os.stat_result] = None
+    ) -> tuple[dict, dict, dict]:
+        """
+        Return the GUID → asset TarInfo map, the pathname → file info map
+        and the parent directory → pathnames buckets of a .unitypackage,
+        scanning the archive only on a cache miss.
+
+        Each file info holds the asset's GUID, its parent directory, stem,
+        lowercased extension and size, so callers never re-split pathnames.
+        The directory buckets let same-folder lookups touch only that
+        folder's files.
+        The maps are kept in a process-wide LRU of
+        UNITYPACKAGE_INDEX_CACHE_SIZE archives, shared by every inspector,
+        and invalidated when the archive's mtime or size changes. The cached TarInfo objects carry the data
+        offset and size of each asset within the uncompressed tar stream.
+
+        The scan opens the tar in streaming mode ("r|gz"): it only needs one
+        forward pass, reading each small pathname as it goes by, so the
+        gzip stream is never seeked.
+        """
+        import tarfile
+
+        if st is None:
+            st = os.stat(archive_path)
+        with _unitypackage_indexes_lock:
+            cached = _unitypackage_indexes.get(archive_path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                _unitypackage_indexes.move_to_end(archive_path)
+                return cached[2], cached[3], cached[4]
+
+        # Single streaming pass over the headers. Iterating the TarFile
+        # reads them lazily instead of materializing the member list.
+        guid_to_path = {}
+        guid_to_asset = {}
+        with _open_sequential(archive_path) as raw, \
+                tarfile.open(fileobj=raw, mode="r|gz") as tar:
+            for member in tar:
+                parts = member.name.split("/", 2)
+                if len(parts) != 2:
+                    continue
+                if parts[1] == "pathname":
+                    try:
+                        f = tar.extractfile(member)
+                        if f:
+                            pathname = f.read().decode("utf-8").strip()
+                            guid_to_path[parts[0]] = pathname
+                    except Exception:
+                        pass
+                elif parts[1] == "asset":
+                    guid_to_asset[parts[0]] = member
+
+        all_files = {}
+        by_parent: dict[str, list[str]] = {}
+        for guid, pathname in guid_to_path.items():
+            parent, stem, ext = _split(pathname)
+            member = guid_to_asset.get(guid)
+            all_files[pathname] = {
+                "guid": guid,
+                "parent": parent,
+                "stem": stem,
+                "ext": ext,
+                "size": member.size if member is not None else 0,
+            }
+            by_parent.setdefault(parent, []).append(pathname)
+
+        # Scanned outside the lock: a concurrent scan of the same archive
+        # just stores an identical index
+        with _unitypackage_indexes_lock:
+            _unitypackage_indexes[archive_path] = (
+                st.st_mtime_ns, st.st_size, guid_to_asset, all_files, by_parent
+            )
+            _unitypackage_indexes.move_to_end(archive_path)
+            while len(_unitypackage_indexes) > UNITYPACKAGE_INDEX_CACHE_SIZE:
+                _unitypackage_indexes.popitem(last=False)
+        return guid_to_asset, all_files, by_parent
+
     def _extract_from_unitypackage(
         self, archive_path: str, inner_path: str
     ) -> Optional[str]:
@@ -365,98 +1255,135 @@ class ArchiveInspector:
         extracts the 'asset' file, and renames it to the original filename.
         Also extracts related files from the same directory.
         """
-        import tarfile
-
         temp_dir = self._get_temp_dir(archive_path)
 
         try:
-            with tarfile.open(archive_path, "r:gz") as tar:
-                # Build GUID → pathname mapping
-                guid_to_path = {}
-                for member in tar.getmembers():
-                    parts = member.name.split("/")
-                    if len(parts) == 2 and parts[1] == "pathname":
-                        try:
-                            f = tar.extractfile(member)
-                            if f:
-                                pathname = f.read().decode("utf-8").strip()
-                                guid_to_path[parts[0]] = pathname
-                        except Exception:
-                            pass
-
-                # Reverse map: pathname → GUID
-                path_to_guid = {v: k for k, v in guid_to_path.items()}
-
-                # Find the target asset and extract it
-                target_guid = path_to_guid.get(inner_path)
-                if not target_guid:
-                    logger.error(f"Asset not found in unitypackage: {inner_path}")
-                    return None
+            # GUID → asset member, pathname → file info and directory
+            # bucket mappings, reused from inspection when the archive
+            # hasn't changed
+            guid_to_asset, all_files, by_parent = self._get_unitypackage_index(
+                archive_path
+            )
 
-                # Determine which GUIDs to extract (target + related in same dir)
-                target_dir = str(Path(inner_path).parent)
-                guids_to_extract = {}
-                for guid, pathname in guid_to_path.items():
-                    if guid == target_guid or str(Path(pathname).parent) == target_dir:
-                        ext = Path(pathname).suffix.lower()
-                        if ext in SUPPORTED_3D_EXTENSIONS or ext in RELATED_EXTENSIONS:
-                            guids_to_extract[guid] = pathname
-
-                # Extract each asset file
-                extracted_main = None
-                for member in tar.getmembers():
-                    parts = member.name.split("/")
-                    if len(parts) == 2 and parts[1] == "asset":
-                        guid = parts[0]
-                        if guid in guids_to_extract:
-                            original_name = Path(guids_to_extract[guid]).name
-                            output_path = Path(temp_dir) / original_name
-                            try:
-                                f = tar.extractfile(member)
-                                if f:
-                                    output_path.write_bytes(f.read())
-                                    if guid == target_guid:
-                                        extracted_main = str(output_path)
-                            except Exception as e:
-                                logger.warning(f"Failed to extract {original_name}: {e}")
-
-                return extracted_main
+            # Find the target asset and extract it
+            target = all_files.get(inner_path)
+            if not target:
+                logger.error(f"Asset not found in unitypackage: {inner_path}")
+                return None
+            target_guid = target["guid"]
+
+            # Determine which GUIDs to extract (target + related in same
+            # dir); only the target's own directory bucket is scanned
+            guids_to_extract = {}
+            for pathname in by_parent.get(target["parent"], ()):
+                info = all_files[pathname]
+                ext = info["ext"]
+                if ext in SUPPORTED_3D_EXTENSIONS or ext in RELATED_EXTENSIONS:
+                    guids_to_extract[info["guid"]] = pathname
+
+            # Each asset file is written under its original filename
+            # (unity pathnames always use "/" separators)
+            jobs = [
+                (
+                    guid_to_asset[guid],
+                    os.path.join(temp_dir, pathname.rpartition("/")[2]),
+                )
+                for guid, pathname in guids_to_extract.items()
+                if guid in guid_to_asset
+            ]
+            written = self._copy_unitypackage_members(archive_path, jobs)
+
+            main_member = guid_to_asset.get(target_guid)
+            for member, output_path in jobs:
+                if member is main_member and output_path in written:
+                    return output_path
+            return None
 
         except Exception as e:
             logger.error(f"Failed to extract from unitypackage: {e}")
             return None
 
-    def _inspect_rar(self, archive_path: str) -> list[AssetInfo]:
+    @staticmethod
+    def _copy_unitypackage_members(
+        archive_path: str, jobs: list[tuple]
+    ) -> set[str]:
+        """
+        Copy indexed tar members straight out of the gzip stream.
+
+        Uses the data offsets recorded by _get_unitypackage_index() instead
+        of going through tarfile: members are visited in archive order, the
+        stream is skipped forward to each one and its bytes are copied to
+        disk in bounded chunks, so no tar headers are re-parsed and large
+        assets are never held in memory. Reading stops after the last
+        wanted member.
+
+        Args:
+            archive_path: Path to the .unitypackage.
+            jobs: (TarInfo, output_path) pairs.
+
+        Returns:
+            The output paths that were written successfully.
+        """
+        import gzip
+
+        written = set()
+        with _open_sequential(archive_path) as raw, \
+                gzip.GzipFile(fileobj=raw, mode="rb") as stream:
+            for member, output_path in sorted(jobs, key=lambda j: j[0].offset_data):
+                try:
+                    stream.seek(member.offset_data)
+                    remaining = member.size
+                    with open(output_path, "wb") as out:
+                        while remaining > 0:
+                            chunk = stream.read(min(READ_BUFFER_SIZE, remaining))
+                            if not chunk:
+                                raise EOFError("unexpected end of archive data")
+                            out.write(chunk)
+                            remaining -= len(chunk)
+                    written.add(output_path)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to extract {os.path.basename(output_path)}: {e}"
+                    )
+        return written
+
+    def _inspect_rar(
+        self, archive_path: str, st: Optional[os.stat_result] = None
+    ) -> list[AssetInfo]:
         """
         Inspect a RAR archive for 3D assets.
 
-        Uses the rarfile library which is configured at import time
-        to use the best available extraction tool (unrar, bsdtar, 7z, unar).
+        Uses the rarfile library, which ensure_rar_configured() points at
+        the best available extraction tool (unrar, bsdtar, 7z, unar) on
+        first use.
         """
-        if not HAS_RARFILE:
+        if not ensure_rar_configured():
             logger.warning("rarfile not available — RAR archives cannot be read")
             return []
 
         try:
             assets = []
-            with rarfile.RarFile(archive_path, "r") as rf:
-                all_names = rf.namelist()
-                for name in all_names:
-                    inner_path = PurePosixPath(name)
-                    ext = inner_path.suffix.lower()
-                    if ext in SUPPORTED_3D_EXTENSIONS:
-                        related = self._find_related_in_list(name, all_names)
-                        info = rf.getinfo(name)
-                        assets.append(AssetInfo(
-                            name=inner_path.stem,
-                            path=archive_path,
-                            extension=ext,
-                            size=info.file_size,
-                            is_in_archive=True,
-                            archive_path=archive_path,
-                            inner_path=name,
-                            related_files=related,
-                        ))
+            rf = open_rar(archive_path, st)
+            # One pass over the members: each name is split once, sizes
+            # come straight from each info (no getinfo lookups)
+            models, candidates = self._classify_members(
+                (info.filename, info.file_size) for info in rf.infolist()
+            )
+            related_index = self._store_related_index(
+                archive_path, candidates, st
+            )
+            for name, size, stem, ext in models:
+                related = self._find_related_indexed(name, related_index)
+                assets.append(AssetInfo(
+                    name=stem,
+                    path=archive_path,
+                    extension=ext,
+                    size=size,
+                    is_in_archive=True,
+                    archive_path=archive_path,
+                    inner_path=name,
+                    related_files=related,
+                ))
             return assets
         except Exception as e:
             logger.warning(f"RAR inspection failed for {archive_path}: {e}")
@@ -467,221 +1394,519 @@ class ArchiveInspector:
     # ==========================================================
 
     def _extract_from_zip(
-        self, archive_path: str, inner_path: str
+        self,
+        archive_path: str,
+        inner_path: str,
+        related: Optional[list[str]] = None,
     ) -> Optional[str]:
         """Extract an asset and related files from a ZIP archive."""
         try:
             temp_dir = self._get_temp_dir(archive_path)
-
-            with zipfile.ZipFile(archive_path, "r") as zf:
-                # Extract the main asset
-                zf.extract(inner_path, temp_dir)
-
-                # Also extract related files
-                all_names = zf.namelist()
-                related = self._find_related_in_list(inner_path, all_names)
-                for rel in related:
-                    try:
-                        zf.extract(rel, temp_dir)
-                    except Exception:
-                        pass
+            if related is None:
+                related = self._known_related_files(archive_path, inner_path)
+
+            zf, lock = open_zip(archive_path)
+            if related is None:
+                with lock:
+                    related = self._find_related_indexed(
+                        inner_path, self._get_related_index(archive_path, zf)
+                    )
+
+            # The asset and its related files are extracted together
+            failed = self._extract_zip_members_parallel(
+                archive_path, [inner_path] + related, temp_dir
+            )
+            if inner_path in failed:
+                _remove_if_present(os.path.join(temp_dir, inner_path))
+                logger.error(f"ZIP extraction failed for {inner_path}")
+                return None
 
             return os.path.join(temp_dir, inner_path)
         except Exception as e:
             logger.error(f"ZIP extraction failed for {inner_path}: {e}")
             return None
 
+    @staticmethod
+    def _extract_zip_members_parallel(
+        archive_path: str, names: list[str], temp_dir: str
+    ) -> set[str]:
+        """
+        Extract several ZIP members concurrently (best effort).
+
+        Members are split into one batch per worker. The first batch goes
+        through the shared cached handle (under its lock); every other
+        worker opens its own ZipFile (a shared handle is not thread-safe)
+        and reuses it for its whole batch, so the central directory is
+        parsed at most once per extra worker rather than once per file.
+        zlib releases the GIL while inflating, so textures decompress in
+        parallel.
+
+        Returns:
+            The names that could not be extracted.
+        """
+        if not names:
+            return set()
+
+        # Pre-create target directories so workers don't race in makedirs
+        for name in names:
+            os.makedirs(
+                os.path.dirname(os.path.join(temp_dir, name)), exist_ok=True
+            )
+
+        workers = min(ZIP_EXTRACT_WORKERS, len(names))
+        batches = [names[i::workers] for i in range(workers)]
+
+        def extract_all(zf: zipfile.ZipFile, batch: list[str]) -> set[str]:
+            failed = set()
+            for name in batch:
+                try:
+                    zf.extract(name, temp_dir)
+                except Exception:
+                    failed.add(name)
+            return failed
+
+        def extract_batch(batch: list[str]) -> set[str]:
+            with zipfile.ZipFile(archive_path, "r") as zf:
+                return extract_all(zf, batch)
+
+        def extract_shared(batch: list[str]) -> set[str]:
+            zf, lock = open_zip(archive_path)
+            with lock:
+                return extract_all(zf, batch)
+
+        if workers == 1:
+            return extract_shared(batches[0])
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(extract_shared, batches[0])]
+            futures += [pool.submit(extract_batch, b) for b in batches[1:]]
+            return set().union(*(f.result() for f in futures))
+
     def _extract_from_rar(
-        self, archive_path: str, inner_path: str
+        self,
+        archive_path: str,
+        inner_path: str,
+        related: Optional[list[str]] = None,
     ) -> Optional[str]:
         """
         Extract an asset and related files from a RAR archive.
 
         Strategy:
-        1. Try rarfile library (which delegates to configured tool)
-        2. If that fails, fall back to direct subprocess extraction
-           (full archive extract — more reliable for problematic RARs)
+        1. Try rarfile library (which delegates to configured tool) for the
+           asset; related files go through one batched CLI call
+        2. If that fails, fall back to direct subprocess extraction: first
+           just the asset + related files in one call, then the full
+           archive (more reliable for problematic RARs)
         """
-        if not HAS_RARFILE:
+        if not ensure_rar_configured():
             logger.error("rarfile not available — cannot extract RAR")
             return None
 
         temp_dir = self._get_temp_dir(archive_path)
         target_path = os.path.join(temp_dir, inner_path)
 
-        # Reuse if already extracted and non-empty
-        if os.path.exists(target_path) and os.path.getsize(target_path) > 0:
+        # Reuse if already extracted and non-empty, once its related files
+        # are on disk too (a full extraction already covers every member)
+        if _nonempty(target_path):
+            if archive_path in self._rar_fully_extracted:
+                return target_path
+            known = related
+            if known is None:
+                known = self._known_related_files(archive_path, inner_path) or []
+            missing = [
+                rel for rel in known
+                if not os.path.exists(os.path.join(temp_dir, rel))
+            ]
+            if missing:
+                # Finish a partial earlier extraction in one batched call
+                try:
+                    self._run_rar_cli(archive_path, temp_dir, missing)
+                except Exception as e:
+                    logger.debug(f"Could not complete RAR extraction: {e}")
             return target_path
 
         # Clean up any empty file from a previous failed attempt
-        if os.path.exists(target_path) and os.path.getsize(target_path) == 0:
-            os.remove(target_path)
+        _remove_if_present(target_path)
 
-        # Strategy 1: Try rarfile library
+        # Strategy 1: Try rarfile library, unless it already failed for
+        # this archive (e.g. bsdtar-only setups yielding 0-byte files)
         try:
-            with rarfile.RarFile(archive_path, "r") as rf:
-                rf.extract(inner_path, temp_dir)
-
-                all_names = rf.namelist()
-                related = self._find_related_in_list(inner_path, all_names)
+            if related is None:
+                related = self._known_related_files(archive_path, inner_path)
+            rf = open_rar(archive_path)
+            if related is None:
+                related = self._find_related_indexed(
+                    inner_path, self._get_related_index(archive_path, rf)
+                )
+            with self._extracted_lock:
+                if archive_path in self._rarfile_broken:
+                    raise Exception("rarfile previously failed for this archive")
+                if (
+                    not self._rarfile_worked
+                    and self._rarfile_failures >= RARFILE_MAX_FAILURES
+                ):
+                    raise Exception("rarfile has failed for every archive so far")
+
+            rf.extract(inner_path, temp_dir)
+
+            # rarfile spawns the tool once per member; batch the related
+            # files into a single invocation when the tool supports it
+            batched = self._run_rar_cli(archive_path, temp_dir, related)
+            if batched is None or batched.returncode != 0:
                 for rel in related:
                     try:
                         rf.extract(rel, temp_dir)
                     except Exception:
                         pass
 
-            if os.path.exists(target_path) and os.path.getsize(target_path) > 0:
+            if _nonempty(target_path):
+                with self._extracted_lock:
+                    self._rarfile_worked = True
                 return target_path
             else:
-                # rarfile created empty file — clean up and try CLI
-                if os.path.exists(target_path):
-                    os.remove(target_path)
+                # rarfile created empty file — clean up and try CLI. Only
+                # this symptom counts against rarfile: a corrupt archive or
+                # a missing member fails the same way with the CLI too.
+                _remove_if_present(target_path)
+                with self._extracted_lock:
+                    if archive_path not in self._rarfile_broken:
+                        self._rarfile_broken.add(archive_path)
+                        self._rarfile_failures += 1
                 raise Exception("rarfile extracted 0-byte file")
         except Exception as e:
             logger.debug(f"rarfile extraction failed, trying direct CLI: {e}")
 
-        # Strategy 2: Direct CLI extraction (full archive)
-        # This is more reliable — extracts everything then we pick what we need
-        tool = rarfile.UNRAR_TOOL
-        if tool:
+        # Strategy 2: Direct CLI extraction, one invocation for the asset
+        # and its related files, then the asset alone (a related name the
+        # tool rejects, e.g. one it reads as a wildcard, must not force a
+        # full extraction), then the full archive as a last resort
+        # (extracts everything, then we pick what we need)
+        selections = [[inner_path] + related] if related else []
+        selections += [[inner_path], None]
+        for selection in selections:
             try:
-                tool_name = os.path.basename(tool)
-                if "bsdtar" in tool_name:
-                    cmd = [tool, "-xf", archive_path, "-C", temp_dir]
-                elif "unrar" in tool_name:
-                    cmd = [tool, "x", "-y", "-o+", archive_path, temp_dir + "/"]
-                elif "7z" in tool_name:
-                    cmd = [tool, "x", f"-o{temp_dir}", "-y", archive_path]
-                elif "unar" in tool_name:
-                    cmd = [tool, "-o", temp_dir, "-f", archive_path]
-                else:
-                    cmd = None
-
-                if cmd:
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-                    if result.returncode == 0 and os.path.exists(target_path) and os.path.getsize(target_path) > 0:
-                        logger.info(f"RAR extracted via direct CLI: {inner_path}")
-                        return target_path
-                    else:
-                        logger.warning(f"CLI extraction returned {result.returncode}: {result.stderr[:200]}")
+                result = self._run_rar_cli(archive_path, temp_dir, selection)
             except Exception as e:
                 logger.error(f"Direct CLI RAR extraction failed: {e}")
+                continue
+            if result is None:
+                break
+            if result.returncode == 0 and _nonempty(target_path):
+                if selection is None:
+                    self._rar_fully_extracted.add(archive_path)
+                logger.info(f"RAR extracted via direct CLI: {inner_path}")
+                return target_path
+            stderr = result.stderr[:200].decode("utf-8", "replace")
+            logger.warning(f"CLI extraction returned {result.returncode}: {stderr}")
 
         logger.error(f"All RAR extraction methods failed for {inner_path}")
         return None
 
+    @staticmethod
+    def _run_rar_cli(
+        archive_path: str, temp_dir: str, members: Optional[list[str]] = None
+    ) -> Optional[subprocess.CompletedProcess]:
+        """
+        Extract RAR members with the configured tool in a single process.
+
+        Args:
+            archive_path: Path to the archive.
+            temp_dir: Destination directory.
+            members: Member names to extract, or None for the whole archive.
+
+        Returns:
+            The finished process, or None if no supported tool is configured
+            (or there is nothing to extract).
+        """
+        tool = rarfile.UNRAR_TOOL if ensure_rar_configured() else None
+        if not tool or members == []:
+            return None
+
+        list_file = None
+        try:
+            if members:
+                # Pass names through a list file (unrar/7z "@file", bsdtar
+                # "-T file") so long selections don't hit argv limits
+                with tempfile.NamedTemporaryFile(
+                    "w", suffix=".lst", delete=False, encoding="utf-8"
+                ) as f:
+                    f.write("\n".join(members) + "\n")
+                    list_file = f.name
+
+            tool_name = os.path.basename(tool)
+            if "bsdtar" in tool_name:
+                cmd = [tool, "-xf", archive_path, "-C", temp_dir]
+                if list_file:
+                    cmd += ["-T", list_file]
+            elif "unrar" in tool_name:
+                cmd = [tool, "x", "-y", "-o+", archive_path]
+                if list_file:
+                    cmd.append(f"@{list_file}")
+                cmd.append(temp_dir + "/")
+            elif "7z" in tool_name:
+                cmd = [tool, "x", f"-o{temp_dir}", "-y", archive_path]
+                if list_file:
+                    cmd.append(f"@{list_file}")
+            elif "unar" in tool_name:
+                cmd = [tool, "-o", temp_dir, "-f", archive_path]
+                if members:
+                    cmd += members
+            else:
+                return None
+
+            # Extraction tools print one line per member; that output is
+            # never read, so it is discarded rather than piped and decoded.
+            # Only stderr is kept (as bytes) for error logging.
+            return subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=120,
+            )
+        finally:
+            if list_file:
+                try:
+                    os.remove(list_file)
+                except OSError:
+                    pass
+
     # ==========================================================
     # Utilities
     # ==========================================================
 
     def _get_temp_dir(self, archive_path: str) -> str:
         """Get or create a temporary directory for an archive."""
-        if archive_path not in self._temp_dirs:
-            self._temp_dirs[archive_path] = tempfile.mkdtemp(
-                prefix="3d_browser_"
+        # Routes run in a thread pool, so two requests for the same archive
+        # must not race to create separate directories.
+        with self._temp_dirs_lock:
+            if self._temp_root is None:
+                os.makedirs(self._temp_base, exist_ok=True)
+                self._temp_root = tempfile.mkdtemp(
+                    prefix="meshvault_", dir=self._temp_base
+                )
+            if archive_path not in self._temp_dirs:
+                self._temp_dirs[archive_path] = tempfile.mkdtemp(
+                    prefix="3d_browser_", dir=self._temp_root
+                )
+            return self._temp_dirs[archive_path]
+
+    def _remember_extracted(
+        self, key: tuple[str, str], st: os.stat_result, extracted_path: str
+    ):
+        """
+        Record a finished extraction and evict the least recently used ones.
+
+        Eviction deletes only the evicted asset's own extracted file; related
+        files (textures, .mtl) stay because other assets may share them.
+        """
+        with self._extracted_lock:
+            self._extracted[key] = (st.st_mtime_ns, st.st_size, extracted_path)
+            self._extracted.move_to_end(key)
+            evicted = []
+            while len(self._extracted) > EXTRACT_CACHE_MAXSIZE:
+                evicted.append(self._extracted.popitem(last=False)[1][2])
+
+        for stale in evicted:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+    def _known_related_files(
+        self, archive_path: str, inner_path: str
+    ) -> Optional[list[str]]:
+        """
+        Related files already discovered by inspection, or None.
+
+        Uses the cached asset listing (see get_asset_entry), so extracting a
+        browsed asset doesn't re-list the archive and redo the related-file
+        search. None means the asset isn't listed (e.g. it was hidden by a
+        preferred format) and the caller must search itself.
+        """
+        entry = self.get_asset_entry(archive_path, inner_path)
+        return list(entry.related_files) if entry is not None else None
+
+    def _get_related_index(self, archive_path: str, handle) -> _RelatedIndex:
+        """
+        Return the related-file index of a ZIP/RAR archive.
+
+        Reuses the index built when the archive was last inspected while
+        its mtime and size are unchanged; otherwise lists the archive
+        through the given ZipFile/RarFile handle and caches the result.
+        """
+        st = os.stat(archive_path)
+        with self._related_indexes_lock:
+            cached = self._related_indexes.get(archive_path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._related_indexes.move_to_end(archive_path)
+                return cached[2]
+        _, candidates = self._classify_members(
+            (info.filename, info.file_size) for info in handle.infolist()
+        )
+        return self._store_related_index(archive_path, candidates, st)
+
+    def _store_related_index(
+        self,
+        archive_path: str,
+        candidates: list[tuple[str, str, str, str]],
+        st: Optional[os.stat_result] = None,
+    ) -> _RelatedIndex:
+        """Build an archive's related-file index and keep it for reuse."""
+        index = self._build_related_index(candidates)
+        if st is None:
+            st = os.stat(archive_path)
+        with self._related_indexes_lock:
+            self._related_indexes[archive_path] = (
+                st.st_mtime_ns, st.st_size, index
             )
-        return self._temp_dirs[archive_path]
+            self._related_indexes.move_to_end(archive_path)
+            while len(self._related_indexes) > RELATED_INDEX_CACHE_SIZE:
+                self._related_indexes.popitem(last=False)
+        return index
 
-    def _find_related_in_list(
-        self, asset_name: str, all_names: list[str]
-    ) -> list[str]:
+    @staticmethod
+    def _classify_members(
+        members: Iterable[tuple[str, int]]
+    ) -> tuple[list, list]:
         """
-        Find related files for a 3D asset within an archive's file list.
+        Split every ZIP/RAR member name once and sort members into 3D models
+        and related-file candidates.
 
-        Searches:
-        1. Same directory (e.g., model.mtl next to model.obj)
-        2. Common texture subdirectories (textures/, tex/, maps/)
-        3. Any file in the archive whose name contains the asset stem
+        Args:
+            members: (name, uncompressed size) pairs.
+
+        Returns:
+            (models, candidates): models as (name, size, stem, ext) tuples,
+            and RELATED_EXTENSIONS members as (name, parent, stem, ext)
+            tuples ready for _build_related_index().
         """
-        asset_path = PurePosixPath(asset_name)
-        asset_stem = asset_path.stem.lower()
-        asset_dir = str(asset_path.parent)
-
-        # Common texture folder names for direct matching (nearby files)
-        direct_texture_dirs = {
-            "textures", "texture", "tex", "maps", "map",
-            "materials", "material", "mat",
-        }
-        # Broader fallback directories used only when direct matching finds nothing
-        fallback_texture_dirs = direct_texture_dirs | {
-            "images", "image", "sourceimages", "sourceimage",
-        }
-
-        related = []
-        seen = set()
-
-        def add_related(name: str):
-            if name not in seen:
-                related.append(name)
-                seen.add(name)
-
-        for name in all_names:
-            if name == asset_name:
-                continue
-            name_path = PurePosixPath(name)
-            name_ext = name_path.suffix.lower()
+        models = []
+        candidates = []
+        for name, size in members:
+            parent, stem, ext = _split(name)
+            if ext in SUPPORTED_3D_EXTENSIONS:
+                models.append((name, size, stem, ext))
+            elif ext in RELATED_EXTENSIONS:
+                candidates.append((name, parent, stem, ext))
+        return models, candidates
 
-            if name_ext not in RELATED_EXTENSIONS:
-                continue
+    @staticmethod
+    def _build_related_index(
+        candidates: list[tuple[str, str, str, str]],
+    ) -> _RelatedIndex:
+        """
+        Index an archive's candidate related files (textures, .mtl) once.
 
-            name_dir = str(name_path.parent)
-            name_stem = name_path.stem.lower()
+        Each candidate is filed under its parent directory, under every
+        stem prefix that ends at a ``_``/``-``/space separator, and in the
+        texture-folder lists, so per-asset lookups touch only the entries
+        that can actually match instead of the whole archive listing.
 
-            # 1. Same directory
-            if name_dir == asset_dir:
-                add_related(name)
-                continue
+        Args:
+            candidates: (name, parent, stem, ext) tuples of the archive's
+                        RELATED_EXTENSIONS members, as returned by
+                        _classify_members().
+        """
+        index = _RelatedIndex()
+        # folder -> (top-level texture dir, texture dir, fallback texture dir)
+        dir_classes: dict[str, tuple[bool, bool, bool]] = {}
+
+        for name, name_dir, name_stem, name_ext in candidates:
+            i = len(index.names)
+            index.names.append(name)
+
+            index.by_dir.setdefault(name_dir, []).append(i)
+
+            # Members share few distinct folders: lower and split each
+            # folder name once, not once per file
+            dir_flags = dir_classes.get(name_dir)
+            if dir_flags is None:
+                dir_parts = name_dir.lower().split("/")
+                dir_flags = dir_classes[name_dir] = (
+                    len(dir_parts) == 1 and dir_parts[0] in DIRECT_TEXTURE_DIRS,
+                    dir_parts[-1] in DIRECT_TEXTURE_DIRS,
+                    any(part in FALLBACK_TEXTURE_DIRS for part in dir_parts),
+                )
+            in_root_texture_dir, in_texture_dir, in_fallback_dir = dir_flags
+
+            if in_root_texture_dir:
+                index.root_texture_dir_hits.append(i)
+            if in_texture_dir:
+                index.texture_dir_hits.append(i)
+
+            # "station_diffuse" is reachable from "station_diffuse" and
+            # "station", matching the startswith(stem + sep) rule below.
+            name_stem = name_stem.lower()
+            prefixes = {name_stem}
+            prefixes.update(
+                name_stem[:pos] for pos, ch in enumerate(name_stem)
+                if ch in "_- "
+            )
+            for prefix in prefixes:
+                index.by_stem_prefix.setdefault(prefix, []).append(i)
 
-            # 2. Known texture subdirectory (e.g., textures/diffuse.png)
-            if asset_dir == ".":
-                # Asset is at root — check if file is in a texture subfolder
-                if name_dir.lower() in direct_texture_dirs:
-                    add_related(name)
-                    continue
-            else:
-                if name_dir.split("/")[-1].lower() in direct_texture_dirs:
-                    add_related(name)
-                    continue
+            if in_fallback_dir:
+                index.fallback_hits.append(i)
+            if name_ext != ".mtl":
+                index.image_hits.append(i)
 
-            # 3. Filename matches the asset stem (strict prefix/token match).
-            # Avoid loose substring matches like "asteroid_1" matching
-            # "asteroid_10" or "asteroid_11".
-            if (
-                name_stem == asset_stem or
-                name_stem.startswith(asset_stem + "_") or
-                name_stem.startswith(asset_stem + "-") or
-                name_stem.startswith(asset_stem + " ")
-            ):
-                add_related(name)
+        return index
+
+    @staticmethod
+    def _find_related_indexed(
+        asset_name: str, index: _RelatedIndex
+    ) -> list[str]:
+        """
+        Find related files for a 3D asset using a prebuilt related index.
+
+        Searches:
+        1. Same directory (e.g., model.mtl next to model.obj)
+        2. Common texture subdirectories (textures/, tex/, maps/)
+        3. Any file in the archive whose name contains the asset stem
+
+        Results keep the archive's listing order.
+        """
+        asset_dir, asset_stem, asset_ext = _split(asset_name)
+        asset_stem = asset_stem.lower()
+
+        names = index.names
+
+        def collect(hits, limit: Optional[int] = None) -> list[str]:
+            related = []
+            seen = set()
+            for i in hits:
+                name = names[i]
+                if name != asset_name and name not in seen:
+                    related.append(name)
+                    seen.add(name)
+                    if len(related) == limit:
+                        break
+            return related
+
+        # 1. Same directory, 2. known texture subdirectory
+        # (e.g. textures/diffuse.png), 3. filename matches the asset stem
+        # (strict prefix/token match: "asteroid_1" must not match
+        # "asteroid_10" or "asteroid_11").
+        hits = set(index.by_dir.get(asset_dir, ()))
+        if asset_dir == ".":
+            # Asset is at root — check if file is in a texture subfolder
+            hits.update(index.root_texture_dir_hits)
+        else:
+            hits.update(index.texture_dir_hits)
+        hits.update(index.by_stem_prefix.get(asset_stem, ()))
+        related = collect(sorted(hits))
 
         # Fallback A:
         # If nothing matched directly, include files from common texture folders
         # anywhere in the archive (useful for packs with shared image banks).
         if not related:
-            for name in all_names:
-                if name == asset_name:
-                    continue
-                name_path = PurePosixPath(name)
-                name_ext = name_path.suffix.lower()
-                if name_ext not in RELATED_EXTENSIONS:
-                    continue
-                dir_parts = [p.lower() for p in name_path.parent.parts]
-                if any(part in fallback_texture_dirs for part in dir_parts):
-                    add_related(name)
+            related = collect(index.fallback_hits)
 
         # Fallback B (FBX only):
         # Some FBX exports store material names without explicit texture links.
         # Provide a broader candidate pool so frontend can resolve by naming.
-        if not related and asset_path.suffix.lower() == ".fbx":
+        if not related and asset_ext == ".fbx":
             max_candidates = 200
-            for name in all_names:
-                if name == asset_name:
-                    continue
-                name_path = PurePosixPath(name)
-                name_ext = name_path.suffix.lower()
-                if name_ext in RELATED_EXTENSIONS and name_ext != ".mtl":
-                    add_related(name)
-                    if len(related) >= max_candidates:
-                        break
+            related = collect(index.image_hits, limit=max_candidates)
 
         return related
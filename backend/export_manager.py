@@ -9,16 +9,63 @@ Responsible for:
 
 import os
 import shutil
-import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 from dataclasses import dataclass
 
-try:
-    import rarfile
-    HAS_RARFILE = True
-except ImportError:
-    HAS_RARFILE = False
+from backend.archive_inspector import ensure_rar_configured, open_rar, open_zip
+
+# Maximum threads used to copy an asset's related files during export
+EXPORT_COPY_WORKERS = 8
+
+# Chunk size for streaming archive members to disk (bounded memory)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _copy_stream(src: IO[bytes], dst: IO[bytes], buf: bytearray):
+    """
+    Copy a file object into another through a caller-owned buffer.
+
+    Unlike shutil.copyfileobj, which allocates a new bytes object per
+    chunk, reads go straight into ``buf`` so an export of many archive
+    members reuses one chunk-sized buffer throughout.
+    """
+    view = memoryview(buf)
+    while True:
+        n = src.readinto(buf)
+        if not n:
+            break
+        dst.write(view[:n])
+
+
+def _fast_copy(src: str, dst: str):
+    """
+    Copy a file and its metadata, like shutil.copy2.
+
+    Where available (Linux), os.copy_file_range copies in the kernel and
+    lets filesystems that support it (btrfs, XFS, NFS 4.2) clone or
+    server-side-copy the data instead of moving it through user space.
+    Falls back to shutil.copy2 when the call isn't supported for this
+    pair of files (e.g. across filesystems on older kernels).
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), remaining
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
 
 
 @dataclass
@@ -114,27 +161,33 @@ class ExportManager:
             asset_dir = target_dir / new_name
             asset_dir.mkdir(parents=True, exist_ok=True)
 
-            # Copy main asset
+            # Plan destinations first (main asset, then related files
+            # preserving their extensions) so the copies can run in parallel
             dest = asset_dir / f"{new_name}{ext}"
-            if not self._is_same_path(src, dest):
-                shutil.copy2(str(src), str(dest))
-            exported.append(str(dest))
-
-            # Copy related files, preserving their extensions
+            copies = [(src, dest)]
+            planned = {dest}
             for rel_path in related_files:
                 rel_src = Path(rel_path)
                 rel_dest = asset_dir / f"{new_name}{rel_src.suffix}"
                 # If multiple related files share an extension, use original name
-                if rel_dest.exists():
+                if rel_dest in planned or rel_dest.exists():
                     rel_dest = asset_dir / rel_src.name
-                if not self._is_same_path(rel_src, rel_dest):
-                    shutil.copy2(str(rel_src), str(rel_dest))
-                exported.append(str(rel_dest))
+                # Two copies must never share a destination: number the
+                # names of related files that share a basename
+                n = 1
+                while rel_dest in planned:
+                    rel_dest = asset_dir / f"{rel_src.stem}_{n}{rel_src.suffix}"
+                    n += 1
+                planned.add(rel_dest)
+                copies.append((rel_src, rel_dest))
+
+            self._copy_files_parallel(copies)
+            exported.extend(str(d) for _, d in copies)
         else:
             # Single file => just copy with new name
             dest = target_dir / f"{new_name}{ext}"
             if not self._is_same_path(src, dest):
-                shutil.copy2(str(src), str(dest))
+                _fast_copy(str(src), str(dest))
             exported.append(str(dest))
 
         return ExportResult(
@@ -144,6 +197,28 @@ class ExportManager:
             files_exported=exported,
         )
 
+    def _copy_files_parallel(self, copies: list[tuple[Path, Path]]):
+        """
+        Copy (source, destination) pairs concurrently.
+
+        The copies release the GIL during the kernel copy, so an export
+        with many textures takes roughly as long as its largest file.
+        Any copy error is re-raised to the caller.
+        """
+        copies = [(s, d) for s, d in copies if not self._is_same_path(s, d)]
+        if len(copies) <= 1:
+            for s, d in copies:
+                _fast_copy(str(s), str(d))
+            return
+
+        workers = min(EXPORT_COPY_WORKERS, len(copies))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_fast_copy, str(s), str(d)) for s, d in copies
+            ]
+            for future in futures:
+                future.result()
+
     def _export_from_archive(
         self,
         archive_path: str,
@@ -176,7 +251,7 @@ class ExportManager:
             exported = self._extract_and_rename_zip(
                 archive_path, paths_to_extract, out_dir, new_name, asset_ext
             )
-        elif ext_lower == ".rar" and HAS_RARFILE:
+        elif ext_lower == ".rar" and ensure_rar_configured():
             exported = self._extract_and_rename_rar(
                 archive_path, paths_to_extract, out_dir, new_name, asset_ext
             )
@@ -205,21 +280,25 @@ class ExportManager:
     ) -> list[str]:
         """Extract files from a ZIP and rename the main asset."""
         exported = []
-        with zipfile.ZipFile(archive_path, "r") as zf:
-            for i, inner in enumerate(paths):
-                data = zf.read(inner)
-                inner_ext = Path(inner).suffix
-                if i == 0:
-                    # Main asset gets the new name
-                    dest = out_dir / f"{new_name}{main_ext}"
+        buf = bytearray(COPY_BUFFER_SIZE)
+        # Shared handle: the central directory is parsed once per archive
+        zf, lock = open_zip(archive_path)
+        for i, inner in enumerate(paths):
+            with lock:
+                member = zf.open(inner)
+            inner_ext = Path(inner).suffix
+            if i == 0:
+                # Main asset gets the new name
+                dest = out_dir / f"{new_name}{main_ext}"
+            else:
+                # Related files keep original names unless single export
+                if len(paths) > 1:
+                    dest = out_dir / Path(inner).name
                 else:
-                    # Related files keep original names unless single export
-                    if len(paths) > 1:
-                        dest = out_dir / Path(inner).name
-                    else:
-                        dest = out_dir / f"{new_name}{inner_ext}"
-                dest.write_bytes(data)
-                exported.append(str(dest))
+                    dest = out_dir / f"{new_name}{inner_ext}"
+            with member, open(dest, "wb") as out:
+                _copy_stream(member, out, buf)
+            exported.append(str(dest))
         return exported
 
     def _extract_and_rename_rar(
@@ -231,20 +310,22 @@ class ExportManager:
         main_ext: str,
     ) -> list[str]:
         """Extract files from a RAR and rename the main asset."""
-        if not HAS_RARFILE:
+        if not ensure_rar_configured():
             return []
         exported = []
-        with rarfile.RarFile(archive_path, "r") as rf:
-            for i, inner in enumerate(paths):
-                data = rf.read(inner)
-                inner_ext = Path(inner).suffix
-                if i == 0:
-                    dest = out_dir / f"{new_name}{main_ext}"
+        buf = bytearray(COPY_BUFFER_SIZE)
+        rf = open_rar(archive_path)
+        for i, inner in enumerate(paths):
+            member = rf.open(inner)
+            inner_ext = Path(inner).suffix
+            if i == 0:
+                dest = out_dir / f"{new_name}{main_ext}"
+            else:
+                if len(paths) > 1:
+                    dest = out_dir / Path(inner).name
                 else:
-                    if len(paths) > 1:
-                        dest = out_dir / Path(inner).name
-                    else:
-                        dest = out_dir / f"{new_name}{inner_ext}"
-                dest.write_bytes(data)
-                exported.append(str(dest))
+                    dest = out_dir / f"{new_name}{inner_ext}"
+            with member, open(dest, "wb") as out:
+                _copy_stream(member, out, buf)
+            exported.append(str(dest))
         return exported
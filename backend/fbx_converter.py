@@ -17,18 +17,74 @@ This parser handles:
   - Multiple geometry nodes (multi-mesh models)
 """
 
+import mmap
+import os
+import re
 import struct
 import zlib
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional, BinaryIO
 
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
 # FBX binary magic header
 FBX_MAGIC = b"Kaydara FBX Binary  \x00"
 
+# Array property type code -> little-endian element dtype
+_ARRAY_DTYPES = {
+    "f": np.dtype("<f4"),
+    "d": np.dtype("<f8"),
+    "i": np.dtype("<i4"),
+    "l": np.dtype("<i8"),
+    "b": np.dtype("?"),
+}
+
+# Maximum processes used by convert_fbx_to_obj_batch
+CONVERT_WORKERS = os.cpu_count() or 4
+
+# Precompiled decoders for record headers and length prefixes
+_NODE_HEADER_32 = struct.Struct("<III")  # end_offset, num_props, prop_list_len
+_NODE_HEADER_64 = struct.Struct("<QQQ")
+_ARRAY_HEADER = struct.Struct("<III")    # array_length, encoding, compressed_length
+_UINT32 = struct.Struct("<I")
+
+# Scalar property type code -> decoder
+_SCALAR_STRUCTS = {
+    "Y": struct.Struct("<h"),  # int16
+    "C": struct.Struct("<?"),  # bool (1 byte)
+    "I": struct.Struct("<i"),  # int32
+    "F": struct.Struct("<f"),  # float32
+    "D": struct.Struct("<d"),  # float64
+    "L": struct.Struct("<q"),  # int64
+}
+
+# ASCII FBX: "; FBX 6.1.0 project file" header and numeric array blocks
+_ASCII_VERSION_PATTERN = re.compile(r"FBX\s+(\d+)\.(\d+)")
+_ASCII_VERTICES_PATTERN = re.compile(
+    r"Vertices:\s*([\d\s.,eE+-]+?)(?=\n\s*\w|\n\s*})",
+    re.DOTALL
+)
+_ASCII_INDICES_PATTERN = re.compile(
+    r"PolygonVertexIndex:\s*([\d\s.,eE+-]+?)(?=\n\s*\w|\n\s*})",
+    re.DOTALL
+)
+_ASCII_NORMALS_PATTERN = re.compile(
+    r"Normals:\s*([\d\s.,eE+-]+?)(?=\n\s*\w|\n\s*})",
+    re.DOTALL
+)
+
 
 @dataclass
 class FBXProperty:
@@ -37,86 +93,111 @@ class FBXProperty:
     value: object
 
 
+# FBXNode.numeric_kind: property layout, recorded by the binary parser
+NUMERIC_UNKNOWN = 0  # not classified (node not built by the parser)
+NUMERIC_ARRAY = 1    # first property is an array (FBX 7000+ style)
+NUMERIC_SCALARS = 2  # every property is a numeric scalar (FBX 6100 style)
+NUMERIC_OTHER = 3    # no properties, strings, or a mix
+
+
 @dataclass
 class FBXNode:
     """A node in the FBX tree structure."""
     name: str
     properties: list[FBXProperty] = field(default_factory=list)
     children: list["FBXNode"] = field(default_factory=list)
+    numeric_kind: int = NUMERIC_UNKNOWN
+    # name -> children, built on first lookup (children are final once parsed)
+    _child_index: Optional[dict[str, list["FBXNode"]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _index(self) -> dict[str, list["FBXNode"]]:
+        index = self._child_index
+        if index is None:
+            index = {}
+            for child in self.children:
+                index.setdefault(child.name, []).append(child)
+            self._child_index = index
+        return index
 
     def find(self, name: str) -> Optional["FBXNode"]:
         """Find a direct child node by name."""
-        for child in self.children:
-            if child.name == name:
-                return child
-        return None
+        matches = self._index().get(name)
+        return matches[0] if matches else None
 
     def find_all(self, name: str) -> list["FBXNode"]:
         """Find all direct children with the given name."""
-        return [c for c in self.children if c.name == name]
+        return list(self._index().get(name, ()))
 
     def find_recursive(self, name: str) -> list["FBXNode"]:
         """Find all descendants with the given name (depth-first)."""
         results = []
-        for child in self.children:
-            if child.name == name:
-                results.append(child)
-            results.extend(child.find_recursive(name))
+        # Explicit stack: no recursion limit on deep scenes. Children are
+        # pushed reversed so they pop in document order.
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            if node.name == name:
+                results.append(node)
+            stack.extend(reversed(node.children))
         return results
 
 
 @dataclass
 class GeometryData:
-    """Extracted geometry from an FBX file."""
-    vertices: list[float] = field(default_factory=list)   # [x,y,z, x,y,z, ...]
-    indices: list[int] = field(default_factory=list)       # polygon vertex indices
-    normals: list[float] = field(default_factory=list)     # [nx,ny,nz, ...]
-    uvs: list[float] = field(default_factory=list)         # [u,v, u,v, ...]
-    uv_indices: list[int] = field(default_factory=list)    # UV index mapping
+    """
+    Extracted geometry from an FBX file.
+
+    Flat ndarrays: floats keep the precision stored in the file (float32
+    or float64), indices are int32 unless the file stores int64.
+    """
+    vertices: np.ndarray = field(default_factory=lambda: np.empty(0, np.float64))   # [x,y,z, x,y,z, ...]
+    indices: np.ndarray = field(default_factory=lambda: np.empty(0, np.int32))      # polygon vertex indices
+    normals: np.ndarray = field(default_factory=lambda: np.empty(0, np.float64))    # [nx,ny,nz, ...]
+    uvs: np.ndarray = field(default_factory=lambda: np.empty(0, np.float64))        # [u,v, u,v, ...]
+    uv_indices: np.ndarray = field(default_factory=lambda: np.empty(0, np.int32))   # UV index mapping
 
 
-def get_fbx_version(file_path: str) -> Optional[int]:
+def _probe_fbx(file_path: str) -> tuple[str, Optional[int]]:
     """
-    Read the FBX version from a file header.
+    Identify an FBX file from its header with a single read.
 
-    Handles both binary FBX (Kaydara header) and ASCII FBX (; FBX x.y.z).
-    Returns the version number (e.g., 6100, 7400) or None if not a valid FBX.
+    Returns ("binary", version), ("ascii", version or None) or
+    ("none", None) for anything that is not an FBX file.
     """
     try:
-        with open(file_path, "rb") as f:
+        # Unbuffered: read just the header, not a full 8 KiB buffer
+        with open(file_path, "rb", buffering=0) as f:
             header = f.read(27)
+    except Exception:
+        return "none", None
 
-            # Binary FBX: starts with "Kaydara FBX Binary  \x00"
-            if header[:21] == FBX_MAGIC:
-                version = struct.unpack("<I", header[23:27])[0]
-                return version
+    # Binary FBX: starts with "Kaydara FBX Binary  \x00"
+    if header[:21] == FBX_MAGIC and len(header) == 27:
+        return "binary", _UINT32.unpack_from(header, 23)[0]
 
-            # ASCII FBX: starts with "; FBX x.y.z project file"
-            try:
-                text = header.decode("ascii", errors="ignore")
-                if text.startswith("; FBX"):
-                    # Parse version from "; FBX 6.1.0 project file"
-                    import re
-                    match = re.search(r"FBX\s+(\d+)\.(\d+)", text)
-                    if match:
-                        major = int(match.group(1))
-                        minor = int(match.group(2))
-                        return major * 1000 + minor * 100
-            except Exception:
-                pass
+    # ASCII FBX: starts with "; FBX x.y.z project file"
+    if header.startswith(b"; FBX"):
+        text = header.decode("ascii", errors="ignore")
+        match = _ASCII_VERSION_PATTERN.search(text)
+        if match:
+            major = int(match.group(1))
+            minor = int(match.group(2))
+            return "ascii", major * 1000 + minor * 100
+        return "ascii", None
 
-        return None
-    except Exception:
-        return None
+    return "none", None
 
 
-def is_ascii_fbx(file_path: str) -> bool:
-    """Check if an FBX file is ASCII format (not binary)."""
-    try:
-        with open(file_path, "rb") as f:
-            return f.read(5) == b"; FBX"
-    except Exception:
-        return False
+def get_fbx_version(file_path: str) -> Optional[int]:
+    """
+    Read the FBX version from a file header.
+
+    Handles both binary FBX (Kaydara header) and ASCII FBX (; FBX x.y.z).
+    Returns the version number (e.g., 6100, 7400) or None if not a valid FBX.
+    """
+    return _probe_fbx(file_path)[1]
 
 
 def convert_fbx_to_obj(fbx_path: str, obj_path: str) -> bool:
@@ -131,11 +212,12 @@ def convert_fbx_to_obj(fbx_path: str, obj_path: str) -> bool:
         True if conversion succeeded, False otherwise.
     """
     try:
+        kind, version = _probe_fbx(fbx_path)
+
         # Handle ASCII FBX separately
-        if is_ascii_fbx(fbx_path):
+        if kind == "ascii":
             return _convert_ascii_fbx_to_obj(fbx_path, obj_path)
 
-        version = get_fbx_version(fbx_path)
         if version is None:
             logger.error(f"Not a valid FBX file: {fbx_path}")
             return False
@@ -165,164 +247,215 @@ def convert_fbx_to_obj(fbx_path: str, obj_path: str) -> bool:
         return False
 
 
+def convert_fbx_to_obj_batch(pairs: list[tuple[str, str]]) -> list[bool]:
+    """
+    Convert several FBX files to OBJ in parallel worker processes.
+
+    The parser is pure-Python and CPU-bound, so processes (not threads)
+    are used to spread files across cores.
+
+    Args:
+        pairs: (fbx_path, obj_path) tuples.
+
+    Returns:
+        One success flag per pair, in input order.
+    """
+    if len(pairs) <= 1:
+        return [convert_fbx_to_obj(fbx, obj) for fbx, obj in pairs]
+
+    workers = min(CONVERT_WORKERS, len(pairs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(convert_fbx_to_obj, *zip(*pairs)))
+
+
 # ========================================
 # Binary FBX Parser
 # ========================================
 
 def _parse_fbx_binary(file_path: str, version: int) -> Optional[FBXNode]:
-    """Parse a binary FBX file into a node tree."""
+    """
+    Parse a binary FBX file into a node tree.
+
+    The file is memory-mapped and decoded in place with an integer
+    cursor, instead of going through many small read() calls. When it
+    cannot be mapped, it is read whole in one call, so neither path
+    needs a read buffer.
+    """
     try:
-        with open(file_path, "rb") as f:
-            # Skip header: 21 (magic) + 2 (padding) + 4 (version) = 27 bytes
-            f.read(27)
+        with open(file_path, "rb", buffering=0) as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty file or a file system without mmap support
+                return _parse_fbx_buffer(f.readall(), version)
+            with mm:
+                with memoryview(mm) as buf:
+                    return _parse_fbx_buffer(buf, version)
+    except Exception as e:
+        logger.error(f"FBX parse error: {e}")
+        return None
 
-            root = FBXNode(name="__root__")
 
-            # For versions < 7500, offsets are 32-bit
-            # For versions >= 7500, offsets are 64-bit
-            use_64bit = version >= 7500
+def _parse_fbx_buffer(buf, version: int) -> FBXNode:
+    """Parse the node records of a binary FBX file held in ``buf``."""
+    root = FBXNode(name="__root__")
 
-            while True:
-                node = _read_node(f, version, use_64bit)
-                if node is None:
-                    break
-                root.children.append(node)
+    # For versions < 7500, offsets are 32-bit
+    # For versions >= 7500, offsets are 64-bit
+    use_64bit = version >= 7500
 
-            return root
-    except Exception as e:
-        logger.error(f"FBX parse error: {e}")
-        return None
+    # Skip header: 21 (magic) + 2 (padding) + 4 (version) = 27 bytes
+    pos = 27
+    while True:
+        node, pos = _read_node(buf, pos, version, use_64bit)
+        if node is None:
+            break
+        root.children.append(node)
 
+    return root
 
-def _read_node(f: BinaryIO, version: int, use_64bit: bool) -> Optional[FBXNode]:
-    """Read a single FBX node record."""
-    if use_64bit:
-        data = f.read(25)  # 8+8+8+1
-        if len(data) < 25:
-            return None
-        end_offset, num_props, prop_list_len = struct.unpack("<QQQ", data[:24])
-        name_len = data[24]
-    else:
-        data = f.read(13)  # 4+4+4+1
-        if len(data) < 13:
-            return None
-        end_offset, num_props, prop_list_len = struct.unpack("<III", data[:12])
-        name_len = data[12]
+
+def _read_node(buf, pos: int, version: int, use_64bit: bool) -> tuple[Optional[FBXNode], int]:
+    """Read a single FBX node record at ``pos``; returns (node, next_pos)."""
+    header = _NODE_HEADER_64 if use_64bit else _NODE_HEADER_32
+    header_size = header.size  # 24 or 12, followed by a 1-byte name length
+    if pos + header_size + 1 > len(buf):
+        return None, pos
+    end_offset, num_props, prop_list_len = header.unpack_from(buf, pos)
+    name_len = buf[pos + header_size]
+    pos += header_size + 1
 
     # Null node sentinel (all zeros)
     if end_offset == 0:
-        return None
+        return None, pos
 
-    name_bytes = f.read(name_len)
-    name = name_bytes.decode("ascii", errors="replace")
+    name = bytes(buf[pos:pos + name_len]).decode("ascii", errors="replace")
+    pos += name_len
 
     node = FBXNode(name=name)
+    properties = node.properties
 
-    # Read properties
+    # Read properties, tracking whether all of them are numeric scalars
+    all_scalars = True
     for _ in range(num_props):
-        prop = _read_property(f)
+        prop, pos = _read_property(buf, pos)
         if prop is not None:
-            node.properties.append(prop)
+            properties.append(prop)
+            if prop.type_code not in _SCALAR_STRUCTS:
+                all_scalars = False
+
+    if not properties:
+        node.numeric_kind = NUMERIC_OTHER
+    elif properties[0].type_code in _ARRAY_DTYPES:
+        node.numeric_kind = NUMERIC_ARRAY
+    else:
+        node.numeric_kind = NUMERIC_SCALARS if all_scalars else NUMERIC_OTHER
 
     # Read child nodes (everything until end_offset)
-    while f.tell() < end_offset:
-        child = _read_node(f, version, use_64bit)
+    while pos < end_offset:
+        child, pos = _read_node(buf, pos, version, use_64bit)
         if child is None:
             # Null sentinel or end of children
             break
         node.children.append(child)
 
-    # Ensure we're at the right position
-    if f.tell() != end_offset:
-        f.seek(end_offset)
+    # Continue right after this node's record
+    return node, end_offset
 
-    return node
 
+def _read_property(buf, pos: int) -> tuple[Optional[FBXProperty], int]:
+    """Read a single FBX property value at ``pos``; returns (property, next_pos)."""
+    if pos >= len(buf):
+        return None, pos
 
-def _read_property(f: BinaryIO) -> Optional[FBXProperty]:
-    """Read a single FBX property value."""
-    type_code_byte = f.read(1)
-    if not type_code_byte:
-        return None
+    entry = _PROPERTY_READERS.get(buf[pos])
+    if entry is None:
+        logger.warning(f"Unknown FBX property type: {chr(buf[pos])}")
+        return None, pos + 1
 
-    tc = chr(type_code_byte[0])
-
-    # Scalar types
-    if tc == "Y":  # int16
-        val = struct.unpack("<h", f.read(2))[0]
-    elif tc == "C":  # bool (1 byte)
-        val = struct.unpack("<?", f.read(1))[0]
-    elif tc == "I":  # int32
-        val = struct.unpack("<i", f.read(4))[0]
-    elif tc == "F":  # float32
-        val = struct.unpack("<f", f.read(4))[0]
-    elif tc == "D":  # float64
-        val = struct.unpack("<d", f.read(8))[0]
-    elif tc == "L":  # int64
-        val = struct.unpack("<q", f.read(8))[0]
-
-    # Array types
-    elif tc == "f":  # float32 array
-        val = _read_array(f, "<f", 4)
-    elif tc == "d":  # float64 array
-        val = _read_array(f, "<d", 8)
-    elif tc == "i":  # int32 array
-        val = _read_array(f, "<i", 4)
-    elif tc == "l":  # int64 array
-        val = _read_array(f, "<q", 8)
-    elif tc == "b":  # bool array
-        val = _read_array(f, "<?", 1)
+    type_code, reader = entry
+    val, pos = reader(buf, pos + 1)
+    return FBXProperty(type_code=type_code, value=val), pos
 
-    # String and raw data
-    elif tc == "S":  # string
-        length = struct.unpack("<I", f.read(4))[0]
-        val = f.read(length).decode("utf-8", errors="replace")
-    elif tc == "R":  # raw bytes
-        length = struct.unpack("<I", f.read(4))[0]
-        val = f.read(length)
 
-    else:
-        logger.warning(f"Unknown FBX property type: {tc}")
-        return None
+def _scalar_reader(scalar: struct.Struct):
+    """Build a (buf, pos) -> (value, next_pos) reader for a fixed-size scalar."""
+    unpack_from = scalar.unpack_from
+    size = scalar.size
+
+    def read(buf, pos: int):
+        return unpack_from(buf, pos)[0], pos + size
+
+    return read
+
+
+def _read_string(buf, pos: int) -> tuple[str, int]:
+    """Read a length-prefixed UTF-8 string property."""
+    length = _UINT32.unpack_from(buf, pos)[0]
+    pos += 4
+    return bytes(buf[pos:pos + length]).decode("utf-8", errors="replace"), pos + length
 
-    return FBXProperty(type_code=tc, value=val)
 
+def _read_raw(buf, pos: int) -> tuple[bytes, int]:
+    """Read a length-prefixed raw bytes property."""
+    length = _UINT32.unpack_from(buf, pos)[0]
+    pos += 4
+    return bytes(buf[pos:pos + length]), pos + length
 
-def _read_array(f: BinaryIO, fmt: str, elem_size: int) -> list:
+
+def _read_array(buf, pos: int, dtype: np.dtype) -> tuple[np.ndarray, int]:
     """
-    Read an FBX array property.
+    Read an FBX array property at ``pos``; returns (array, next_pos).
 
-    Arrays can be raw or zlib-compressed.
+    Arrays can be raw or zlib-compressed. The decoded bytes are wrapped
+    by an ndarray without unpacking them into Python objects.
     """
-    header = f.read(12)
-    if len(header) < 12:
-        return []
+    elem_size = dtype.itemsize
+    empty = np.empty(0, dtype=dtype)
+
+    if pos + _ARRAY_HEADER.size > len(buf):
+        return empty, len(buf)
 
-    array_length, encoding, compressed_length = struct.unpack("<III", header)
+    array_length, encoding, compressed_length = _ARRAY_HEADER.unpack_from(buf, pos)
+    pos += _ARRAY_HEADER.size
 
     if encoding == 0:
-        # Raw data
-        raw = f.read(array_length * elem_size)
+        # Raw data; copied so the array does not pin the mapped file
+        raw = bytes(buf[pos:pos + array_length * elem_size])
+        pos += len(raw)
     elif encoding == 1:
-        # Zlib compressed
-        compressed = f.read(compressed_length)
+        # Zlib compressed; the output size is known from the header, so
+        # the result buffer is allocated once at full size instead of
+        # being grown (and copied) from zlib's 16 KiB default
+        compressed = buf[pos:pos + compressed_length]
+        pos += len(compressed)
         try:
-            raw = zlib.decompress(compressed)
+            raw = zlib.decompress(compressed, bufsize=max(array_length * elem_size, 1))
         except zlib.error:
             logger.warning("Failed to decompress FBX array data")
-            return []
+            return empty, pos
     else:
         logger.warning(f"Unknown FBX array encoding: {encoding}")
-        f.read(compressed_length)
-        return []
+        return empty, pos + compressed_length
 
-    # Unpack the array
     count = len(raw) // elem_size
     if count != array_length:
         # Use actual data length, be flexible
         count = min(count, array_length)
 
-    return list(struct.unpack(f"<{count}{fmt[1]}", raw[:count * elem_size]))
+    return np.frombuffer(raw, dtype=dtype, count=count), pos
+
+
+# Property type code byte -> (type code, reader); dispatch without chr()
+_PROPERTY_READERS = {
+    # Scalars (Y: int16, C: bool, I: int32, F: float32, D: float64, L: int64)
+    **{ord(tc): (tc, _scalar_reader(st)) for tc, st in _SCALAR_STRUCTS.items()},
+    # Arrays (f: float32, d: float64, i: int32, l: int64, b: bool)
+    **{ord(tc): (tc, partial(_read_array, dtype=dt)) for tc, dt in _ARRAY_DTYPES.items()},
+    # String and raw data
+    ord("S"): ("S", _read_string),
+    ord("R"): ("R", _read_raw),
+}
 
 
 # ========================================
@@ -338,94 +471,278 @@ def _extract_geometries(root: FBXNode) -> list[GeometryData]:
     """
     geometries = []
 
-    # Strategy 1: Look for Geometry nodes in the Objects section
-    objects_node = root.find("Objects")
-    if objects_node:
-        # In FBX 6100, geometry can be under Model nodes directly
-        # In FBX 7000+, it's in separate Geometry nodes
-        geom_nodes = objects_node.find_recursive("Vertices")
-        processed_parents = set()
-
-        for verts_node in geom_nodes:
-            # Walk up to find the parent that has both Vertices and PolygonVertexIndex
-            # (the verts_node IS the Vertices node, its parent has PolygonVertexIndex)
-            pass
-
-    # Strategy 2: Recursive search for Vertices + PolygonVertexIndex pairs
-    # This is more robust and works across FBX versions
+    # Search for Vertices + PolygonVertexIndex pairs anywhere in the tree.
+    # In FBX 6100, geometry can be under Model nodes directly;
+    # in FBX 7000+, it's in separate Geometry nodes.
     _find_geometry_pairs(root, geometries)
 
     return geometries
 
 
-def _extract_property_values(node: FBXNode, cast_fn=float) -> list:
+def _extract_property_values(node: FBXNode, dtype=np.float64) -> np.ndarray:
     """
-    Extract numeric values from an FBX node's properties.
+    Extract numeric values from an FBX node's properties as an ndarray.
 
     Handles two storage formats:
     - FBX 7000+: single array property (type 'd', 'f', 'i', 'l')
     - FBX 6100:  many individual scalar properties (type 'D', 'F', 'I', 'L')
+
+    Parsed nodes carry their layout in ``numeric_kind``, so no per-property
+    type check is needed for them.
     """
     if not node or not node.properties:
-        return []
+        return np.empty(0, dtype=dtype)
 
-    first = node.properties[0]
+    properties = node.properties
+    kind = node.numeric_kind
+    if kind == NUMERIC_UNKNOWN and isinstance(properties[0].value, np.ndarray):
+        kind = NUMERIC_ARRAY
 
-    # Array property (FBX 7000+ style)
-    if isinstance(first.value, list):
-        return [cast_fn(v) for v in first.value]
+    # Array property (FBX 7000+ style), used as stored when it is already
+    # of the requested kind (float32 vertices stay float32, no copy)
+    if kind == NUMERIC_ARRAY:
+        first = properties[0].value
+        if first.dtype.kind == np.dtype(dtype).kind:
+            return first
+        return first.astype(dtype)
 
     # Individual scalar properties (FBX 6100 style)
-    return [cast_fn(p.value) for p in node.properties
-            if isinstance(p.value, (int, float))]
+    if kind == NUMERIC_SCALARS:
+        return np.fromiter(
+            (p.value for p in properties), dtype=dtype, count=len(properties)
+        )
+    return np.fromiter(
+        (p.value for p in properties if isinstance(p.value, (int, float))),
+        dtype=dtype,
+    )
 
 
-def _find_geometry_pairs(node: FBXNode, geometries: list[GeometryData]):
+def _find_geometry_pairs(root: FBXNode, geometries: list[GeometryData]):
     """
-    Recursively find nodes that contain both Vertices and PolygonVertexIndex
-    children, and extract geometry from them.
+    Find nodes that contain both Vertices and PolygonVertexIndex children,
+    and extract geometry from them (depth-first, in document order).
 
+    A geometry node's own children are not searched further.
     Handles both FBX 6100 (scalar properties) and FBX 7000+ (array properties).
     """
-    verts_node = node.find("Vertices")
-    indices_node = node.find("PolygonVertexIndex")
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        verts_node = node.find("Vertices")
+        indices_node = node.find("PolygonVertexIndex")
+
+        if not (verts_node and indices_node):
+            stack.extend(reversed(node.children))
+            continue
 
-    if verts_node and indices_node:
         geo = GeometryData()
 
         # Extract vertices (float values: x,y,z,x,y,z,...)
-        geo.vertices = _extract_property_values(verts_node, float)
+        geo.vertices = _extract_property_values(verts_node, np.float64)
 
         # Extract polygon indices (int values)
-        geo.indices = _extract_property_values(indices_node, int)
+        geo.indices = _extract_property_values(indices_node, np.int32)
 
         # Extract normals (optional)
         normals_layer = node.find("LayerElementNormal")
         if normals_layer:
             normals_node = normals_layer.find("Normals")
-            geo.normals = _extract_property_values(normals_node, float)
+            geo.normals = _extract_property_values(normals_node, np.float64)
 
         # Extract UVs (optional)
         uv_layer = node.find("LayerElementUV")
         if uv_layer:
             uv_node = uv_layer.find("UV")
-            geo.uvs = _extract_property_values(uv_node, float)
+            geo.uvs = _extract_property_values(uv_node, np.float64)
 
             uvi_node = uv_layer.find("UVIndex")
-            geo.uv_indices = _extract_property_values(uvi_node, int)
+            geo.uv_indices = _extract_property_values(uvi_node, np.int32)
 
-        if geo.vertices and geo.indices:
+        if len(geo.vertices) and len(geo.indices):
             geometries.append(geo)
-    else:
-        # Recurse into children
-        for child in node.children:
-            _find_geometry_pairs(child, geometries)
 
 
 # ========================================
 # OBJ Writer
 # ========================================
 
+# Rows (or face corners) formatted per batch (bounds the temporary tuple/bytes)
+OBJ_ROWS_PER_BATCH = 65536
+
+# Per-corner face formats by number of index columns
+_CORNER_FORMATS = {1: b"%d", 2: b"%d//%d", 3: b"%d/%d/%d"}
+
+# Buffer size for the OBJ output file
+OBJ_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def _write_rows(
+    f: BinaryIO, prefix: bytes, values: np.ndarray, width: int, column: bytes = b" %.6f"
+) -> int:
+    """
+    Write a flat array as OBJ rows of ``width`` columns.
+
+    Each batch of rows is formatted by a single bytes ``%`` operation,
+    so there is no per-row f-string or write() call. ``column`` is the
+    per-value format ("%.6f" by default, "%r" for Python's shortest
+    repr). A trailing incomplete row is ignored. Returns the number of
+    rows written.
+    """
+    num_rows = len(values) // width
+    line = prefix + column * width + b"\n"
+    for start in range(0, num_rows, OBJ_ROWS_PER_BATCH):
+        rows = min(OBJ_ROWS_PER_BATCH, num_rows - start)
+        batch = values[start * width:(start + rows) * width].tolist()
+        f.write((line * rows) % tuple(batch))
+    return num_rows
+
+
+def _format_faces_kernel(
+    columns: np.ndarray, is_end: np.ndarray, first_line_start: bool
+) -> np.ndarray:
+    """
+    Render OBJ face lines as ASCII bytes (compiled with Numba when available).
+
+    ``columns`` holds one row of positive 1-based indices per corner: v,
+    v//vn or v/vt/vn. ``is_end`` flags the last corner of each polygon;
+    ``first_line_start`` tells whether the first corner opens a face.
+    A first pass sizes the output so the digits are written into a single
+    preallocated uint8 buffer.
+    """
+    num_corners, width = columns.shape
+    slashes = 2 if width == 2 else 1  # "v//vn" vs "v/vt/vn"
+
+    size = 0
+    line_start = first_line_start
+    for i in range(num_corners):
+        if line_start:
+            size += 2  # "f "
+        for c in range(width):
+            value = columns[i, c]
+            size += 1
+            while value >= 10:
+                value //= 10
+                size += 1
+        size += (width - 1) * slashes + 1  # slashes, then " " or "\n"
+        line_start = is_end[i]
+
+    out = np.empty(size, dtype=np.uint8)
+    pos = 0
+    line_start = first_line_start
+    for i in range(num_corners):
+        if line_start:
+            out[pos] = 102  # "f"
+            out[pos + 1] = 32  # " "
+            pos += 2
+        for c in range(width):
+            if c:
+                for _ in range(slashes):
+                    out[pos] = 47  # "/"
+                    pos += 1
+            value = columns[i, c]
+            digits = 1
+            rest = value
+            while rest >= 10:
+                rest //= 10
+                digits += 1
+            for d in range(digits - 1, -1, -1):
+                out[pos + d] = 48 + value % 10
+                value //= 10
+            pos += digits
+        out[pos] = 10 if is_end[i] else 32  # "\n" or " "
+        pos += 1
+        line_start = is_end[i]
+    return out
+
+
+if HAS_NUMBA:
+    _format_faces_kernel = njit(cache=True)(_format_faces_kernel)
+
+
+def _write_faces(
+    f: BinaryIO,
+    indices: np.ndarray,
+    vertex_offset: int,
+    normal_offset: Optional[int] = None,
+    uv_indices: Optional[np.ndarray] = None,
+    uv_offset: int = 0,
+    normal_limit: Optional[int] = None,
+) -> int:
+    """
+    Write FBX polygon-vertex indices as OBJ "f" lines.
+
+    A negative index marks the last corner of a polygon (actual index =
+    ~value); corners after the last polygon end are dropped. Normals and
+    UV indices are per polygon-vertex, so corner k uses normal k and
+    uv_indices[k] (0 when missing). Without ``normal_offset`` only vertex
+    indices are written; UVs are only written together with normals.
+    With ``normal_limit``, corners from that index on are written without
+    a normal (the ASCII converter's handling of short Normals arrays).
+
+    The index columns are computed with numpy. With Numba installed the
+    text is produced by a compiled kernel; otherwise each batch of
+    corners is rendered by one bytes ``%`` operation. Returns the face
+    count.
+    """
+    indices = np.asarray(indices)
+    ends = np.flatnonzero(indices < 0)
+    if not len(ends):
+        return 0
+
+    num_corners = int(ends[-1]) + 1
+    idx = indices[:num_corners].astype(np.int64)
+
+    # Branchless ~x for negatives: x >> 63 is -1 for negatives and 0
+    # otherwise, and x ^ -1 == ~x (no mask or two-way select as np.where)
+    resolved = idx ^ (idx >> 63)
+
+    # One column per OBJ index, all 1-based: v[, vt], vn
+    columns = [resolved + (1 + vertex_offset)]
+    if normal_offset is not None:
+        if uv_indices is not None and len(uv_indices):
+            uv = np.zeros(num_corners, dtype=np.int64)
+            known = min(num_corners, len(uv_indices))
+            uv[:known] = uv_indices[:known]
+            columns.append(uv + (1 + uv_offset))
+        columns.append(np.arange(num_corners, dtype=np.int64) + (1 + normal_offset))
+
+    # (start, stop, column count) runs of corners sharing one format
+    width = len(columns)
+    if width > 1 and normal_limit is not None and normal_limit < num_corners:
+        runs = [(0, normal_limit, width), (normal_limit, num_corners, 1)]
+    else:
+        runs = [(0, num_corners, width)]
+    runs = [run for run in runs if run[0] < run[1]]
+
+    is_end = idx < 0
+    if HAS_NUMBA:
+        table = np.column_stack(columns)
+        for start, stop, run_width in runs:
+            line_start = start == 0 or bool(is_end[start - 1])
+            f.write(_format_faces_kernel(
+                table[start:stop, :run_width], is_end[start:stop], line_start
+            ))
+        return len(ends)
+
+    # Separator after each corner: a space within a polygon, and after its
+    # last corner the newline plus the next line's "f "
+    seps = np.where(is_end, b"\nf ", b" ").astype(object)
+    seps[-1] = b"\n"
+
+    f.write(b"f ")
+    for start, stop, run_width in runs:
+        pattern = _CORNER_FORMATS[run_width] + b"%s"
+        for lo in range(start, stop, OBJ_ROWS_PER_BATCH):
+            hi = min(lo + OBJ_ROWS_PER_BATCH, stop)
+            args = np.empty((hi - lo, run_width + 1), dtype=object)
+            for c in range(run_width):
+                args[:, c] = columns[c][lo:hi]
+            args[:, -1] = seps[lo:hi]
+            f.write((pattern * (hi - lo)) % tuple(args.ravel().tolist()))
+
+    return len(ends)
+
+
 def _write_obj(geometries: list[GeometryData], obj_path: str):
     """
     Write geometry data to a Wavefront OBJ file.
@@ -440,80 +757,36 @@ def _write_obj(geometries: list[GeometryData], obj_path: str):
     normal_offset = 0
     uv_offset = 0
 
-    with open(obj_path, "w") as f:
-        f.write(f"# Converted from FBX by MeshVault\n")
-        f.write(f"# Geometries: {len(geometries)}\n\n")
+    with open(obj_path, "wb", buffering=OBJ_WRITE_BUFFER_SIZE) as f:
+        f.write(b"# Converted from FBX by MeshVault\n")
+        f.write(b"# Geometries: %d\n\n" % len(geometries))
 
         for gi, geo in enumerate(geometries):
             if len(geometries) > 1:
-                f.write(f"o Mesh_{gi}\n")
+                f.write(b"o Mesh_%d\n" % gi)
 
-            # Write vertices
-            num_verts = len(geo.vertices) // 3
-            for i in range(num_verts):
-                x = geo.vertices[i * 3]
-                y = geo.vertices[i * 3 + 1]
-                z = geo.vertices[i * 3 + 2]
-                f.write(f"v {x:.6f} {y:.6f} {z:.6f}\n")
+            num_verts = _write_rows(f, b"v", geo.vertices, 3)
 
             # Write normals (if per-vertex or per-polygon-vertex)
             has_normals = len(geo.normals) > 0
             if has_normals:
-                num_normals = len(geo.normals) // 3
-                for i in range(num_normals):
-                    nx = geo.normals[i * 3]
-                    ny = geo.normals[i * 3 + 1]
-                    nz = geo.normals[i * 3 + 2]
-                    f.write(f"vn {nx:.6f} {ny:.6f} {nz:.6f}\n")
-
-            # Write UVs
+                _write_rows(f, b"vn", geo.normals, 3)
+
             has_uvs = len(geo.uvs) > 0
             if has_uvs:
-                num_uvs = len(geo.uvs) // 2
-                for i in range(num_uvs):
-                    u = geo.uvs[i * 2]
-                    v = geo.uvs[i * 2 + 1]
-                    f.write(f"vt {u:.6f} {v:.6f}\n")
+                _write_rows(f, b"vt", geo.uvs, 2)
 
             # Write faces
             # FBX polygon indices: positive = vertex index, negative = last vertex
             # of polygon (actual index = ~value, i.e. bitwise NOT)
-            f.write(f"\n")
-
-            polygon = []
-            normal_idx = 0  # Running index for per-polygon-vertex normals
-
-            for raw_idx in geo.indices:
-                if raw_idx < 0:
-                    # Last vertex of this polygon
-                    actual = ~raw_idx
-                    polygon.append((actual, normal_idx))
-                    normal_idx += 1
-
-                    # Write the face
-                    face_parts = []
-                    for vi, ni in polygon:
-                        # OBJ indices are 1-based
-                        v_idx = vi + 1 + vertex_offset
-
-                        if has_normals and has_uvs and geo.uv_indices:
-                            # v/vt/vn
-                            uv_i = geo.uv_indices[ni - len(polygon) + polygon.index((vi, ni))] if ni < len(geo.uv_indices) else 0
-                            n_idx = ni + 1 + normal_offset
-                            uv_idx = uv_i + 1 + uv_offset
-                            face_parts.append(f"{v_idx}/{uv_idx}/{n_idx}")
-                        elif has_normals:
-                            # v//vn
-                            n_idx = ni + 1 + normal_offset
-                            face_parts.append(f"{v_idx}//{n_idx}")
-                        else:
-                            face_parts.append(f"{v_idx}")
-
-                    f.write(f"f {' '.join(face_parts)}\n")
-                    polygon = []
-                else:
-                    polygon.append((raw_idx, normal_idx))
-                    normal_idx += 1
+            f.write(b"\n")
+
+            _write_faces(
+                f, geo.indices, vertex_offset,
+                normal_offset=normal_offset if has_normals else None,
+                uv_indices=geo.uv_indices if has_uvs else None,
+                uv_offset=uv_offset,
+            )
 
             # Update offsets for next geometry
             vertex_offset += num_verts
@@ -522,12 +795,10 @@ def _write_obj(geometries: list[GeometryData], obj_path: str):
             if has_uvs:
                 uv_offset += len(geo.uvs) // 2
 
-            f.write(f"\n")
+            f.write(b"\n")
 
     total_verts = sum(len(g.vertices) // 3 for g in geometries)
-    total_faces = sum(
-        sum(1 for idx in g.indices if idx < 0) for g in geometries
-    )
+    total_faces = sum(int(np.count_nonzero(g.indices < 0)) for g in geometries)
     logger.info(f"OBJ written: {total_verts} vertices, {total_faces} faces")
 
 
@@ -535,6 +806,11 @@ def _write_obj(geometries: list[GeometryData], obj_path: str):
 # ASCII FBX Parser (for FBX 6.x text format)
 # =============================================================
 
+def _parse_ascii_numbers(text: str, dtype) -> np.ndarray:
+    """Parse a comma/whitespace separated ASCII FBX number list in C."""
+    return np.fromstring(text.replace(",", " "), dtype=dtype, sep=" ")
+
+
 def _convert_ascii_fbx_to_obj(fbx_path: str, obj_path: str) -> bool:
     """
     Convert an ASCII FBX file to Wavefront OBJ format.
@@ -542,35 +818,16 @@ def _convert_ascii_fbx_to_obj(fbx_path: str, obj_path: str) -> bool:
     ASCII FBX 6.x stores geometry in a text tree structure.
     Vertices are in "Vertices:" arrays, faces in "PolygonVertexIndex:".
     """
-    import re
-
     logger.info(f"Parsing ASCII FBX: {fbx_path}")
 
     try:
         with open(fbx_path, "r", errors="replace") as f:
             content = f.read()
 
-        # Extract all Vertices blocks
-        all_vertices = []
-        all_indices = []
-
-        # Find Vertices: x,y,z,x,y,z,...
-        vert_pattern = re.compile(
-            r"Vertices:\s*([\d\s.,eE+-]+?)(?=\n\s*\w|\n\s*})",
-            re.DOTALL
-        )
-        idx_pattern = re.compile(
-            r"PolygonVertexIndex:\s*([\d\s.,eE+-]+?)(?=\n\s*\w|\n\s*})",
-            re.DOTALL
-        )
-        normal_pattern = re.compile(
-            r"Normals:\s*([\d\s.,eE+-]+?)(?=\n\s*\w|\n\s*})",
-            re.DOTALL
-        )
-
-        vert_matches = vert_pattern.findall(content)
-        idx_matches = idx_pattern.findall(content)
-        normal_matches = normal_pattern.findall(content)
+        # Find Vertices: x,y,z,x,y,z,... (and the matching index/normal blocks)
+        vert_matches = _ASCII_VERTICES_PATTERN.findall(content)
+        idx_matches = _ASCII_INDICES_PATTERN.findall(content)
+        normal_matches = _ASCII_NORMALS_PATTERN.findall(content)
 
         if not vert_matches:
             logger.error("No vertices found in ASCII FBX")
@@ -580,90 +837,59 @@ def _convert_ascii_fbx_to_obj(fbx_path: str, obj_path: str) -> bool:
         geometries = []
         for i, vert_text in enumerate(vert_matches):
             # Parse vertices
-            nums = [float(x) for x in re.findall(r'[+-]?\d+\.?\d*(?:[eE][+-]?\d+)?', vert_text)]
-            vertices = nums
+            vertices = _parse_ascii_numbers(vert_text, np.float64)
 
             # Parse indices
-            indices = []
+            indices = np.empty(0, dtype=np.int32)
             if i < len(idx_matches):
-                indices = [int(x) for x in re.findall(r'-?\d+', idx_matches[i])]
+                indices = _parse_ascii_numbers(idx_matches[i], np.int32)
 
             # Parse normals (optional)
-            normals = []
+            normals = np.empty(0, dtype=np.float64)
             if i < len(normal_matches):
-                normals = [float(x) for x in re.findall(r'[+-]?\d+\.?\d*(?:[eE][+-]?\d+)?', normal_matches[i])]
+                normals = _parse_ascii_numbers(normal_matches[i], np.float64)
 
-            if vertices and indices:
-                geometries.append({
-                    "vertices": vertices,
-                    "indices": indices,
-                    "normals": normals,
-                })
+            if len(vertices) and len(indices):
+                geometries.append(GeometryData(
+                    vertices=vertices, indices=indices, normals=normals,
+                ))
 
         if not geometries:
             logger.error("No usable geometry found in ASCII FBX")
             return False
 
-        # Write OBJ
-        with open(obj_path, "w") as f:
-            f.write(f"# Converted from ASCII FBX by MeshVault\n")
-            f.write(f"# Geometries: {len(geometries)}\n\n")
+        # Write OBJ (values keep the text's precision: shortest repr)
+        with open(obj_path, "wb", buffering=OBJ_WRITE_BUFFER_SIZE) as f:
+            f.write(b"# Converted from ASCII FBX by MeshVault\n")
+            f.write(b"# Geometries: %d\n\n" % len(geometries))
 
             vertex_offset = 0
             normal_offset = 0
 
             for gi, geo in enumerate(geometries):
-                verts = geo["vertices"]
-                indices = geo["indices"]
-                normals = geo["normals"]
-                num_verts = len(verts) // 3
+                normals = geo.normals
                 has_normals = len(normals) >= 3
 
-                f.write(f"o Mesh_{gi}\n")
-
-                # Write vertices
-                for vi in range(num_verts):
-                    x = verts[vi * 3]
-                    y = verts[vi * 3 + 1]
-                    z = verts[vi * 3 + 2]
-                    f.write(f"v {x} {y} {z}\n")
+                f.write(b"o Mesh_%d\n" % gi)
 
-                # Write normals
+                num_verts = _write_rows(f, b"v", geo.vertices, 3, b" %r")
                 if has_normals:
-                    num_normals = len(normals) // 3
-                    for ni in range(num_normals):
-                        f.write(f"vn {normals[ni*3]} {normals[ni*3+1]} {normals[ni*3+2]}\n")
-
-                # Write faces from PolygonVertexIndex
-                # Negative index = end of polygon (bitwise NOT to get actual index)
-                polygon = []
-                normal_idx = 0
-                for raw_idx in indices:
-                    if raw_idx < 0:
-                        actual_idx = ~raw_idx
-                        polygon.append(actual_idx)
-                        # Write the face
-                        face_parts = []
-                        for vi in polygon:
-                            v = vi + 1 + vertex_offset
-                            if has_normals and normal_idx < len(normals) // 3:
-                                n = normal_idx + 1 + normal_offset
-                                face_parts.append(f"{v}//{n}")
-                                normal_idx += 1
-                            else:
-                                face_parts.append(str(v))
-                                normal_idx += 1
-                        f.write(f"f {' '.join(face_parts)}\n")
-                        polygon = []
-                    else:
-                        polygon.append(raw_idx)
+                    _write_rows(f, b"vn", normals, 3, b" %r")
+
+                # Write faces from PolygonVertexIndex; corners past the
+                # end of Normals are written without a normal
+                _write_faces(
+                    f, geo.indices, vertex_offset,
+                    normal_offset=normal_offset if has_normals else None,
+                    normal_limit=len(normals) // 3,
+                )
 
                 vertex_offset += num_verts
                 if has_normals:
                     normal_offset += len(normals) // 3
-                f.write("\n")
+                f.write(b"\n")
 
-        total_v = sum(len(g["vertices"]) // 3 for g in geometries)
+        total_v = sum(len(g.vertices) // 3 for g in geometries)
         logger.info(f"ASCII FBX → OBJ: {total_v} vertices written to {obj_path}")
         return True
 
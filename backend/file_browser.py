@@ -8,6 +8,12 @@ Responsible for:
 """
 
 import os
+import stat
+import threading
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
@@ -16,13 +22,79 @@ from backend.archive_inspector import ArchiveInspector
 
 
 # Supported 3D asset extensions
-SUPPORTED_3D_EXTENSIONS = {".obj", ".fbx", ".gltf", ".glb", ".stl"}
+SUPPORTED_3D_EXTENSIONS = frozenset({".obj", ".fbx", ".gltf", ".glb", ".stl"})
 
 # Supported archive extensions
-SUPPORTED_ARCHIVE_EXTENSIONS = {".zip", ".rar", ".unitypackage"}
+SUPPORTED_ARCHIVE_EXTENSIONS = frozenset({".zip", ".rar", ".unitypackage"})
+
+# Archives whose listing is remembered between browse calls
+ARCHIVE_LISTING_CACHE_SIZE = 512
+
+# Image files picked up as related textures, in lookup order
+TEXTURE_EXTENSIONS = (
+    ".png", ".jpg", ".jpeg", ".tga", ".bmp", ".tiff", ".tif", ".webp"
+)
+_TEXTURE_EXTENSION_SET = frozenset(TEXTURE_EXTENSIONS)
+
+# Companion files looked up by stem, per asset extension
+_RELATED_EXTENSIONS = {
+    ".obj": (".mtl",),
+    ".fbx": (),
+}
+
+# Every file extension browse() has a use for: assets, archives and the
+# files that can be related to an asset. Anything else is skipped on its
+# name alone.
+_LISTED_FILE_EXTENSIONS = tuple(sorted(
+    SUPPORTED_3D_EXTENSIONS
+    | SUPPORTED_ARCHIVE_EXTENSIONS
+    | _TEXTURE_EXTENSION_SET
+    | {ext for exts in _RELATED_EXTENSIONS.values() for ext in exts}
+))
+
+# How many folder levels below a texture folder are searched
+TEXTURE_DIR_MAX_DEPTH = 4
+
+# Folder names searched for an FBX's textures (compared lowercased)
+_TEXTURE_DIR_NAMES = frozenset({
+    "textures", "texture", "tex",
+    "maps", "map",
+    "images", "image",
+    "sourceimages", "sourceimage",
+    "materials", "material", "mat",
+})
+
+# Folders whose has_children answer is remembered between browse calls
+HAS_CHILDREN_CACHE_SIZE = 4096
+
+
+def _split_name(name: str) -> tuple[str, str]:
+    """Split a file name into (stem, lowercase extension), like splitext."""
+    stem, dot, tail = name.rpartition(".")
+    if not dot or not stem.strip("."):
+        return name, ""
+    return stem, "." + tail.lower()
+
+
+@lru_cache(maxsize=HAS_CHILDREN_CACHE_SIZE)
+def _has_visible_children_cached(dir_path: str, mtime_ns: int) -> bool:
+    """
+    Check a folder for visible children, memoized on its mtime.
+
+    Adding, removing or renaming an entry bumps the folder's mtime, so
+    repeat browses of an unchanged tree answer from the cache.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if not entry.name.startswith("."):
+                    return True
+    except PermissionError:
+        pass
+    return False
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetInfo:
     """Represents a discovered 3D asset."""
     name: str
@@ -36,7 +108,7 @@ class AssetInfo:
     related_files: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FolderInfo:
     """Represents a folder in the file browser."""
     name: str
@@ -44,7 +116,7 @@ class FolderInfo:
     has_children: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowseResult:
     """Result of browsing a directory."""
     current_path: str
@@ -64,8 +136,19 @@ class FileBrowser:
             root_path: Optional root constraint. If set, browsing is limited
                        to this directory and its descendants.
         """
-        self._root_path = Path(root_path).resolve() if root_path else None
+        self._root_path = Path(os.path.realpath(root_path)) if root_path else None
+        # Normalized root with a trailing separator, for prefix checks
+        self._root_prefix = (
+            os.path.normcase(os.path.join(self._root_path, ""))
+            if self._root_path else None
+        )
         self._archive_inspector = ArchiveInspector()
+        # LRU of archive listings:
+        # archive_path -> ((size, mtime_ns), [AssetInfo])
+        self._listing_cache: OrderedDict[
+            str, tuple[tuple[int, int], list[AssetInfo]]
+        ] = OrderedDict()
+        self._listing_cache_lock = threading.Lock()
 
     @property
     def root_path(self) -> Optional[Path]:
@@ -88,163 +171,235 @@ class FileBrowser:
             ValueError: If directory is outside the root path.
             FileNotFoundError: If directory doesn't exist.
         """
-        dir_path = Path(directory).resolve()
+        dir_path = os.path.realpath(directory)
 
         # Security: ensure we stay within root if one is set
-        if self._root_path and not self._is_within_root(dir_path):
+        if not self._is_within_root(dir_path):
             raise ValueError(
                 f"Access denied: {dir_path} is outside root {self._root_path}"
             )
 
-        if not dir_path.exists():
-            raise FileNotFoundError(f"Directory not found: {dir_path}")
+        try:
+            mode = os.stat(dir_path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Directory not found: {dir_path}") from None
 
-        if not dir_path.is_dir():
+        if not stat.S_ISDIR(mode):
             raise ValueError(f"Not a directory: {dir_path}")
 
         folders = []
+        # Direct AssetInfo entries, or an archive path placeholder that is
+        # replaced by the archive's assets once all archives are inspected
         assets = []
+        # archive path -> (size, mtime_ns), the listing cache key
+        archives: dict[str, tuple[int, int]] = {}
 
+        # os.scandir yields DirEntry objects whose type (and, on Windows,
+        # stat) data comes from the directory listing itself, so type
+        # checks on plain entries need no extra syscall per file.
         try:
-            entries = sorted(dir_path.iterdir(), key=lambda e: e.name.lower())
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda e: e.name.lower())
         except PermissionError:
             return BrowseResult(
-                current_path=str(dir_path),
+                current_path=dir_path,
                 parent_path=self._get_parent_path(dir_path),
                 folders=[],
                 assets=[],
             )
 
+        # Classify entries once. A file whose name has no extension of
+        # interest is dropped before any type check. The type checks are
+        # the only calls here that can fail (a symlink whose target cannot
+        # be stat'ed), so the loops below only guard their own stat() calls.
+        subdirs: list[os.DirEntry] = []
+        files: list[os.DirEntry] = []
+        # Sibling files by lowercase stem: related-file lookups become
+        # dict hits instead of existence probes per candidate name
+        files_by_stem: dict[str, list[os.DirEntry]] = {}
+        # Texture files as (lowercase name, entry), still sorted by name so
+        # prefix matches can be found with a bisect
+        textures: list[tuple[str, os.DirEntry]] = []
         for entry in entries:
+            name_lower = entry.name.lower()
             try:
-                # Skip hidden files/folders
-                if entry.name.startswith("."):
+                if not (
+                    name_lower.endswith(_LISTED_FILE_EXTENSIONS)
+                    and entry.is_file()
+                ):
+                    if entry.is_dir():
+                        subdirs.append(entry)
                     continue
-
-                if entry.is_dir():
-                    has_children = self._has_visible_children(entry)
-                    folders.append(FolderInfo(
-                        name=entry.name,
-                        path=str(entry),
-                        has_children=has_children,
-                    ))
-
-                elif entry.is_file():
-                    ext = entry.suffix.lower()
-
-                    # Direct 3D asset
-                    if ext in SUPPORTED_3D_EXTENSIONS:
-                        related = self._find_related_files(entry)
-                        assets.append(AssetInfo(
-                            name=entry.stem,
-                            path=str(entry),
-                            extension=ext,
-                            size=entry.stat().st_size,
-                            related_files=related,
-                        ))
-
-                    # Archive that might contain 3D assets
-                    elif ext in SUPPORTED_ARCHIVE_EXTENSIONS:
-                        archive_assets = self._archive_inspector.inspect(
-                            str(entry)
-                        )
-                        assets.extend(archive_assets)
-
-            except (PermissionError, OSError):
-                # Skip files we can't access
+            except OSError:
+                continue
+            files.append(entry)
+            stem_lower, ext = _split_name(name_lower)
+            files_by_stem.setdefault(stem_lower, []).append(entry)
+            if ext in _TEXTURE_EXTENSION_SET:
+                textures.append((name_lower, entry))
+
+        for entry in subdirs:
+            # Skip hidden folders
+            if entry.name.startswith("."):
+                continue
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+            folders.append(FolderInfo(
+                name=entry.name,
+                path=entry.path,
+                has_children=_has_visible_children_cached(entry.path, mtime_ns),
+            ))
+
+        for entry in files:
+            # Skip hidden files
+            if entry.name.startswith("."):
                 continue
+            stem, ext = _split_name(entry.name)
+
+            # Direct 3D asset
+            if ext in SUPPORTED_3D_EXTENSIONS:
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    # Skip files we can't access
+                    continue
+                assets.append(AssetInfo(
+                    name=stem,
+                    path=entry.path,
+                    extension=ext,
+                    size=size,
+                    related_files=self._find_related_files(
+                        stem, ext, subdirs, files_by_stem, textures
+                    ),
+                ))
+
+            # Archive that might contain 3D assets
+            elif ext in SUPPORTED_ARCHIVE_EXTENSIONS:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                archives[entry.path] = (st.st_size, st.st_mtime_ns)
+                assets.append(entry.path)
+
+        # Inspect the folder's archives concurrently, keeping listing order
+        if archives:
+            inspected = self._inspect_archives(archives)
+            expanded = []
+            for item in assets:
+                if isinstance(item, str):
+                    expanded.extend(inspected[item])
+                else:
+                    expanded.append(item)
+            assets = expanded
 
         return BrowseResult(
-            current_path=str(dir_path),
+            current_path=dir_path,
             parent_path=self._get_parent_path(dir_path),
             folders=folders,
             assets=assets,
         )
 
-    def _is_within_root(self, path: Path) -> bool:
-        """Check if a path is within the root directory."""
-        if self._root_path is None:
-            return True
-        try:
-            path.relative_to(self._root_path)
+    def _inspect_archives(
+        self, archives: dict[str, tuple[int, int]]
+    ) -> dict[str, list[AssetInfo]]:
+        """
+        List archives, reusing listings of archives that have not changed.
+
+        Args:
+            archives: Archive path -> (size, mtime_ns) from the directory scan.
+
+        Returns:
+            Mapping of each archive path to its list of AssetInfo.
+        """
+        inspected = {}
+        with self._listing_cache_lock:
+            for path, signature in archives.items():
+                cached = self._listing_cache.get(path)
+                if cached is not None and cached[0] == signature:
+                    self._listing_cache.move_to_end(path)
+                    inspected[path] = cached[1]
+
+        misses = [path for path in archives if path not in inspected]
+        if misses:
+            listed = self._archive_inspector.inspect_many(misses)
+            inspected.update(listed)
+            with self._listing_cache_lock:
+                for path in misses:
+                    self._listing_cache[path] = (archives[path], listed[path])
+                    self._listing_cache.move_to_end(path)
+                while len(self._listing_cache) > ARCHIVE_LISTING_CACHE_SIZE:
+                    self._listing_cache.popitem(last=False)
+        return inspected
+
+    def _is_within_root(self, path: str) -> bool:
+        """Check if a resolved path is the root directory or inside it."""
+        if self._root_prefix is None:
             return True
-        except ValueError:
-            return False
+        return os.path.normcase(os.path.join(path, "")).startswith(
+            self._root_prefix
+        )
 
-    def _get_parent_path(self, dir_path: Path) -> Optional[str]:
+    def _get_parent_path(self, dir_path: str) -> Optional[str]:
         """Get parent path, respecting root boundary."""
-        parent = dir_path.parent
+        parent = os.path.dirname(dir_path)
         if parent == dir_path:
             # We're at filesystem root
             return None
-        if self._root_path and not self._is_within_root(parent):
+        if not self._is_within_root(parent):
             return None
-        return str(parent)
-
-    def _has_visible_children(self, dir_path: Path) -> bool:
-        """Check if a directory has any visible children (non-hidden)."""
-        try:
-            for entry in dir_path.iterdir():
-                if not entry.name.startswith("."):
-                    return True
-        except PermissionError:
-            pass
-        return False
-
-    def _find_related_files(self, asset_path: Path) -> list[str]:
+        return parent
+
+    def _find_related_files(
+        self,
+        stem: str,
+        ext: str,
+        subdirs: list[os.DirEntry],
+        files_by_stem: dict[str, list[os.DirEntry]],
+        textures: list[tuple[str, os.DirEntry]],
+    ) -> list[str]:
         """
         Find related files for a 3D asset (e.g., .mtl for .obj).
 
         Looks for files with the same stem in the same directory
         that are commonly associated with the asset type.
+
+        Args:
+            stem: The asset's file name without its extension.
+            ext: The asset's lowercase extension (e.g. ".obj").
+            subdirs: The scandir entries of the folders next to the asset.
+            files_by_stem: The files next to it, keyed by lowercase stem.
+            textures: Their texture files as (lowercase name, entry),
+                      sorted by name.
         """
-        related = []
-        seen = set()
-        parent = asset_path.parent
-        stem = asset_path.stem
-        ext = asset_path.suffix.lower()
-
-        def add_related(path: Path):
-            """Add a path once, if it exists and is a file."""
-            try:
-                if path.exists() and path.is_file():
-                    s = str(path)
-                    if s not in seen:
-                        seen.add(s)
-                        related.append(s)
-            except (PermissionError, OSError):
-                pass
-
-        # Related file patterns by asset type
-        related_extensions = {
-            ".obj": [".mtl"],
-            ".fbx": [],
-        }
+        # Insertion-ordered and deduplicated in one structure
+        related: dict[str, None] = {}
+        stem_lower = stem.lower()
+        same_stem = files_by_stem.get(stem_lower, ())
+
+        def add_related(path: str):
+            """Add a path once (callers only pass existing files)."""
+            related[path] = None
+
+        def add_same_stem(rel_ext: str):
+            """Add the sibling named <stem><rel_ext> (any case), if present."""
+            for entry in same_stem:
+                if entry.name.lower().endswith(rel_ext):
+                    add_related(entry.path)
 
         # Check for known related extensions
-        for rel_ext in related_extensions.get(ext, []):
-            candidate = parent / f"{stem}{rel_ext}"
-            add_related(candidate)
+        for rel_ext in _RELATED_EXTENSIONS.get(ext, ()):
+            add_same_stem(rel_ext)
 
         # Also check for texture files with same stem
-        texture_extensions = [
-            ".png", ".jpg", ".jpeg", ".tga", ".bmp", ".tiff", ".tif", ".webp"
-        ]
-        for tex_ext in texture_extensions:
-            candidate = parent / f"{stem}{tex_ext}"
-            add_related(candidate)
+        for tex_ext in TEXTURE_EXTENSIONS:
+            add_same_stem(tex_ext)
 
         # FBX robustness: include nearby texture candidates so broken absolute
         # FBX texture paths can still be resolved by basename in the frontend.
         if ext == ".fbx":
-            texture_ext_set = set(texture_extensions)
-            texture_dir_names = {
-                "textures", "texture", "tex",
-                "maps", "map",
-                "images", "image",
-                "sourceimages", "sourceimage",
-                "materials", "material", "mat",
-            }
             max_candidates = 300
 
             # 1) Texture files in the same directory — but ONLY those whose stem
@@ -252,50 +407,68 @@ class FileBrowser:
             #    "station_99730.fbx").  We do NOT blindly include every image
             #    in the directory because unrelated files (screenshots, exports
             #    from other models) would be incorrectly auto-bound as textures.
-            try:
-                for entry in parent.iterdir():
-                    if not entry.is_file():
-                        continue
-                    if entry.suffix.lower() not in texture_ext_set:
+            #    Names sharing the prefix are contiguous in the sorted index.
+            i = bisect_left(textures, stem_lower, key=itemgetter(0))
+            while i < len(textures) and textures[i][0].startswith(stem_lower):
+                name_lower, entry = textures[i]
+                i += 1
+                # Must share the model stem as a prefix (not just the name)
+                if _split_name(name_lower)[0].startswith(stem_lower):
+                    add_related(entry.path)
+                    if len(related) >= max_candidates:
+                        return list(related)
+
+            def add_texture_tree(top: str) -> bool:
+                """Add every texture under ``top``; True once the cap is hit."""
+                # Breadth-first and at most TEXTURE_DIR_MAX_DEPTH levels
+                # deep, so a huge or deeply nested tree costs no more than
+                # the folders actually needed. The extension check (one
+                # lower() and a C-level endswith over the tuple) runs on
+                # the plain name before any stat; only regular files (or
+                # symlinks to them) are added.
+                pending = deque([(top, 0)])
+                while pending:
+                    folder, depth = pending.popleft()
+                    try:
+                        with os.scandir(folder) as it:
+                            for entry in it:
+                                if entry.is_dir(follow_symlinks=False):
+                                    if depth < TEXTURE_DIR_MAX_DEPTH:
+                                        pending.append((entry.path, depth + 1))
+                                elif (
+                                    entry.name.lower().endswith(TEXTURE_EXTENSIONS)
+                                    and entry.is_file()
+                                ):
+                                    add_related(entry.path)
+                                    if len(related) >= max_candidates:
+                                        return True
+                    except OSError:
                         continue
-                    # Must share the model stem as a prefix
-                    if entry.stem.lower().startswith(stem.lower()):
-                        add_related(entry)
-                        if len(related) >= max_candidates:
-                            return related
-            except (PermissionError, OSError):
-                pass
+                return False
 
             # 2) Texture files in common texture subdirectories.
             #    We check two patterns:
             #    a) Direct texture dirs:  <parent>/textures/, <parent>/maps/, ...
             #    b) Model-prefixed dirs:  <parent>/Station/Maps/ for station_99730.fbx
             #       (FBX files often reference "Station\Maps\tex.jpg")
-            try:
-                for entry in parent.iterdir():
-                    if not entry.is_dir():
+            for sibling in subdirs:
+                if sibling.name.lower() in _TEXTURE_DIR_NAMES:
+                    # Direct texture dir — include everything
+                    if add_texture_tree(sibling.path):
+                        return list(related)
+                else:
+                    # Check for texture subdirs inside (e.g. Station/Maps/)
+                    try:
+                        with os.scandir(sibling.path) as it:
+                            subs = [
+                                sub.path for sub in it
+                                if sub.name.lower() in _TEXTURE_DIR_NAMES
+                                and sub.is_dir()
+                            ]
+                    except (PermissionError, OSError):
                         continue
-                    ename = entry.name.lower()
-                    if ename in texture_dir_names:
-                        # Direct texture dir — include everything
-                        for f in entry.rglob("*"):
-                            if f.is_file() and f.suffix.lower() in texture_ext_set:
-                                add_related(f)
-                                if len(related) >= max_candidates:
-                                    return related
-                    else:
-                        # Check for texture subdirs inside (e.g. Station/Maps/)
-                        try:
-                            for sub in entry.iterdir():
-                                if sub.is_dir() and sub.name.lower() in texture_dir_names:
-                                    for f in sub.rglob("*"):
-                                        if f.is_file() and f.suffix.lower() in texture_ext_set:
-                                            add_related(f)
-                                            if len(related) >= max_candidates:
-                                                return related
-                        except (PermissionError, OSError):
-                            pass
-            except (PermissionError, OSError):
-                pass
-
-        return related
+                    for sub in subs:
+                        if add_texture_tree(sub):
+                            return list(related)
+
+        return list(related)
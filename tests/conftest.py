@@ -0,0 +1,24 @@
+"""
+Shared test configuration.
+
+Points MeshVault's persistent caches (archive listings, detected RAR tool)
+at a throwaway directory. This runs before any test module imports the
+backend, whose cache paths and module-level inspectors are set up at
+import time, so the suite never writes to the user's ~/.cache/meshvault.
+"""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+_CACHE_DIR = tempfile.mkdtemp(prefix="meshvault_test_cache_")
+os.environ["MESHVAULT_CACHE_DIR"] = _CACHE_DIR
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_dir():
+    """Remove the suite's cache directory once all tests have run."""
+    yield _CACHE_DIR
+    shutil.rmtree(_CACHE_DIR, ignore_errors=True)
@@ -0,0 +1,201 @@
+"""
+Tests for the FastAPI file-serving endpoints.
+
+Uses FastAPI's TestClient against real files in temporary directories.
+"""
+
+import os
+import zipfile
+import tempfile
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import app as app_module
+from backend.app import app
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the app."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def asset_dir():
+    """Create a temporary directory with a model and an archive."""
+    with tempfile.TemporaryDirectory(prefix="3d_app_test_") as tmpdir:
+        root = Path(tmpdir)
+        (root / "cube.obj").write_text("# OBJ\nv 0 0 0\n")
+        with zipfile.ZipFile(root / "pack.zip", "w") as zf:
+            zf.writestr("ship/ship.obj", "# OBJ\nv 1 1 1\n")
+            zf.writestr("ship/ship.png", "FAKE_PNG")
+        yield root
+
+
+class TestConditionalRequests:
+    """File endpoints should honor If-None-Match with 304 responses."""
+
+    def test_asset_file_returns_304_for_matching_etag(self, client, asset_dir):
+        params = {"path": str(asset_dir / "cube.obj")}
+        first = client.get("/api/asset/file", params=params)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        second = client.get(
+            "/api/asset/file", params=params, headers={"If-None-Match": etag}
+        )
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_etag_changes_when_file_changes(self, client, asset_dir):
+        model = asset_dir / "cube.obj"
+        params = {"path": str(model)}
+        etag = client.get("/api/asset/related", params=params).headers["etag"]
+
+        model.write_text("# OBJ\nv 0 0 0\nv 1 0 0\n")
+        resp = client.get(
+            "/api/asset/related", params=params, headers={"If-None-Match": etag}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
+    def test_archive_asset_returns_304_for_matching_etag(self, client, asset_dir):
+        params = {
+            "archive_path": str(asset_dir / "pack.zip"),
+            "inner_path": "ship/ship.obj",
+        }
+        first = client.get("/api/asset/archive", params=params)
+        assert first.status_code == 200
+        assert first.content == b"# OBJ\nv 1 1 1\n"
+
+        second = client.get(
+            "/api/asset/archive",
+            params=params,
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        assert second.status_code == 304
+
+
+class TestRangeRequests:
+    """Large mesh downloads should be resumable via HTTP ranges."""
+
+    def test_asset_file_serves_partial_content(self, client, asset_dir):
+        params = {"path": str(asset_dir / "cube.obj")}
+        full = client.get("/api/asset/file", params=params)
+        assert full.headers["accept-ranges"] == "bytes"
+
+        resp = client.get(
+            "/api/asset/file", params=params, headers={"Range": "bytes=2-4"}
+        )
+        assert resp.status_code == 206
+        assert resp.content == full.content[2:5]
+        assert resp.headers["content-range"] == f"bytes 2-4/{len(full.content)}"
+
+
+class TestArchiveAsset:
+    """Archive members are streamed, falling back to extraction."""
+
+    def test_unstreamable_member_is_extracted(self, client, asset_dir, monkeypatch):
+        def corrupt(archive_path, inner_path):
+            raise zipfile.BadZipFile("Bad CRC-32")
+
+        monkeypatch.setattr(app_module.archive_inspector, "open_member", corrupt)
+        try:
+            resp = client.get("/api/asset/archive", params={
+                "archive_path": str(asset_dir / "pack.zip"),
+                "inner_path": "ship/ship.obj",
+            })
+        finally:
+            app_module.archive_inspector.cleanup()
+        assert resp.status_code == 200
+        assert resp.content == b"# OBJ\nv 1 1 1\n"
+
+    def test_streaming_bugs_are_not_swallowed(self, client, asset_dir, monkeypatch):
+        def broken(archive_path, inner_path):
+            raise TypeError("bug")
+
+        monkeypatch.setattr(app_module.archive_inspector, "open_member", broken)
+        with pytest.raises(TypeError):
+            client.get("/api/asset/archive", params={
+                "archive_path": str(asset_dir / "pack.zip"),
+                "inner_path": "ship/ship.obj",
+            })
+
+
+class TestBrowse:
+    """The browse endpoint serializes the listing dataclasses directly."""
+
+    def test_listing_fields(self, client, asset_dir, monkeypatch):
+        bodies = []
+        for has_orjson in (app_module.HAS_ORJSON, False):
+            monkeypatch.setattr(app_module, "HAS_ORJSON", has_orjson)
+            (asset_dir / f"touch_{has_orjson}").mkdir()  # new mtime, no cached listing
+            resp = client.get("/api/browse", params={"path": str(asset_dir)})
+            assert resp.status_code == 200
+            bodies.append(resp.json())
+
+        body = bodies[1]
+        assert set(body) == {"current_path", "parent_path", "folders", "assets"}
+        cube = next(a for a in body["assets"] if a["name"] == "cube")
+        assert cube == {
+            "name": "cube",
+            "path": str((asset_dir / "cube.obj").resolve()),
+            "extension": ".obj",
+            "size": (asset_dir / "cube.obj").stat().st_size,
+            "is_in_archive": False,
+            "archive_path": None,
+            "inner_path": None,
+            "related_files": [],
+        }
+        assert bodies[0]["assets"] == body["assets"]
+
+    def test_missing_path_is_404(self, client, tmp_path):
+        resp = client.get("/api/browse", params={"path": str(tmp_path / "gone")})
+        assert resp.status_code == 404
+
+    def test_unreadable_path_is_403(self, client, tmp_path, monkeypatch):
+        real_stat = os.stat
+
+        def stat(path, *args, **kwargs):
+            if str(path) == str(tmp_path):
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr(app_module.os, "stat", stat)
+        resp = client.get("/api/browse", params={"path": str(tmp_path)})
+        assert resp.status_code == 403
+
+
+class TestFbxCache:
+    """Memoized FBX probes are bounded like the browse cache."""
+
+    def test_fbx_caches_evict_least_recently_used(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(app_module, "FBX_CACHE_MAXSIZE", 2)
+        app_module.clear_fbx_cache()
+        paths = []
+        for name in ("a", "b", "c"):
+            fbx = tmp_path / f"{name}.fbx"
+            fbx.write_bytes(b"not an fbx")
+            paths.append(fbx)
+
+        try:
+            for fbx in paths[:2] + paths[:1] + paths[2:]:
+                assert app_module._maybe_convert_fbx(fbx) == (fbx, ".fbx")
+            assert [key[0] for key in app_module._fbx_cache] == [
+                str(paths[0]), str(paths[2])
+            ]
+            assert len(app_module._fbx_version_cache) == 2
+        finally:
+            app_module.clear_fbx_cache()
+
+
+class TestDefaultPath:
+    """The default browse path endpoint."""
+
+    def test_returns_home_directory(self, client):
+        resp = client.get("/api/default_path")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == {"path": str(Path.home())}
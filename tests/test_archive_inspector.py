@@ -0,0 +1,256 @@
+"""
+Tests for the ArchiveInspector component.
+
+Covers related-file discovery inside archive listings and the
+persistent inspection cache.
+"""
+
+import io
+import os
+import tarfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from backend import archive_inspector
+from backend.archive_inspector import ArchiveInspector, _list_zip_members
+
+
+def find_related(asset_name, all_names):
+    _, candidates = ArchiveInspector._classify_members(
+        (name, 0) for name in all_names
+    )
+    index = ArchiveInspector._build_related_index(candidates)
+    return ArchiveInspector._find_related_indexed(asset_name, index)
+
+
+class TestRelatedFiles:
+    """Related-file discovery from an archive's file list."""
+
+    def test_same_directory_and_texture_folder(self):
+        names = [
+            "ship/ship.obj",
+            "ship/ship.mtl",
+            "ship/textures/hull.png",
+            "other/rock.png",
+        ]
+        assert find_related("ship/ship.obj", names) == [
+            "ship/ship.mtl",
+            "ship/textures/hull.png",
+        ]
+
+    def test_stem_match_is_token_strict(self):
+        names = [
+            "models/asteroid_1.obj",
+            "images/asteroid_1_diffuse.png",
+            "images/asteroid_10_diffuse.png",
+            "images/asteroid_1.jpg",
+        ]
+        assert find_related("models/asteroid_1.obj", names) == [
+            "images/asteroid_1_diffuse.png",
+            "images/asteroid_1.jpg",
+        ]
+
+    def test_fallback_to_shared_texture_folders(self):
+        names = ["models/a.obj", "pack/sourceimages/wood.png", "misc/readme.png"]
+        assert find_related("models/a.obj", names) == [
+            "pack/sourceimages/wood.png",
+        ]
+
+    def test_fbx_falls_back_to_image_pool(self):
+        names = ["models/a.fbx", "misc/wood.png", "misc/wood.mtl"]
+        assert find_related("models/a.fbx", names) == ["misc/wood.png"]
+        assert find_related("models/a.obj", names) == []
+
+
+class TestZipListing:
+    """Central-directory listing matches zipfile's view of the archive."""
+
+    def test_names_and_sizes_match_zipfile(self, tmp_path):
+        archive = tmp_path / "pack.zip"
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("ship/", "")
+            zf.writestr("ship/ship.obj", "v 0 0 0\n" * 100)
+            zf.writestr("ship/textures/hüll.png", b"\x89PNG" * 10)
+            zf.comment = b"pack comment"
+        # Data prepended to the archive, like a self-extractor stub
+        sfx = tmp_path / "pack.exe"
+        sfx.write_bytes(b"MZ" * 512 + archive.read_bytes())
+
+        for path in (archive, sfx):
+            with zipfile.ZipFile(path) as zf:
+                expected = [(i.filename, i.file_size) for i in zf.infolist()]
+            assert _list_zip_members(str(path)) == expected
+
+    def test_unreadable_archive_falls_back(self, tmp_path):
+        broken = tmp_path / "broken.zip"
+        broken.write_bytes(b"not a zip")
+        assert _list_zip_members(str(broken)) is None
+
+
+class TestInspectionCache:
+    """Archive listings persist across inspector instances."""
+
+    def test_listing_reused_until_archive_changes(self, tmp_path):
+        archive = tmp_path / "pack.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("ship/ship.obj", "v 0 0 0\n")
+            zf.writestr("ship/ship.mtl", "newmtl a\n")
+        cache_path = str(tmp_path / "cache" / "inspect.sqlite3")
+
+        first = ArchiveInspector(cache_path=cache_path).inspect(str(archive))
+        second = ArchiveInspector(cache_path=cache_path)
+        assert second._load_cached_listing(str(archive), archive.stat()) == first
+        assert second.inspect(str(archive)) == first
+        assert second._load_cached_listings([str(archive)]) == {
+            str(archive): first
+        }
+
+        with zipfile.ZipFile(archive, "a") as zf:
+            zf.writestr("rock.stl", "solid rock\n")
+        assert second._load_cached_listings([str(archive)]) == {}
+        assert len(second.inspect(str(archive))) == 2
+
+    def test_cache_forgets_deleted_archives_and_caps_rows(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(archive_inspector, "INSPECT_CACHE_MAX_ROWS", 2)
+        cache_path = str(tmp_path / "inspect.sqlite3")
+        inspector = ArchiveInspector(cache_path=cache_path)
+        archives = []
+        for name in ("a", "b", "c"):
+            archive = tmp_path / f"{name}.zip"
+            with zipfile.ZipFile(archive, "w") as zf:
+                zf.writestr(f"{name}.obj", "v 0 0 0\n")
+            inspector.inspect(str(archive))
+            archives.append(str(archive))
+
+        def cached_paths(conn):
+            return [row[0] for row in conn.execute(
+                "SELECT path FROM archive_cache ORDER BY rowid"
+            )]
+
+        assert cached_paths(inspector._disk_cache) == archives[1:]
+
+        # Opening the cache doesn't sweep it; looking a missing archive up
+        # forgets its listing
+        os.remove(archives[1])
+        reopened = ArchiveInspector(cache_path=cache_path)
+        assert cached_paths(reopened._disk_cache) == archives[1:]
+        assert reopened.inspect(archives[1]) == []
+        assert cached_paths(reopened._disk_cache) == archives[2:]
+
+
+class TestInspectMany:
+    """Batch inspection of several archives."""
+
+    def test_results_keyed_by_archive_in_order(self, tmp_path):
+        paths = []
+        for name in ("b.zip", "a.zip"):
+            archive = tmp_path / name
+            with zipfile.ZipFile(archive, "w") as zf:
+                zf.writestr(f"{archive.stem}.obj", "v 0 0 0\n")
+            paths.append(str(archive))
+        inspector = ArchiveInspector(cache_path=str(tmp_path / "inspect.sqlite3"))
+
+        results = inspector.inspect_many(paths + paths[:1])
+        assert list(results) == paths
+        assert [a.inner_path for a in results[paths[0]]] == ["b.obj"]
+        assert [a.inner_path for a in results[paths[1]]] == ["a.obj"]
+
+
+class TestAssetEntry:
+    """Inner-path lookups of archive assets."""
+
+    def test_lookups_keep_only_recent_archives(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(archive_inspector, "TOC_CACHE_SIZE", 2)
+        inspector = ArchiveInspector(cache_path=None)
+        paths = []
+        for name in ("a", "b", "c"):
+            archive = tmp_path / f"{name}.zip"
+            with zipfile.ZipFile(archive, "w") as zf:
+                zf.writestr(f"{name}.obj", "v 0 0 0\n")
+            paths.append(str(archive))
+
+        for path in paths[:2] + paths[:1] + paths[2:]:
+            name = os.path.basename(path)[0]
+            assert inspector.get_asset_entry(path, f"{name}.obj").name == name
+        assert inspector.get_asset_entry(paths[0], "missing.obj") is None
+        assert list(inspector._toc_cache) == [paths[2], paths[0]]
+
+
+class TestArchiveHandles:
+    """Shared archive handles are opened outside the global lock."""
+
+    def test_concurrent_opens_keep_one_handle(self, tmp_path):
+        archive = tmp_path / "pack.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("a.obj", "v 0 0 0\n")
+        barrier = threading.Barrier(4)
+        opened = []
+
+        def opener(path):
+            barrier.wait(timeout=5)  # every thread is opening at once
+            handle = zipfile.ZipFile(path)
+            opened.append(handle)
+            return handle
+
+        try:
+            with ThreadPoolExecutor(4) as pool:
+                results = list(pool.map(
+                    lambda _: archive_inspector._open_cached(str(archive), opener),
+                    range(4),
+                ))
+            kept = results[0][0]
+            assert all(handle is kept for handle, _ in results)
+            assert len(opened) == 4
+            assert [h.fp is None for h in opened].count(False) == 1
+        finally:
+            archive_inspector.close_archive_handles(str(archive))
+
+    def test_eviction_waits_for_the_handle_lock(self, tmp_path):
+        archive = tmp_path / "pack.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("a.obj", "v 0 0 0\n")
+        zf, lock = archive_inspector.open_zip(str(archive))
+
+        with lock:
+            closer = threading.Thread(
+                target=archive_inspector.close_archive_handles,
+                args=(str(archive),),
+            )
+            closer.start()
+            closer.join(timeout=0.2)
+            assert closer.is_alive()
+            assert zf.read("a.obj") == b"v 0 0 0\n"
+        closer.join(timeout=5)
+        assert zf.fp is None
+
+
+class TestUnitypackageIndex:
+    """Unitypackage header indexes are shared between inspectors."""
+
+    def test_extract_reuses_index_from_another_inspector(self, tmp_path, monkeypatch):
+        archive = tmp_path / "pack.unitypackage"
+        with tarfile.open(archive, "w:gz") as tar:
+            for name, data in (
+                ("0a1b/pathname", b"Assets/Ship/ship.obj"),
+                ("0a1b/asset", b"v 0 0 0\n"),
+            ):
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+
+        browser = ArchiveInspector(cache_path=None)
+        extractor = ArchiveInspector(cache_path=None)
+        try:
+            [asset] = browser.inspect(str(archive))
+
+            def no_rescan(*args, **kwargs):
+                raise AssertionError("unitypackage headers scanned again")
+
+            monkeypatch.setattr(tarfile, "open", no_rescan)
+            extracted = extractor.extract_asset(str(archive), asset.inner_path)
+            with open(extracted, "rb") as f:
+                assert f.read() == b"v 0 0 0\n"
+        finally:
+            browser.cleanup()
+            extractor.cleanup()
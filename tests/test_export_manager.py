@@ -0,0 +1,40 @@
+"""
+Tests for the ExportManager component.
+
+Exports real files between temporary directories.
+"""
+
+from pathlib import Path
+
+from backend.export_manager import ExportManager
+
+
+class TestExportFromFilesystem:
+    """Exporting an asset and its related files from disk."""
+
+    def test_related_files_sharing_a_basename_get_distinct_names(self, tmp_path):
+        src_dir = tmp_path / "src"
+        files = {}
+        for rel in ("ship.obj", "x/a.png", "y/b.png", "z/b.png"):
+            path = src_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(rel)
+            files[rel] = str(path)
+        target = tmp_path / "out"
+        target.mkdir()
+
+        result = ExportManager().export_asset(
+            source_path=files["ship.obj"],
+            target_dir=str(target),
+            new_name="hero",
+            related_files=[files["x/a.png"], files["y/b.png"], files["z/b.png"]],
+        )
+
+        assert result.success
+        exported = [Path(p) for p in result.files_exported]
+        assert [p.name for p in exported] == [
+            "hero.obj", "hero.png", "b.png", "b_1.png"
+        ]
+        assert [p.read_text() for p in exported] == [
+            "ship.obj", "x/a.png", "y/b.png", "z/b.png"
+        ]
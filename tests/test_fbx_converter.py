@@ -0,0 +1,149 @@
+"""
+Tests for the FBX 6100 → OBJ converter.
+
+Builds small binary and ASCII FBX files and checks the generated OBJ text.
+"""
+
+import io
+import struct
+
+import numpy as np
+
+from backend import fbx_converter
+from backend.fbx_converter import (
+    FBX_MAGIC,
+    convert_fbx_to_obj,
+    convert_fbx_to_obj_batch,
+)
+
+
+def _array(type_code, fmt, values):
+    raw = struct.pack(f"<{len(values)}{fmt}", *values)
+    return type_code + struct.pack("<III", len(values), 0, len(raw)) + raw
+
+
+def _node(name, props, children, offset):
+    """Encode a 32-bit-offset node record starting at ``offset``."""
+    name = name.encode()
+    num_props = len(props)
+    props = b"".join(props)
+    body = b""
+    pos = offset + 13 + len(name) + len(props)
+    for child in children:
+        body += child(pos + len(body))
+    if children:
+        body += b"\x00" * 13
+    end = offset + 13 + len(name) + len(props) + len(body)
+    return struct.pack("<IIIB", end, num_props, len(props), len(name)) + name + props + body
+
+
+def _write_binary_fbx(path, vertices, indices, normals=None, uvs=None, uv_indices=None):
+    def node(name, props=(), children=()):
+        return lambda offset: _node(name, list(props), list(children), offset)
+
+    children = [
+        node("Vertices", [_array(b"d", "d", vertices)]),
+        node("PolygonVertexIndex", [_array(b"i", "i", indices)]),
+    ]
+    if normals is not None:
+        children.append(node("LayerElementNormal", [], [
+            node("Normals", [_array(b"d", "d", normals)]),
+        ]))
+    if uvs is not None:
+        children.append(node("LayerElementUV", [], [
+            node("UV", [_array(b"d", "d", uvs)]),
+            node("UVIndex", [_array(b"i", "i", uv_indices)]),
+        ]))
+    objects = node("Objects", [], [node("Geometry", [], children)])
+
+    header = FBX_MAGIC + b"\x1a\x00" + struct.pack("<I", 6100)
+    body = objects(len(header)) + b"\x00" * 13
+    path.write_bytes(header + body)
+
+
+def _faces(obj_path):
+    return [line for line in obj_path.read_text().splitlines() if line.startswith("f ")]
+
+
+QUAD = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0]
+
+
+class TestBinaryConversion:
+    """Binary FBX geometry is written as OBJ vertices and faces."""
+
+    def test_vertices_and_faces(self, tmp_path):
+        fbx = tmp_path / "quad.fbx"
+        _write_binary_fbx(fbx, QUAD, [0, 1, ~2, 0, 2, ~3])
+        obj = tmp_path / "quad.obj"
+
+        assert convert_fbx_to_obj(str(fbx), str(obj))
+        text = obj.read_text()
+        assert "v 1.000000 1.000000 0.000000\n" in text
+        assert _faces(obj) == ["f 1 2 3", "f 1 3 4"]
+
+    def test_uv_indices_follow_polygon_corners(self, tmp_path):
+        fbx = tmp_path / "quad.fbx"
+        _write_binary_fbx(
+            fbx, QUAD, [0, 1, 2, ~3],
+            normals=[0.0, 0.0, 1.0] * 4,
+            uvs=[0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0],
+            uv_indices=[3, 2, 1, 0],
+        )
+        obj = tmp_path / "quad.obj"
+
+        assert convert_fbx_to_obj(str(fbx), str(obj))
+        assert _faces(obj) == ["f 1/4/1 2/3/2 3/2/3 4/1/4"]
+
+    def test_batch_matches_single_conversion(self, tmp_path):
+        pairs = []
+        for i in range(3):
+            fbx = tmp_path / f"mesh_{i}.fbx"
+            _write_binary_fbx(fbx, QUAD, [0, 1, ~(i + 1)])
+            pairs.append((str(fbx), str(tmp_path / f"mesh_{i}.obj")))
+        pairs.append((str(tmp_path / "missing.fbx"), str(tmp_path / "missing.obj")))
+
+        assert convert_fbx_to_obj_batch(pairs) == [True, True, True, False]
+        assert _faces(tmp_path / "mesh_2.obj") == ["f 1 2 4"]
+
+
+class TestAsciiConversion:
+    """ASCII FBX 6.x geometry blocks are converted like binary ones."""
+
+    def test_faces_past_the_normals_have_no_normal(self, tmp_path):
+        fbx = tmp_path / "tri.fbx"
+        fbx.write_text(
+            "; FBX 6.1.0 project file\n"
+            "Objects:  {\n"
+            '\tModel: "Model::tri", "Mesh" {\n'
+            "\t\tVertices: 0,0,0,1,0,0,1,1,0,0,1,0\n"
+            "\t\tPolygonVertexIndex: 0,1,-3,0,2,-4\n"
+            "\t\tNormals: 0,0,1,0,0,1,0,0,1,0,0,1\n"
+            "\t\tGeometryVersion: 124\n"
+            "\t}\n"
+            "}\n"
+        )
+        obj = tmp_path / "tri.obj"
+
+        assert convert_fbx_to_obj(str(fbx), str(obj))
+        assert "v 1.0 1.0 0.0\n" in obj.read_text()
+        assert _faces(obj) == ["f 1//1 2//2 3//3", "f 1//4 3 4"]
+
+
+class TestFaceWriter:
+    """The Numba kernel and the numpy fallback render identical faces."""
+
+    def test_kernel_matches_fallback(self, monkeypatch):
+        indices = np.array([0, 11, ~2, 3, 4, 120, ~5, 6, 7, ~8, 9], dtype=np.int32)
+        uv_indices = np.array([1, 2, 3, 4, 5], dtype=np.int32)
+        modes = [{}, {"normal_offset": 7}, {"normal_offset": 7, "uv_indices": uv_indices, "uv_offset": 95}]
+
+        for mode in modes:
+            outputs = []
+            for has_numba in (fbx_converter.HAS_NUMBA, False):
+                monkeypatch.setattr(fbx_converter, "HAS_NUMBA", has_numba)
+                buf = io.BytesIO()
+                assert fbx_converter._write_faces(buf, indices, 9, **mode) == 3
+                outputs.append(buf.getvalue())
+            assert outputs[0] == outputs[1]
+
+        assert outputs[1].splitlines()[0] == b"f 10/97/8 21/98/9 12/99/10"
@@ -117,6 +117,27 @@ class TestFileBrowser:
         assert spaceship.extension == ".obj"
         assert spaceship.archive_path is not None
 
+    def test_unchanged_archives_are_not_relisted(self, browser, temp_asset_dir, monkeypatch):
+        """Repeat browses reuse an archive's listing until the archive changes."""
+        inspector = browser._archive_inspector
+        calls = []
+        inspect_many = inspector.inspect_many
+        monkeypatch.setattr(
+            inspector, "inspect_many",
+            lambda paths: calls.append(list(paths)) or inspect_many(paths),
+        )
+
+        first = browser.browse(temp_asset_dir)
+        second = browser.browse(temp_asset_dir)
+        assert len(calls) == 1
+        assert [a.name for a in second.assets] == [a.name for a in first.assets]
+
+        with zipfile.ZipFile(Path(temp_asset_dir) / "archive.zip", "a") as zf:
+            zf.writestr("pack/rock.obj", "v 0 0 0\n")
+        third = browser.browse(temp_asset_dir)
+        assert len(calls) == 2
+        assert "rock" in [a.name for a in third.assets]
+
     def test_browse_returns_parent_path(self, browser, temp_asset_dir):
         """Browse result should include parent path for navigation."""
         models_dir = os.path.join(temp_asset_dir, "models")
@@ -155,6 +176,19 @@ class TestFileBrowser:
         )
         assert empty_folder.has_children is False
 
+    def test_has_children_refreshes_when_folder_changes(self, browser, temp_asset_dir):
+        """A cached has_children answer is dropped once the folder's mtime moves."""
+        empty = Path(temp_asset_dir) / "empty_folder"
+        assert not next(f for f in browser.browse(temp_asset_dir).folders
+                        if f.name == "empty_folder").has_children
+
+        (empty / "new.obj").write_text("v 0 0 0\n")
+        mtime_ns = empty.stat().st_mtime_ns + 1_000_000_000
+        os.utime(empty, ns=(mtime_ns, mtime_ns))
+
+        assert next(f for f in browser.browse(temp_asset_dir).folders
+                    if f.name == "empty_folder").has_children
+
 
 class TestFileBrowserRootConstraint:
     """Tests for FileBrowser with root path constraint."""
@@ -171,8 +205,75 @@ class TestFileBrowserRootConstraint:
         with pytest.raises(ValueError):
             browser.browse("/tmp")
 
+    def test_root_is_a_path_prefix_not_a_string_prefix(self, tmp_path):
+        """A sibling whose name extends the root's name is still outside it."""
+        (tmp_path / "assets").mkdir()
+        (tmp_path / "assets2").mkdir()
+        browser = FileBrowser(root_path=str(tmp_path / "assets"))
+
+        assert browser.browse(str(tmp_path / "assets")).parent_path is None
+        with pytest.raises(ValueError):
+            browser.browse(str(tmp_path / "assets2"))
+
     def test_root_limits_parent_navigation(self, temp_asset_dir):
         """Parent path should be None when at root boundary."""
         browser = FileBrowser(root_path=temp_asset_dir)
         result = browser.browse(temp_asset_dir)
         assert result.parent_path is None
+
+
+class TestRelatedFileDiscovery:
+    """Related files are matched against the directory listing."""
+
+    def test_related_files_match_stem_case_insensitively(self, browser, tmp_path):
+        (tmp_path / "crate.obj").write_text("v 0 0 0\n")
+        (tmp_path / "Crate.MTL").write_text("newmtl a\n")
+        (tmp_path / "crate.png").write_bytes(b"png")
+        (tmp_path / "crate_old.png").write_bytes(b"png")
+
+        crate = next(a for a in browser.browse(str(tmp_path)).assets if a.name == "crate")
+        assert [Path(p).name for p in crate.related_files] == ["Crate.MTL", "crate.png"]
+
+    def test_fbx_picks_up_prefixed_textures(self, browser, tmp_path):
+        (tmp_path / "ship.fbx").write_bytes(b"\x00" * 10)
+        (tmp_path / "ship_diffuse.png").write_bytes(b"png")
+        (tmp_path / "other.png").write_bytes(b"png")
+        (tmp_path / "textures").mkdir()
+        (tmp_path / "textures" / "hull.jpg").write_bytes(b"jpg")
+
+        ship = next(a for a in browser.browse(str(tmp_path)).assets if a.name == "ship")
+        assert [Path(p).name for p in ship.related_files] == ["ship_diffuse.png", "hull.jpg"]
+
+    def test_fbx_walks_nested_texture_dirs(self, browser, tmp_path):
+        (tmp_path / "station.fbx").write_bytes(b"\x00" * 10)
+        maps = tmp_path / "Station" / "Maps" / "hull"
+        maps.mkdir(parents=True)
+        (maps / "plate.TGA").write_bytes(b"tga")
+        (maps / "notes.txt").write_text("not a texture")
+
+        station = next(a for a in browser.browse(str(tmp_path)).assets if a.name == "station")
+        assert station.related_files == [str(maps / "plate.TGA")]
+
+    def test_fbx_texture_search_depth_is_bounded(self, browser, tmp_path):
+        (tmp_path / "ship.fbx").write_bytes(b"\x00" * 10)
+        folder = tmp_path / "textures"
+        for level in range(6):
+            folder.mkdir()
+            (folder / f"level{level}.png").write_bytes(b"png")
+            folder = folder / "deeper"
+
+        ship = next(a for a in browser.browse(str(tmp_path)).assets if a.name == "ship")
+        assert [Path(p).name for p in ship.related_files] == [
+            f"level{level}.png" for level in range(5)
+        ]
+
+    def test_texture_dirs_skip_links_that_are_not_files(self, browser, tmp_path):
+        (tmp_path / "ship.fbx").write_bytes(b"\x00" * 10)
+        textures = tmp_path / "textures"
+        (textures / "real").mkdir(parents=True)
+        (textures / "hull.png").write_bytes(b"png")
+        (textures / "folder.png").symlink_to(textures / "real", target_is_directory=True)
+        (textures / "dangling.png").symlink_to(tmp_path / "missing.png")
+
+        ship = next(a for a in browser.browse(str(tmp_path)).assets if a.name == "ship")
+        assert [Path(p).name for p in ship.related_files] == ["hull.png"]
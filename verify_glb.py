@@ -9,7 +9,7 @@ Example:
     python3 verify_glb.py untracked/aaa.glb untracked/uploads_files_775776_asteroid_pack_2.zip \
         asteroid_pack_2/projectFiles/sourceimages/Asteroid_1/asteroid_1_baseColor.tga
 """
-import struct, json, io, sys, zipfile
+import struct, json, io, mmap, sys, zipfile
 import numpy as np
 from PIL import Image
 
@@ -24,31 +24,33 @@ tga_inner = sys.argv[3]
 # Load original TGA
 with zipfile.ZipFile(zip_path) as zf:
     tga_data = zf.read(tga_inner)
-tga_pil = Image.open(io.BytesIO(tga_data)).convert('RGB')
-tga_arr = np.array(tga_pil)
 
-# Parse GLB
-with open(glb_path, 'rb') as f:
-    f.read(12)
-    jlen = struct.unpack('<I', f.read(4))[0]; f.read(4)
-    doc = json.loads(f.read(jlen))
-    blen = struct.unpack('<I', f.read(4))[0]; f.read(4)
-    b = f.read(blen)
+# Parse GLB: map the file and slice out only the JSON chunk and the image
+# payload, so the (possibly large) binary chunk is never copied as a whole
+with open(glb_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    jlen = struct.unpack_from('<I', mm, 12)[0]
+    doc = json.loads(mm[20:20+jlen])
+    bin_off = 20 + jlen + 8
 
-bvs = doc['bufferViews']
-img_meta = doc['images'][0]
-bv = bvs[img_meta['bufferView']]
-off = bv.get('byteOffset', 0)
-data = b[off:off+bv['byteLength']]
-glb_pil = Image.open(io.BytesIO(data)).convert('RGB')
-glb_arr = np.array(glb_pil)
+    bvs = doc['bufferViews']
+    img_meta = doc['images'][0]
+    bv = bvs[img_meta['bufferView']]
+    off = bin_off + bv.get('byteOffset', 0)
+    data = mm[off:off+bv['byteLength']]
 
-# Compare
-diff_direct = np.abs(tga_arr.astype(float) - glb_arr.astype(float)).mean()
-diff_flipped = np.abs(tga_arr[::-1].astype(float) - glb_arr.astype(float)).mean()
-
-print(f'Direct diff:  {diff_direct:.4f}')
-print(f'Flipped diff: {diff_flipped:.4f}')
+# Compare; a byte-identical embedded image needs no decode or pixel diff
+if tga_data == data:
+    print('Embedded image is byte-identical to the original TGA')
+    diff_direct = 0.0
+else:
+    tga_pil = Image.open(io.BytesIO(tga_data)).convert('RGB')
+    glb_pil = Image.open(io.BytesIO(data)).convert('RGB')
+    tga_arr = np.array(tga_pil)
+    glb_arr = np.array(glb_pil)
+    diff_direct = np.abs(tga_arr.astype(float) - glb_arr.astype(float)).mean()
+    diff_flipped = np.abs(tga_arr[::-1].astype(float) - glb_arr.astype(float)).mean()
+    print(f'Direct diff:  {diff_direct:.4f}')
+    print(f'Flipped diff: {diff_flipped:.4f}')
 print()
 
 if diff_direct < 2.0: